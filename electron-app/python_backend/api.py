@@ -11,8 +11,9 @@ import tempfile
 # Add paths for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Also add python/app directory for legacy modules
-python_app_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))), 'python', 'app')
+# Also add the local app's python/app directory for legacy modules
+repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+python_app_path = os.path.join(repo_root, 'local app', 'python', 'app')
 if os.path.exists(python_app_path):
     sys.path.insert(0, python_app_path)
 
@@ -62,17 +63,15 @@ class CardanoAPI:
     def sign_message(message: str, skey_path: str) -> Dict[str, Any]:
         """Sign a message with private key"""
         try:
-            # Try to use legacy module if available
-            try:
-                from modules.end_user.offline_signing_dialog import OfflineSigningDialog
-                signer = OfflineSigningDialog(None)
-                signature = signer.sign_message_with_key(message, skey_path)
-            except:
-                # Fallback: simple signing
-                with open(skey_path, 'r') as f:
-                    import json as json_lib
-                    key_data = json_lib.load(f)
-                    signature = key_data.get('cborHex', '')
+            # Legacy key store: the .skey is parsed once and reused until it changes
+            from utils.key_store import KeyStore
+            signer = KeyStore.shared().get(skey_path)
+            if not signer:
+                return {
+                    "success": False,
+                    "error": f"Unsupported or unreadable signing key: {skey_path}"
+                }
+            signature = signer.sign_hex(message)
             
             return {
                 "success": True,
@@ -14,9 +14,11 @@ sys.path.insert(0, os.path.dirname(__file__))
 
 from modules.end_user.key_generator import KeyGenerator
 from utils.bip39 import BIP39
+from utils.multi_address_generator import MultiAddressGenerator
+from utils.derivation_pool import normalize_chains
 
 
-def generate_new_keypair(wallet_path, account_index=0, address_count=5):
+def generate_new_keypair(wallet_path, account_index=0, address_count=5, workers=1):
     """Generate new keypair"""
     print("[*] Generating new mnemonic...")
     
@@ -26,15 +28,16 @@ def generate_new_keypair(wallet_path, account_index=0, address_count=5):
     print(f"✓ Generated mnemonic: {mnemonic}")
     print()
     
-    return generate_from_mnemonic(mnemonic, wallet_path, account_index, address_count)
+    return generate_from_mnemonic(mnemonic, wallet_path, account_index, address_count, workers)
 
 
-def generate_from_mnemonic(mnemonic, wallet_path, account_index=0, address_count=5):
+def generate_from_mnemonic(mnemonic, wallet_path, account_index=0, address_count=5, workers=1):
     """Generate from existing mnemonic"""
     print(f"[*] Generating from mnemonic...")
     print(f"    Wallet path: {wallet_path}")
     print(f"    Account: {account_index}")
     print(f"    Address count: {address_count}")
+    print(f"    Workers: {workers}")
     print()
     
     # Create wallet directory
@@ -47,7 +50,8 @@ def generate_from_mnemonic(mnemonic, wallet_path, account_index=0, address_count
             mnemonic=mnemonic,
             account_index=account_index,
             address_count=address_count,
-            is_external=True
+            is_external=True,
+            workers=workers
         )
         
         if result:
@@ -83,6 +87,115 @@ def generate_from_mnemonic(mnemonic, wallet_path, account_index=0, address_count
         return None
 
 
+def parse_accounts(spec):
+    """Parse account list such as "0-9" or "0,2,5-7" (ValueError if malformed)"""
+    accounts = []
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            start, end = part.split('-', 1)
+        else:
+            start = end = part
+        if not start.strip().isdigit() or not end.strip().isdigit():
+            raise ValueError(f"'{part}' is not a non-negative index or range")
+        start, end = int(start), int(end)
+        if end < start:
+            raise ValueError(f"range '{part}' is reversed")
+        accounts.extend(range(start, end + 1))
+    if not accounts:
+        raise ValueError("no account indices given")
+    return accounts
+
+
+def generate_accounts_from_mnemonic(mnemonic, wallet_path, accounts, address_count=5,
+                                    chains=None, workers=1):
+    """Generate addresses for several accounts, streamed to accounts.jsonl"""
+    print(f"[*] Generating accounts from mnemonic...")
+    print(f"    Wallet path: {wallet_path}")
+    print(f"    Accounts: {len(accounts)} ({accounts[0]}..{accounts[-1]})")
+    print(f"    Addresses per chain: {address_count}")
+    print()
+    
+    os.makedirs(wallet_path, exist_ok=True)
+    
+    kg = KeyGenerator(wallet_path, network="mainnet")
+    result = kg.generate_accounts(mnemonic, accounts, address_count, chains, workers=workers)
+    
+    if not result:
+        print("✗ Failed to generate accounts")
+        return None
+    
+    print()
+    print(f"✓ {result['accounts']} accounts saved to: {result['output_file']}")
+    if result['failed']:
+        print(f"⚠️  {result['failed']} accounts failed")
+    return result
+
+
+def discover_from_mnemonic(mnemonic, wallet_path, account_index=0, gap_limit=20, workers=1):
+    """Discover used addresses of an existing wallet"""
+    print(f"[*] Discovering used addresses...")
+    print(f"    Wallet path: {wallet_path}")
+    print(f"    Account: {account_index}")
+    print(f"    Gap limit: {gap_limit}")
+    print()
+    
+    os.makedirs(wallet_path, exist_ok=True)
+    
+    kg = KeyGenerator(wallet_path, network="mainnet")
+    result = kg.discover_addresses(mnemonic, account_index, gap_limit, workers=workers)
+    
+    if not result:
+        print("✗ Failed to discover addresses")
+        return None
+    
+    print()
+    print(f"Stake Address: {result.get('stake_address', 'N/A')}")
+    for chain in ("external", "internal"):
+        print(f"Used {chain} addresses ({len(result[chain])} of {result['scanned'][chain]} scanned):")
+        for addr_info in result[chain]:
+            print(f"  [{addr_info['index']}] {addr_info['address']}")
+    
+    result_file = os.path.join(wallet_path, 'discovered.json')
+    with open(result_file, 'w') as f:
+        json.dump(result, f, indent=2)
+    print()
+    print(f"✓ Saved to: {result_file}")
+    
+    return result
+
+
+def bulk_from_file(mnemonic_file, wallet_path, account_index=0, address_count=1,
+                   workers=1, resume=True):
+    """Derive addresses for every mnemonic in a file, streamed to wallets.jsonl"""
+    print(f"[*] Bulk generating wallets from file...")
+    print(f"    Mnemonic file: {mnemonic_file}")
+    print(f"    Wallet path: {wallet_path}")
+    print(f"    Addresses per wallet: {address_count}")
+    print(f"    Workers: {workers}")
+    print()
+    
+    os.makedirs(wallet_path, exist_ok=True)
+    
+    generator = MultiAddressGenerator(wallet_path, network="mainnet")
+    result = generator.generate_from_file(mnemonic_file, account_index, address_count,
+                                          workers=workers, resume=resume)
+    
+    if not result:
+        print("✗ Bulk generation failed")
+        return None
+    
+    print()
+    print(f"✓ {result['succeeded']} wallets saved to: {result['output_file']}")
+    if result['skipped']:
+        print(f"    {result['skipped']} already done (resumed)")
+    if result['failed']:
+        print(f"⚠️  {result['failed']} mnemonics failed")
+    return result
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Cardano Key Generator CLI",
@@ -97,6 +210,18 @@ Examples:
   
   # Generate 10 addresses
   python keygen.py --new --path ~/cardano_wallet --count 10
+  
+  # Generate 1000 addresses on 4 worker processes
+  python keygen.py --mnemonic "..." --path ~/cardano_wallet --count 1000 --workers 4
+  
+  # Accounts 0..9, external and internal chains, to accounts.jsonl
+  python keygen.py --mnemonic "..." --path ~/cardano_wallet --accounts 0-9 --chains external,internal
+  
+  # Find used addresses of an existing wallet (stops after 20 unused)
+  python keygen.py --mnemonic "..." --path ~/cardano_wallet --discover --gap-limit 20
+  
+  # One wallet per line of mnemonics.txt to wallets.jsonl (re-run to resume)
+  python keygen.py --mnemonic-file mnemonics.txt --path ~/cardano_wallet --count 1
         """
     )
     
@@ -110,13 +235,45 @@ Examples:
                         help='Number of addresses to generate (default: 5)')
     parser.add_argument('--account', type=int, default=0,
                         help='BIP44 account index (default: 0)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes for bulk derivation (default: 1, in this process)')
+    parser.add_argument('--accounts', type=str,
+                        help='Account indices to derive in one pass, e.g. "0-9" or "0,2,5-7"')
+    parser.add_argument('--chains', type=str, default='external',
+                        help='Chains for --accounts: external, internal or both, comma-separated (default: external)')
+    parser.add_argument('--discover', action='store_true',
+                        help='Scan for used addresses instead of generating a fixed count')
+    parser.add_argument('--gap-limit', type=int, default=20,
+                        help='Unused addresses in a row that end discovery (default: 20)')
+    parser.add_argument('--mnemonic-file', type=str,
+                        help='File with one mnemonic per line; results go to wallets.jsonl')
+    parser.add_argument('--restart', action='store_true',
+                        help='With --mnemonic-file: overwrite wallets.jsonl instead of resuming')
     
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
     
-    if args.new:
-        generate_new_keypair(args.path, args.account, args.count)
+    if args.mnemonic_file:
+        bulk_from_file(args.mnemonic_file, args.path, args.account, args.count,
+                       args.workers, not args.restart)
+    elif args.accounts is not None and args.mnemonic:
+        try:
+            chains = normalize_chains(c for c in args.chains.split(',') if c.strip())
+        except ValueError as e:
+            parser.error(f"--chains: {e}")
+        try:
+            accounts = parse_accounts(args.accounts)
+        except ValueError as e:
+            parser.error(f"--accounts: {e}")
+        generate_accounts_from_mnemonic(args.mnemonic, args.path, accounts,
+                                        args.count, chains, args.workers)
+    elif args.discover and args.mnemonic:
+        discover_from_mnemonic(args.mnemonic, args.path, args.account, args.gap_limit, args.workers)
+    elif args.new:
+        generate_new_keypair(args.path, args.account, args.count, args.workers)
     elif args.mnemonic:
-        generate_from_mnemonic(args.mnemonic, args.path, args.account, args.count)
+        generate_from_mnemonic(args.mnemonic, args.path, args.account, args.count, args.workers)
     else:
         parser.print_help()
         sys.exit(1)
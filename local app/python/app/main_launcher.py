@@ -131,6 +131,10 @@ def main():
     """Main entry point"""
     app = QApplication(sys.argv)
     
+    # Locate external tools once for the whole session
+    from utils.tool_registry import ToolRegistry
+    ToolRegistry.resolve_all()
+    
     launcher = MainLauncher()
     launcher.show()
     
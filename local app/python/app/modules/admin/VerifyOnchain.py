@@ -1,24 +1,30 @@
-import requests
+from utils.chain_query import ChainQueryEngine
+from utils.koios_client import KoiosClient
+
+# Stake addresses per account_info request
+STAKE_CHUNK_SIZE = 100
+
+def _account_result(stake_address, account):
+    if not account:
+        return {"StakeAddress": stake_address, "Verified": False}
+    # v1 reports total_balance (v0 used balance)
+    balance = int(account.get("total_balance", account.get("balance", 0)) or 0)
+    return {
+        "StakeAddress": stake_address,
+        "Balance": balance,
+        "BalanceAda": balance / 1_000_000,
+        "Status": account.get("status"),
+        "Verified": True
+    }
 
 def verify_onchain_stake(stake_address, api_provider="koios", api_key=""):
     if api_provider == "koios":
-        api_url = f"https://api.koios.rest/api/v0/account_info?_stake_addresses={stake_address}"
         try:
-            response = requests.get(api_url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            data = ChainQueryEngine.shared().call("account_info", {"_stake_addresses": [stake_address]})
             if data and len(data) > 0:
-                account = data[0]
-                balance = int(account.get("balance", 0))
-                ada = balance / 1_000_000
-                print(f"✓ Stake address found on-chain\n  Balance: {ada} ADA ({balance} Lovelace)\n  Status: {account.get('status')}")
-                return {
-                    "StakeAddress": stake_address,
-                    "Balance": balance,
-                    "BalanceAda": ada,
-                    "Status": account.get("status"),
-                    "Verified": True
-                }
+                result = _account_result(stake_address, data[0])
+                print(f"✓ Stake address found on-chain\n  Balance: {result['BalanceAda']} ADA ({result['Balance']} Lovelace)\n  Status: {result['Status']}")
+                return result
             else:
                 print("✗ Stake address not found or has no ADA")
                 return {"Verified": False}
@@ -27,4 +33,35 @@ def verify_onchain_stake(stake_address, api_provider="koios", api_key=""):
             return {"Verified": False}
     else:
         print(f"✗ API provider '{api_provider}' not yet implemented")
-        return None
\ No newline at end of file
+        return None
+
+def iter_verify_onchain_stakes(stake_addresses, chunk_size=STAKE_CHUNK_SIZE, cancel_event=None):
+    # Yields (done, total, chunk results) as each account_info batch completes;
+    # setting cancel_event stops the run and drops queued requests
+    unique = list(dict.fromkeys(stake_addresses))
+    chunks = KoiosClient.chunks(unique, chunk_size)
+    calls = [("account_info", {"_stake_addresses": chunk}) for chunk in chunks]
+    done = 0
+    results_iter = ChainQueryEngine.shared().iter_completed(calls)
+    try:
+        for index, data in results_iter:
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            chunk = chunks[index]
+            if isinstance(data, Exception):
+                results = [{"StakeAddress": addr, "Verified": False, "Error": str(data)} for addr in chunk]
+            else:
+                accounts = {account.get("stake_address"): account for account in data or []}
+                results = [_account_result(addr, accounts.get(addr)) for addr in chunk]
+            done += len(chunk)
+            yield done, len(unique), results
+    finally:
+        # Cancels requests that have not started yet
+        results_iter.close()
+
+def verify_onchain_stakes(stake_addresses, chunk_size=STAKE_CHUNK_SIZE, cancel_event=None):
+    results = {}
+    for _, _, chunk_results in iter_verify_onchain_stakes(stake_addresses, chunk_size, cancel_event):
+        for result in chunk_results:
+            results[result["StakeAddress"]] = result
+    return results
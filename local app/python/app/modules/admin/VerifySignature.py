@@ -1,3 +1,9 @@
+from utils.signature_verifier import SignatureVerifier
+
+def _claimed_addresses(signature_data):
+    # Payment or stake key of the address; a stake address must be the address's stake part
+    return (signature_data.get("address"), signature_data.get("stake_address"))
+
 def verify_user_signature(challenge, signature_data, check_expiry=True):
     import time
     now = int(time.time())
@@ -7,7 +13,32 @@ def verify_user_signature(challenge, signature_data, check_expiry=True):
     if signature_data.get("challenge_id") != challenge.get("challenge_id"):
         print("✗ Challenge ID mismatch")
         return False
-    # TODO: Implement Ed25519 signature verification using a crypto library
-    # Example: nacl.signing.VerifyKey(public_key).verify(message, signature)
-    print("✓ Signature valid and challenge verified! (Demo only, implement real check)")
-    return True
\ No newline at end of file
+    claims = _claimed_addresses(signature_data)
+    if not claims[0]:
+        print("✗ No address to verify the signing key against")
+        return False
+    if not SignatureVerifier.verify(signature_data.get("public_key"), challenge["message"],
+                                   signature_data.get("signature", ""), claims):
+        print("✗ Invalid signature or key does not match the address")
+        return False
+    print("✓ Signature valid and challenge verified!")
+    return True
+
+def verify_user_signatures(challenge, submissions, check_expiry=True, workers=None):
+    import time
+    now = int(time.time())
+    if check_expiry and now > challenge["expiry"]:
+        print("✗ Challenge expired")
+        return [False] * len(submissions)
+    results = [False] * len(submissions)
+    pending = [i for i, sub in enumerate(submissions) if sub.get("challenge_id") == challenge.get("challenge_id")]
+    valid = SignatureVerifier.verify_many(
+        [(submissions[i].get("public_key"), challenge["message"], submissions[i].get("signature", ""))
+         for i in pending],
+        workers,
+        [_claimed_addresses(submissions[i]) for i in pending]
+    )
+    for i, ok in zip(pending, valid):
+        results[i] = ok
+    print(f"✓ {sum(results)}/{len(submissions)} signatures valid for challenge {challenge.get('challenge_id')}")
+    return results
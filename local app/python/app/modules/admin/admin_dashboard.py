@@ -7,15 +7,53 @@ from PySide6.QtWidgets import (
     QTextEdit, QMessageBox, QInputDialog, QFileDialog, QTabWidget
 )
 from PySide6.QtGui import QFont
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QThread, Signal
 
 # Import from same directory (absolute for standalone)
 import sys
 import os
+import threading
 sys.path.insert(0, os.path.dirname(__file__))
 
 from GenerateChallenge import generate_signing_challenge
-from VerifyOnchain import verify_onchain_stake
+from VerifyOnchain import iter_verify_onchain_stakes
+
+
+class StakeVerificationWorker(QThread):
+    """Background worker for bulk on-chain stake verification"""
+    progress = Signal(int, int)
+    partial = Signal(list)
+    completed = Signal(dict)
+    error = Signal(str)
+    
+    def __init__(self, stake_addresses: list):
+        super().__init__()
+        self.stake_addresses = stake_addresses
+        self._cancel = threading.Event()
+    
+    def cancel(self):
+        """Stop after the batches already in flight"""
+        self._cancel.set()
+    
+    def run(self):
+        try:
+            valid_count = 0
+            invalid_count = 0
+            done = 0
+            for done, total, results in iter_verify_onchain_stakes(self.stake_addresses, cancel_event=self._cancel):
+                valid_count += sum(1 for result in results if result.get('Verified'))
+                invalid_count += sum(1 for result in results if not result.get('Verified'))
+                self.partial.emit(results)
+                self.progress.emit(done, total)
+            
+            self.completed.emit({
+                "valid": valid_count,
+                "invalid": invalid_count,
+                "checked": done,
+                "cancelled": self._cancel.is_set()
+            })
+        except Exception as e:
+            self.error.emit(f"Error: {str(e)}")
 
 
 class AdminDashboard(QMainWindow):
@@ -45,6 +83,7 @@ class AdminDashboard(QMainWindow):
             }
         """)
         
+        self.verify_worker = None
         self.setup_ui()
     
     def setup_ui(self):
@@ -76,10 +115,10 @@ class AdminDashboard(QMainWindow):
         left_layout.addWidget(btn_gen_challenge)
         
         # Verify signatures
-        btn_verify = QPushButton("3. Verify Signatures")
-        btn_verify.setMinimumHeight(45)
-        btn_verify.clicked.connect(self.on_verify_signatures)
-        left_layout.addWidget(btn_verify)
+        self.btn_verify = QPushButton("3. Verify Signatures")
+        self.btn_verify.setMinimumHeight(45)
+        self.btn_verify.clicked.connect(self.on_verify_signatures)
+        left_layout.addWidget(self.btn_verify)
         
         # Export to Excel
         btn_export = QPushButton("4. Export Results")
@@ -185,7 +224,13 @@ class AdminDashboard(QMainWindow):
             QMessageBox.critical(self, "Error", f"Error: {e}")
     
     def on_verify_signatures(self):
-        """Verify participant signatures"""
+        """Verify participant signatures (click again to cancel a running check)"""
+        if self.verify_worker is not None:
+            self.verify_worker.cancel()
+            self.btn_verify.setEnabled(False)
+            self.append_output("[*] Cancelling verification...")
+            return
+        
         try:
             file_path, _ = QFileDialog.getOpenFileName(
                 self,
@@ -197,33 +242,61 @@ class AdminDashboard(QMainWindow):
             if not file_path:
                 return
             
-            self.append_output("[*] Verifying signatures...")
-            
             try:
                 import json
                 with open(file_path) as f:
                     data = json.load(f)
-                
-                valid_count = 0
-                invalid_count = 0
-                
-                # Assume data is list of stake addresses
-                if isinstance(data, list):
-                    for stake_addr in data:
-                        result = verify_onchain_stake(stake_addr)
-                        if result.get('Verified'):
-                            valid_count += 1
-                        else:
-                            invalid_count += 1
-                
-                self.append_output(f"✓ Verification complete")
-                self.append_output(f"Valid: {valid_count}")
-                self.append_output(f"Invalid: {invalid_count}")
             except Exception as e:
                 self.append_output(f"✗ Verification failed: {e}")
+                return
+            
+            # Assume data is list of stake addresses
+            stake_addresses = data if isinstance(data, list) else []
+            self.append_output(f"[*] Verifying {len(stake_addresses)} stake addresses...")
+            
+            self.verify_worker = StakeVerificationWorker(stake_addresses)
+            self.verify_worker.progress.connect(self.on_verify_progress)
+            self.verify_worker.partial.connect(self.on_verify_partial)
+            self.verify_worker.completed.connect(self.on_verify_finished)
+            self.verify_worker.error.connect(self.on_verify_error)
+            self.btn_verify.setText("Cancel Verification")
+            self.verify_worker.start()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error: {e}")
     
+    def on_verify_progress(self, done: int, total: int):
+        """Show verification progress"""
+        self.append_output(f"[*] Checked {done}/{total}")
+    
+    def on_verify_partial(self, results: list):
+        """Show addresses that failed in the latest batch"""
+        for result in results:
+            if not result.get('Verified'):
+                reason = result.get('Error', 'not found on-chain')
+                self.append_output(f"  ✗ {result['StakeAddress']}: {reason}")
+    
+    def on_verify_finished(self, summary: dict):
+        """Show verification summary"""
+        if summary["cancelled"]:
+            self.append_output(f"⚠️  Verification cancelled after {summary['checked']} addresses")
+        else:
+            self.append_output(f"✓ Verification complete")
+        self.append_output(f"Valid: {summary['valid']}")
+        self.append_output(f"Invalid: {summary['invalid']}")
+        self._reset_verify_button()
+    
+    def on_verify_error(self, error: str):
+        """Show verification failure"""
+        self.append_output(f"✗ Verification failed: {error}")
+        self._reset_verify_button()
+    
+    def _reset_verify_button(self):
+        # run() has returned once its last signal is delivered; join before dropping it
+        self.verify_worker.wait()
+        self.verify_worker = None
+        self.btn_verify.setText("3. Verify Signatures")
+        self.btn_verify.setEnabled(True)
+    
     def on_export_results(self):
         """Export verification results to Excel"""
         try:
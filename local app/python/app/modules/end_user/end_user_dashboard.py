@@ -8,7 +8,7 @@ from PySide6.QtWidgets import (
     QGridLayout, QLineEdit, QSpinBox, QFrame, QCompleter
 )
 from PySide6.QtGui import QFont, QIcon, QColor, QClipboard
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QStringListModel
 import sys
 import os
 import threading
@@ -25,8 +25,9 @@ try:
     from modules.end_user.key_generator import KeyGenerator
     from modules.end_user.offline_signing_dialog import OfflineSigningDialog
     from modules.end_user.web_signing_server import WebSigningServer
-    from utils.bip39 import BIP39
+    from utils.bip39 import BIP39, get_wordlist
     from utils.mnemonic_generator import MnemonicGenerator
+    from utils.word_trie import WordTrie
 except ImportError:
     # Fallback for relative imports
     from tracking_so_du_paymentkey import get_payment_address_info
@@ -35,11 +36,14 @@ except ImportError:
     from offline_signing_dialog import OfflineSigningDialog
     from web_signing_server import WebSigningServer
     try:
-        from utils.bip39 import BIP39
+        from utils.bip39 import BIP39, get_wordlist
         from utils.mnemonic_generator import MnemonicGenerator
+        from utils.word_trie import WordTrie
     except:
         BIP39 = None
         MnemonicGenerator = None
+        get_wordlist = None
+        WordTrie = None
 
 # Custom Stylesheet
 DARK_STYLESHEET = """
@@ -123,6 +127,17 @@ DARK_STYLESHEET = """
     }
 """
 
+# One completion model for every word box, built on first use
+_word_model = None
+
+
+def get_word_model():
+    """Shared QStringListModel over the BIP39 wordlist (None if unavailable)"""
+    global _word_model
+    if _word_model is None and get_wordlist:
+        _word_model = QStringListModel(list(get_wordlist()))
+    return _word_model
+
 class EndUserDashboard(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -561,15 +576,9 @@ class EndUserDashboard(QMainWindow):
             self.append_output(f"[+] Pasted: {len(mnemonic.split())} words")
         
         else:  # safety mode - word by word
-            # Load wordlist
-            wordlist = []
-            try:
-                wordlist_path = os.path.join(os.path.dirname(__file__), '../../wordlist.txt')
-                if os.path.exists(wordlist_path):
-                    with open(wordlist_path, 'r') as f:
-                        wordlist = [line.strip() for line in f if line.strip()]
-            except:
-                pass
+            # Shared word model and trie (built once per process)
+            word_model = get_word_model()
+            word_trie = WordTrie.shared() if WordTrie else None
             
             input_dialog = QDialog(self)
             input_dialog.setWindowTitle(f"Enter {word_count_selected} Words")
@@ -595,6 +604,19 @@ class EndUserDashboard(QMainWindow):
             text_boxes = []
             cols = 4
             
+            # A single completer serves all boxes; QLineEdit attaches it on focus
+            completer = None
+            if word_model:
+                completer = QCompleter(word_model, input_dialog)
+                completer.setCaseSensitivity(Qt.CaseInsensitive)
+            
+            def expand_word(txt):
+                # Unique prefix (e.g. first 4 letters) -> full word
+                if word_trie:
+                    word = word_trie.expand(txt.text())
+                    if word and word != txt.text():
+                        txt.setText(word)
+            
             for i in range(word_count_selected):
                 row = i // cols
                 col = i % cols
@@ -606,10 +628,9 @@ class EndUserDashboard(QMainWindow):
                 txt = QLineEdit()
                 txt.setPlaceholderText("word")
                 txt.setMaxLength(20)
-                if wordlist:
-                    completer = QCompleter(wordlist)
-                    completer.setCaseSensitivity(Qt.CaseInsensitive)
+                if completer:
                     txt.setCompleter(completer)
+                txt.editingFinished.connect(lambda txt=txt: expand_word(txt))
                 grid.addWidget(txt, row, col * 2 + 1)
                 text_boxes.append(txt)
             
@@ -630,6 +651,12 @@ class EndUserDashboard(QMainWindow):
                     if not word:
                         QMessageBox.warning(input_dialog, "Error", "Fill all words")
                         return
+                    if word_trie and word not in word_trie:
+                        suggestions = word_trie.suggest(word)
+                        hint = f"\nDid you mean: {', '.join(suggestions)}?" if suggestions else ""
+                        QMessageBox.warning(input_dialog, "Error", f"Word {len(words) + 1} is not a BIP39 word: {word}{hint}")
+                        txt.setFocus()
+                        return
                     words.append(word)
                 mnemonic = " ".join(words)
                 input_dialog.close()
@@ -677,31 +704,34 @@ class EndUserDashboard(QMainWindow):
             gen = KeyGenerator(wallet_path)
             self.append_output("[+] KeyGenerator initialized")
             
+            # One call per chain: root and account keys are derived once
             self.append_output(f"[*] Generating {ext_count} external addresses...")
             external_addrs = []
-            for i in range(ext_count):
-                result = gen.generate_addresses(mnemonic, account_index=0, 
-                                               address_count=1, address_index=i, 
+            if ext_count > 0:
+                result = gen.generate_addresses(mnemonic, account_index=0,
+                                               address_count=ext_count,
                                                is_external=True)
                 if result:
-                    addr = result.get('address', 'N/A')
-                    self.append_output(f"  ✓ Ext {i}: {addr[:40]}...")
-                    external_addrs.append(addr)
+                    for addr_info in result['addresses']:
+                        addr = addr_info['address']
+                        self.append_output(f"  ✓ Ext {addr_info['index']}: {addr[:40]}...")
+                        external_addrs.append(addr)
                 else:
-                    self.append_output(f"  ✗ Failed ext {i}")
+                    self.append_output(f"  ✗ Failed external addresses")
             
             self.append_output(f"[*] Generating {int_count} internal addresses...")
             internal_addrs = []
-            for i in range(int_count):
-                result = gen.generate_addresses(mnemonic, account_index=0, 
-                                               address_count=1, address_index=i, 
+            if int_count > 0:
+                result = gen.generate_addresses(mnemonic, account_index=0,
+                                               address_count=int_count,
                                                is_external=False)
                 if result:
-                    addr = result.get('address', 'N/A')
-                    self.append_output(f"  ✓ Int {i}: {addr[:40]}...")
-                    internal_addrs.append(addr)
+                    for addr_info in result['addresses']:
+                        addr = addr_info['address']
+                        self.append_output(f"  ✓ Int {addr_info['index']}: {addr[:40]}...")
+                        internal_addrs.append(addr)
                 else:
-                    self.append_output(f"  ✗ Failed int {i}")
+                    self.append_output(f"  ✗ Failed internal addresses")
             
             total_addrs = len(external_addrs) + len(internal_addrs)
             self.append_output(f"\n✅ Complete! Total: {total_addrs} addresses generated")
@@ -7,7 +7,7 @@ It uses modular utilities from utils/ folder.
 """
 import os
 import sys
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 # Add paths for standalone imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
@@ -15,6 +15,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from utils.bip39 import BIP39
 from utils.multi_address_generator import MultiAddressGenerator
+from utils.address_discovery import AddressDiscovery
 
 
 class KeyGenerator:
@@ -35,10 +36,10 @@ class KeyGenerator:
         self.network = network
         self.multi_gen = MultiAddressGenerator(wallet_path, network)
         self.addresses = []
-        
+    
     def generate_addresses(self, mnemonic: str, account_index: int = 0,
                           address_count: int = 5, address_index: int = -1, 
-                          is_external: bool = True) -> Optional[Dict]:
+                          is_external: bool = True, workers: int = 1) -> Optional[Dict]:
         """
         Generate addresses from mnemonic
         
@@ -48,6 +49,7 @@ class KeyGenerator:
             address_count: Number of addresses to generate (default 5)
             address_index: Specific address index (if >= 0, generates single address)
             is_external: True for external addresses (0/i), False for internal (1/i)
+            workers: Worker processes for bulk derivation (1 = in this process)
             
         Returns:
             Dict with generated addresses and stake address
@@ -67,9 +69,76 @@ class KeyGenerator:
             result = self.multi_gen.generate_single_address(mnemonic, account_index, address_index, is_external)
         else:
             # Multiple addresses
-            result = self.multi_gen.generate_multiple_addresses(mnemonic, account_index, address_count, is_external)
+            result = self.multi_gen.generate_multiple_addresses(mnemonic, account_index, address_count,
+                                                                is_external, workers)
+        
+        if result:
+            self.addresses = self.multi_gen.addresses
+        
+        return result
+    
+    def generate_accounts(self, mnemonic: str, account_indices: List[int],
+                          address_count: int = 5, chains: List[str] = None,
+                          output_file: str = None, workers: int = 1) -> Optional[Dict]:
+        """
+        Generate addresses for a range of accounts, streaming results to JSONL
+        
+        Args:
+            mnemonic: BIP39 mnemonic (12, 15, or 24 words)
+            account_indices: BIP44 account indices
+            address_count: Addresses per chain
+            chains: Chains to derive (default: external and internal)
+            output_file: JSONL output path (default: <wallet_path>/accounts.jsonl)
+            workers: Worker processes, one account per task (1 = in this process)
+            
+        Returns:
+            Summary dict with output file and account count
+        """
+        bip39 = BIP39()
+        if not bip39.validate_mnemonic(mnemonic):
+            print("✗ Invalid mnemonic")
+            return None
+        
+        mnemonic = bip39.normalize_mnemonic(mnemonic)
+        
+        return self.multi_gen.generate_accounts(
+            mnemonic, account_indices, address_count, chains, output_file, workers
+        )
+    
+    def discover_addresses(self, mnemonic: str, account_index: int = 0,
+                           gap_limit: int = AddressDiscovery.DEFAULT_GAP_LIMIT,
+                           usage_checker=None, workers: int = 1) -> Optional[Dict]:
+        """
+        Discover the wallet's used addresses with a gap-limit scan
+        
+        Args:
+            mnemonic: BIP39 mnemonic (12, 15, or 24 words)
+            account_index: BIP44 account index (default 0)
+            gap_limit: Consecutive unused addresses that end a chain
+            usage_checker: Returns the used subset of an address list (default: Koios)
+            workers: Worker processes for derivation (1 = in this process)
+            
+        Returns:
+            Dict with used external/internal addresses and stake address
+        """
+        bip39 = BIP39()
+        if not bip39.validate_mnemonic(mnemonic):
+            print("✗ Invalid mnemonic")
+            return None
+        
+        mnemonic = bip39.normalize_mnemonic(mnemonic)
+        
+        if usage_checker is None:
+            from modules.end_user.tracking_so_du_paymentkey import get_used_addresses
+            usage_checker = get_used_addresses
+        
+        discovery = AddressDiscovery(usage_checker, gap_limit=gap_limit, workers=workers)
+        result = discovery.discover(mnemonic, account_index, self.network)
         
         if result:
+            self.multi_gen.addresses = result["external"] + result["internal"]
+            self.multi_gen.stake_address = result["stake_address"]
+            self.multi_gen.account_index = account_index
             self.addresses = self.multi_gen.addresses
         
         return result
@@ -91,6 +160,19 @@ class KeyGenerator:
         result = self.multi_gen.save_wallet(wallet_name)
         return result is not None
     
+    def find_address(self, key: str, wallet_name: str = None) -> Optional[Dict]:
+        """
+        Find which account, chain and index an address or key belongs to
+        
+        Args:
+            key: Address, stake address, addr_vk/stake_vk or hex key hash
+            wallet_name: Saved wallet to search (default: addresses generated in this session)
+            
+        Returns:
+            Dict with account, chain and index, or None
+        """
+        return self.multi_gen.lookup(key, wallet_name)
+    
     def export_addresses(self, output_file: str = None) -> bool:
         """
         Export addresses to CSV
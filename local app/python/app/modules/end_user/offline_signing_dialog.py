@@ -35,7 +35,7 @@ class SigningWorker(QThread):
     def run(self):
         try:
             verifier = CryptoVerifier()
-            signature = verifier.sign_with_signer(self.message, self.skey_path)
+            signature = verifier.sign_message(self.message, self.skey_path)
             
             if signature:
                 self.finished.emit({
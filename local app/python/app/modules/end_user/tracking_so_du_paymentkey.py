@@ -3,51 +3,66 @@ Cardano Wallet Checker (Python)
 - Payment Address: Get balance, assets, stake address
 - Stake Address: Get delegation info
 """
-import requests
+import os
+import sys
 from datetime import datetime
 
+# Add paths for standalone imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from shared.derive_stake import StakeAddressDeriver
+from utils.chain_query import ChainQueryEngine
+from utils.koios_client import KoiosClient
+
 def hex_to_ascii(hex_str):
     ascii_str = ""
     for i in range(0, len(hex_str), 2):
         ascii_str += chr(int(hex_str[i:i+2], 16))
     return ascii_str
 
-def get_payment_address_info(payment_address):
-    url1 = 'https://api.koios.rest/api/v1/address_info'
-    url2 = 'https://api.koios.rest/api/v1/address_assets'
-    headers = {
-        'Accept': 'application/json',
-        'Content-Type': 'application/json'
-    }
-    payload = {
-        '_addresses': [payment_address]
-    }
-    try:
-        r1 = requests.post(url1, headers=headers, json=payload, timeout=10)
-        r1.raise_for_status()
-        data1 = r1.json()
-        r2 = requests.post(url2, headers=headers, json=payload, timeout=10)
-        r2.raise_for_status()
-        data2 = r2.json()
-        adabal = round(float(data1[0]['balance']) * 1e-6, 2)
-        stake_address = data1[0].get('stake_address', 'N/A')
-        asset_info = []
-        if data2 and len(data2) > 0 and data2[0].get('asset_list'):
-            for item in data2[0]['asset_list']:
-                asset_name = item.get('asset_name', '')
-                asset_name_ascii = hex_to_ascii(asset_name) if asset_name else ''
-                quantity = float(item.get('quantity', 0))
-                decimal = item.get('decimals', 0)
-                if decimal and decimal > 0:
-                    quantity = quantity * pow(10, -decimal)
-                asset_info.append((asset_name_ascii, quantity))
-        return {
+def format_assets(asset_rows):
+    asset_info = []
+    for item in asset_rows:
+        asset_name = item.get('asset_name', '')
+        asset_name_ascii = hex_to_ascii(asset_name) if asset_name else ''
+        quantity = float(item.get('quantity', 0))
+        decimal = item.get('decimals', 0)
+        if decimal and decimal > 0:
+            quantity = quantity * pow(10, -decimal)
+        asset_info.append((asset_name_ascii, quantity))
+    return asset_info
+
+def get_payment_addresses_info(payment_addresses):
+    """Balance, stake address and assets of many addresses (chunked, concurrent Koios requests)"""
+    results = KoiosClient.shared().query_addresses(payment_addresses)
+    # Stake addresses are read from the addresses themselves; Koios only for non-base addresses
+    stake_addresses = StakeAddressDeriver.get_stake_addresses(list(results))
+    infos = {}
+    for payment_address, entry in results.items():
+        info = entry['info'] or {}
+        if entry['error']:
+            infos[payment_address] = {
+                'PaymentAddress': payment_address,
+                'StakeAddress': 'N/A',
+                'ADABalance': 0,
+                'Assets': [],
+                'Success': False,
+                'Error': entry['error']
+            }
+            continue
+        infos[payment_address] = {
             'PaymentAddress': payment_address,
-            'StakeAddress': stake_address,
-            'ADABalance': adabal,
-            'Assets': asset_info,
+            'StakeAddress': stake_addresses.get(payment_address) or info.get('stake_address') or 'N/A',
+            'ADABalance': round(float(info.get('balance', 0)) * 1e-6, 2),
+            'Assets': format_assets(entry['assets']),
             'Success': True
         }
+    return infos
+
+def get_payment_address_info(payment_address):
+    try:
+        return get_payment_addresses_info([payment_address])[payment_address]
     except Exception as e:
         return {
             'PaymentAddress': payment_address,
@@ -58,31 +73,29 @@ def get_payment_address_info(payment_address):
             'Error': str(e)
         }
 
+def get_used_addresses(payment_addresses):
+    """Return the subset of payment_addresses that have on-chain history (chunked requests)"""
+    results = KoiosClient.shared().query_addresses(payment_addresses, ('address_info',))
+    errors = [entry['error'] for entry in results.values() if entry['error']]
+    if errors:
+        raise RuntimeError(errors[0])
+    return {address for address, entry in results.items() if entry['info']}
+
 def get_account_info(stake_address):
-    url = 'https://api.koios.rest/api/v1/account_info'
-    headers = {
-        'Accept': 'application/json',
-        'Content-Type': 'application/json'
-    }
     payload = {
         '_stake_addresses': [stake_address]
     }
+    engine = ChainQueryEngine.shared()
     try:
-        r = requests.post(url, headers=headers, json=payload, timeout=10)
-        r.raise_for_status()
-        data = r.json()
+        data = engine.call('account_info', payload)
         if data and len(data) > 0:
             account_data = data[0]
-            pool_id = account_data.get('delegated_pool', 'Not delegated')
+            pool_id = account_data.get('delegated_pool') or 'Not delegated'
             pool_name = 'Unknown'
             # If delegated, get pool name
             if pool_id != 'Not delegated':
                 try:
-                    pool_url = 'https://api.koios.rest/api/v1/pool_info'
-                    pool_payload = {'_pool_bech32_ids': [pool_id]}
-                    pool_r = requests.post(pool_url, headers=headers, json=pool_payload, timeout=10)
-                    pool_r.raise_for_status()
-                    pool_data = pool_r.json()
+                    pool_data = engine.call('pool_info', {'_pool_bech32_ids': [pool_id]})
                     if pool_data and len(pool_data) > 0:
                         meta = pool_data[0].get('meta_json', {})
                         pool_name = meta.get('name') or pool_data[0].get('pool_id_bech32', 'Unknown')
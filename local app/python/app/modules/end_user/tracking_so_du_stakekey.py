@@ -1,9 +1,15 @@
 """
 Check ADA and token balance for a stake address using Koios API.
 """
-import requests
+import os
+import sys
 from datetime import datetime
 
+# Add path for standalone imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from utils.chain_query import ChainQueryEngine
+
 def hex_to_ascii(hex_str):
     ascii_str = ""
     for i in range(0, len(hex_str), 2):
@@ -11,22 +17,18 @@ def hex_to_ascii(hex_str):
     return ascii_str
 
 def check_stake_balance(stake_address: str) -> str:
-    url1 = 'https://api.koios.rest/api/v1/account_info'
-    url2 = 'https://api.koios.rest/api/v1/account_assets'
-    headers = {
-        'Accept': 'application/json',
-        'Content-Type': 'application/json'
-    }
     payload = {
         '_stake_addresses': [stake_address]
     }
     try:
-        r1 = requests.post(url1, headers=headers, json=payload, timeout=10)
-        r1.raise_for_status()
-        data1 = r1.json()
-        r2 = requests.post(url2, headers=headers, json=payload, timeout=10)
-        r2.raise_for_status()
-        data2 = r2.json()
+        # Both queries in flight at once
+        data1, data2 = ChainQueryEngine.shared().call_many([
+            ('account_info', payload),
+            ('account_assets', payload)
+        ])
+        for data in (data1, data2):
+            if isinstance(data, Exception):
+                raise data
     except Exception as e:
         return f"Lỗi khi truy vấn Koios API: {e}"
 
@@ -4,6 +4,8 @@ Sign Cardano messages through browser with Yoroi wallet integration
 """
 import asyncio
 import json
+import os
+import sys
 import webbrowser
 import threading
 from typing import Optional, Dict
@@ -15,6 +17,10 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from shared.cose_verifier import COSEVerifier
+
 
 class WebSigningServer:
     """HTTP server for web-based message signing"""
@@ -47,10 +53,23 @@ class WebSigningServer:
                         status_code=400
                     )
                 
+                # CIP-30 signData: COSE_Sign1 + COSE_Key over the issued message
+                verification = COSEVerifier.verify(
+                    body.get("signature"), body.get("key"),
+                    self.message_to_sign, body.get("address")
+                )
+                if not verification["valid"]:
+                    return JSONResponse(
+                        {"status": "error", "message": verification["error"]},
+                        status_code=400
+                    )
+                
                 self.signature_result = {
                     "message": self.message_to_sign,
                     "signature": body.get("signature"),
-                    "address": body.get("address"),
+                    "key": body.get("key"),
+                    "address": verification["address"],
+                    "public_key": verification["public_key"],
                     "wallet": body.get("wallet", "unknown"),
                     "timestamp": datetime.now().isoformat()
                 }
@@ -499,11 +518,16 @@ class WebSigningServer:
                         headers: {{'Content-Type': 'application/json'}},
                         body: JSON.stringify({{
                             signature: signature.signature,
+                            key: signature.key,
                             address: address,
                             wallet: walletKey
                         }})
                     }});
                     console.log('Signature sent to server');
+                    if (!response.ok) {{
+                        const result = await response.json();
+                        showStatus('❌ Chữ ký không hợp lệ: ' + result.message, 'error');
+                    }}
                 }} catch (e) {{
                     console.error('Send error:', e);
                 }}
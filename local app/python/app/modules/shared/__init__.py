@@ -6,11 +6,13 @@ import os
 sys.path.insert(0, os.path.dirname(__file__))
 
 from crypto_verifier import CryptoVerifier
+from cose_verifier import COSEVerifier
 from derive_stake import StakeAddressDeriver
 from wallet_exporter_and_verifier import WalletExporter, LocalVerifier
 
 __all__ = [
     'CryptoVerifier',
+    'COSEVerifier',
     'StakeAddressDeriver',
     'WalletExporter',
     'LocalVerifier'
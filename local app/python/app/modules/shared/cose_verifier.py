@@ -0,0 +1,241 @@
+"""
+COSE Verifier: Verify CIP-8 / CIP-30 signData signatures
+COSE_Sign1 (signature) + COSE_Key (public key) from browser wallets
+"""
+import hashlib
+from typing import Dict, List, Optional, Union
+
+from utils import bech32, cbor, ed25519
+from utils.signature_verifier import SignatureVerifier
+
+
+class COSEVerifier:
+    """Verify browser-wallet message signatures
+    
+    A CIP-30 signData result is a COSE_Sign1 array [protected, unprotected,
+    payload, signature] and a COSE_Key map. The signed bytes are the
+    Sig_structure ["Signature1", protected, b"", payload]; the protected
+    header carries the signing address, whose key hash must match the
+    COSE_Key public key.
+    """
+    
+    # COSE labels (RFC 9052 / 9053)
+    HEADER_ALG = 1
+    ALG_EDDSA = -8
+    KEY_KTY = 1
+    KEY_ALG = 3
+    KEY_CRV = -1
+    KEY_X = -2
+    KTY_OKP = 1
+    CRV_ED25519 = 6
+    
+    # Shelley address types whose first credential is a key hash
+    KEY_HASH_ADDRESS_TYPES = (0x0, 0x2, 0x4, 0x6, 0xE)
+    
+    @staticmethod
+    def _to_bytes(value: Union[str, bytes]) -> Optional[bytes]:
+        """Hex or bech32 string (or raw bytes) to bytes; None for anything else"""
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return bytes(value)
+        if not isinstance(value, str):
+            return None
+        value = value.strip()
+        try:
+            return bytes.fromhex(value)
+        except ValueError:
+            decoded = bech32.decode(value)
+            return decoded[1] if decoded else None
+    
+    @staticmethod
+    def address_to_bech32(address: bytes) -> Optional[str]:
+        """
+        Encode raw Shelley address bytes as bech32
+        
+        Args:
+            address: Address bytes (header + credentials)
+            
+        Returns:
+            addr1.../stake1... (or testnet prefixes) or None
+        """
+        if not address:
+            return None
+        mainnet = address[0] & 0x0F == 1
+        if address[0] >> 4 in (0xE, 0xF):
+            hrp = "stake" if mainnet else "stake_test"
+        else:
+            hrp = "addr" if mainnet else "addr_test"
+        return bech32.encode(hrp, bytes(address))
+    
+    @staticmethod
+    def parse(signature: Union[str, bytes], key: Union[str, bytes]) -> Dict:
+        """
+        Decode COSE_Sign1 and COSE_Key
+        
+        Args:
+            signature: COSE_Sign1 (hex or bytes)
+            key: COSE_Key (hex or bytes)
+            
+        Returns:
+            Dict with public_key, signature, protected, payload, hashed and
+            address, or {"error": ...}
+        """
+        sign1_bytes = COSEVerifier._to_bytes(signature)
+        key_bytes = COSEVerifier._to_bytes(key) if key else None
+        if not sign1_bytes or not key_bytes:
+            return {"error": "Missing, non-hex or non-string COSE_Sign1 / COSE_Key"}
+        
+        try:
+            sign1 = cbor.loads(sign1_bytes)
+            cose_key = cbor.loads(key_bytes)
+            if not isinstance(sign1, list) or len(sign1) != 4:
+                return {"error": "COSE_Sign1 is not a 4-element array"}
+            protected_raw, unprotected, payload, sig = sign1
+            if not isinstance(protected_raw, memoryview) or not isinstance(sig, memoryview):
+                return {"error": "Malformed COSE_Sign1"}
+            protected = cbor.loads(protected_raw) if len(protected_raw) else {}
+        except ValueError as e:
+            return {"error": f"Invalid CBOR: {e}"}
+        
+        if not isinstance(protected, dict) or not isinstance(cose_key, dict):
+            return {"error": "Malformed COSE headers"}
+        if protected.get(COSEVerifier.HEADER_ALG) != COSEVerifier.ALG_EDDSA:
+            return {"error": "Unsupported algorithm (expected EdDSA)"}
+        if cose_key.get(COSEVerifier.KEY_KTY) != COSEVerifier.KTY_OKP or \
+                cose_key.get(COSEVerifier.KEY_CRV, COSEVerifier.CRV_ED25519) != COSEVerifier.CRV_ED25519:
+            return {"error": "COSE_Key is not an Ed25519 key"}
+        
+        public_key = cose_key.get(COSEVerifier.KEY_X)
+        if not isinstance(public_key, memoryview) or len(public_key) != 32:
+            return {"error": "COSE_Key has no 32-byte public key"}
+        if len(sig) != 64:
+            return {"error": f"Invalid signature length: {len(sig)}"}
+        
+        address = protected.get("address")
+        hashed = isinstance(unprotected, dict) and unprotected.get("hashed") is True
+        
+        return {
+            "public_key": bytes(public_key),
+            "signature": bytes(sig),
+            "protected": protected_raw,
+            "payload": payload,
+            "hashed": hashed,
+            "address": bytes(address) if isinstance(address, memoryview) else None
+        }
+    
+    @staticmethod
+    def _check_claims(parsed: Dict, message: Union[str, bytes, None],
+                      address: Union[str, bytes, None]) -> Optional[str]:
+        """
+        Check payload and address against the challenge, then build signed_data
+        
+        Returns:
+            Why the submission does not match, or None
+        """
+        payload = parsed["payload"]
+        if message is not None:
+            if not isinstance(message, (str, bytes, bytearray, memoryview)):
+                return "Challenge message must be text or bytes"
+            expected = message.encode("utf-8") if isinstance(message, str) else bytes(message)
+            if parsed["hashed"]:
+                expected = hashlib.blake2b(expected, digest_size=28).digest()
+            if payload is None:
+                # Detached payload: the challenge itself is what was signed
+                payload = expected
+            elif payload != expected:
+                return "Signed payload does not match the challenge"
+        if not isinstance(payload, (bytes, memoryview)):
+            return "No payload to verify"
+        
+        header_address = parsed["address"]
+        if not header_address or len(header_address) < 29:
+            return "No address in protected header"
+        if header_address[0] >> 4 not in COSEVerifier.KEY_HASH_ADDRESS_TYPES:
+            return "Address is not controlled by a key"
+        key_hash = hashlib.blake2b(parsed["public_key"], digest_size=28).digest()
+        if header_address[1:29] != key_hash:
+            return "Public key does not match the address"
+        
+        if address:
+            claimed = COSEVerifier._to_bytes(address)
+            if claimed != header_address:
+                return "Submitted address does not match the signed address"
+        
+        parsed["signed_data"] = cbor.dumps(["Signature1", parsed["protected"], b"", payload])
+        return None
+    
+    @staticmethod
+    def verify(signature: Union[str, bytes], key: Union[str, bytes],
+               message: Union[str, bytes, None] = None,
+               address: Union[str, bytes, None] = None) -> Dict:
+        """
+        Verify one CIP-30 signData result
+        
+        Args:
+            signature: COSE_Sign1 (hex)
+            key: COSE_Key (hex)
+            message: Issued challenge (None to skip the payload check)
+            address: Address the wallet reported (hex or bech32, optional)
+            
+        Returns:
+            Dict with valid, error, address (bech32) and public_key (hex)
+        """
+        return COSEVerifier.verify_many(
+            [{"signature": signature, "key": key, "address": address}], message
+        )[0]
+    
+    @staticmethod
+    def verify_many(submissions: List[Dict], message: Union[str, bytes, None] = None,
+                    workers: int = None) -> List[Dict]:
+        """
+        Verify many CIP-30 signData results (e.g. admin re-verification)
+        
+        Args:
+            submissions: Dicts with signature, key and optional address/message
+            message: Challenge shared by all submissions (per-item "message" wins)
+            workers: Worker processes for Ed25519 verification
+            
+        Returns:
+            Result dict per submission (see verify), in input order
+        """
+        results = []
+        pending = []
+        for i, item in enumerate(submissions):
+            if not isinstance(item, dict):
+                parsed, error = {}, "Submission is not an object"
+            else:
+                # One malformed submission must not abort the batch
+                try:
+                    parsed = COSEVerifier.parse(item.get("signature") or b"", item.get("key") or b"")
+                    error = parsed.get("error")
+                    if not error:
+                        error = COSEVerifier._check_claims(
+                            parsed, item.get("message", message), item.get("address")
+                        )
+                except (ValueError, TypeError) as e:
+                    parsed, error = {}, f"Malformed submission: {e}"
+            results.append({
+                "valid": False,
+                "error": error,
+                "address": COSEVerifier.address_to_bech32(parsed.get("address")),
+                "public_key": parsed["public_key"].hex() if "public_key" in parsed else None
+            })
+            if not error:
+                pending.append((i, parsed))
+        
+        if len(pending) <= 1:
+            valid = [
+                ed25519.verify(parsed["public_key"], parsed["signed_data"], parsed["signature"])
+                for _, parsed in pending
+            ]
+        else:
+            valid = SignatureVerifier.verify_many([
+                (parsed["public_key"], parsed["signed_data"], parsed["signature"])
+                for _, parsed in pending
+            ], workers)
+        
+        for (i, _), ok in zip(pending, valid):
+            results[i]["valid"] = ok
+            if not ok:
+                results[i]["error"] = "Invalid signature"
+        
+        return results
@@ -5,10 +5,15 @@ Low-level Ed25519 signature verification using cardano-signer executable
 import subprocess
 import os
 import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Tuple
 import base64
 
+from utils.key_store import KeyStore
+from utils.signature_verifier import SignatureVerifier
+from utils.tool_registry import ToolRegistry
+
 
 class CryptoVerifier:
     """Verify Ed25519 signatures using cardano-signer"""
@@ -16,25 +21,51 @@ class CryptoVerifier:
     @staticmethod
     def find_cardano_signer() -> Optional[str]:
         """
-        Find cardano-signer executable in common locations
+        Find cardano-signer executable (cached in ToolRegistry)
         
         Returns:
             Path to cardano-signer or None
         """
-        common_paths = [
-            "./tools/cardano-signer/cardano-signer.exe",
-            "./tools/cardano-signer/cardano-signer",
-            "./cardano-signer.exe",
-            "./cardano-signer",
-            "cardano-signer.exe",
-            "cardano-signer",
-        ]
-        
-        for path in common_paths:
-            if os.path.exists(path):
-                return os.path.abspath(path)
-        
-        return None
+        return ToolRegistry.resolve("cardano-signer")
+    
+    @staticmethod
+    @contextmanager
+    def _message_file(message: str) -> Iterator[Tuple[str, Tuple[int, ...], Optional[str]]]:
+        """
+        Hand a message to cardano-signer without a shared temp file
+        
+        Linux: an anonymous memfd passed to the child as /dev/fd/N.
+        Other POSIX: the message is piped to /dev/stdin.
+        Windows: a uniquely named temp file, removed afterwards.
+        
+        Args:
+            message: Message text
+            
+        Yields:
+            (message file path, fds to pass, stdin input) for subprocess.run
+        """
+        if hasattr(os, "memfd_create"):
+            fd = os.memfd_create("cardano-signer-msg")
+            try:
+                with open(fd, "w", encoding="utf-8", closefd=False) as f:
+                    f.write(message)
+                os.lseek(fd, 0, os.SEEK_SET)
+                yield f"/dev/fd/{fd}", (fd,), None
+            finally:
+                os.close(fd)
+        elif os.name == "posix":
+            yield "/dev/stdin", (), message
+        else:
+            fd, msg_file = tempfile.mkstemp(prefix="msg_", suffix=".txt")
+            try:
+                with open(fd, "w", encoding="utf-8") as f:
+                    f.write(message)
+                yield msg_file, (), None
+            finally:
+                try:
+                    os.remove(msg_file)
+                except OSError:
+                    pass
     
     @staticmethod
     def verify_ed25519_signature(
@@ -44,10 +75,10 @@ class CryptoVerifier:
         signer_exe: str = None
     ) -> bool:
         """
-        Verify Ed25519 signature using cardano-signer
+        Verify Ed25519 signature (in-process; cardano-signer for other key formats)
         
         Args:
-            public_key: Public key (PEM format or hex)
+            public_key: Public key (PEM format, hex or bech32)
             message: Original message
             signature: Signature (base64 or hex)
             signer_exe: Path to cardano-signer executable (auto-find if None)
@@ -57,6 +88,14 @@ class CryptoVerifier:
         """
         print("\n========== Verifying Signature ==========")
         
+        decoded = SignatureVerifier.decode_item(public_key, message, signature)
+        if decoded:
+            if SignatureVerifier.verify(public_key, message, signature):
+                print("✓ Signature valid")
+                return True
+            print("✗ Signature invalid")
+            return False
+        
         # Find cardano-signer if not provided
         if not signer_exe:
             signer_exe = CryptoVerifier.find_cardano_signer()
@@ -68,47 +107,27 @@ class CryptoVerifier:
         print(f"Using cardano-signer: {signer_exe}")
         
         try:
-            # Create temp files for message and signature
-            temp_dir = tempfile.gettempdir()
-            msg_file = os.path.join(temp_dir, f"msg_{os.getpid()}.txt")
-            sig_file = os.path.join(temp_dir, f"sig_{os.getpid()}.txt")
-            
-            # Write message
-            with open(msg_file, 'w', encoding='utf-8') as f:
-                f.write(message)
-            
-            # Write signature
-            with open(sig_file, 'w', encoding='utf-8') as f:
-                f.write(signature)
-            
-            try:
+            with CryptoVerifier._message_file(message) as (msg_file, pass_fds, stdin_input):
                 # Run verification
                 result = subprocess.run(
                     [signer_exe, "verify", "--message-file", msg_file, 
                      "--signature", signature, "--public-key", public_key],
+                    input=stdin_input,
+                    pass_fds=pass_fds,
                     capture_output=True,
                     text=True,
                     timeout=10
                 )
-                
-                # Check output for success indicators
-                output = result.stdout.lower() + result.stderr.lower()
-                
-                if "true" in output or "valid" in output or result.returncode == 0:
-                    print("✓ Signature valid")
-                    return True
-                else:
-                    print("✗ Signature invalid")
-                    return False
-                    
-            finally:
-                # Cleanup temp files
-                for f in [msg_file, sig_file]:
-                    if os.path.exists(f):
-                        try:
-                            os.remove(f)
-                        except:
-                            pass
+            
+            # Check output for success indicators
+            output = result.stdout.lower() + result.stderr.lower()
+            
+            if "true" in output or "valid" in output or result.returncode == 0:
+                print("✓ Signature valid")
+                return True
+            else:
+                print("✗ Signature invalid")
+                return False
         
         except subprocess.TimeoutExpired:
             print("✗ Signature verification timeout")
@@ -117,6 +136,47 @@ class CryptoVerifier:
             print(f"✗ Error verifying signature: {e}")
             return False
     
+    @staticmethod
+    def sign_message(
+        message: str,
+        skey_file: str,
+        verify_with_signer: bool = False
+    ) -> Optional[str]:
+        """
+        Sign message in-process (cardano-signer only as fallback)
+        
+        Args:
+            message: Message to sign
+            skey_file: Path to .skey file
+            verify_with_signer: Also verify the signature with cardano-signer
+            
+        Returns:
+            "<signature hex> <public key hex>" (same as cardano-signer) or None
+        """
+        print("\n========== Signing Message ==========")
+        
+        # Parsed once per file; reloaded only when the file changes
+        signer = KeyStore.shared().get(skey_file)
+        if not signer:
+            print("⚠️  Key not supported in-process, using cardano-signer")
+            return CryptoVerifier.sign_with_signer(message, skey_file)
+        
+        try:
+            signature = signer.sign_hex(message)
+        except ValueError as e:
+            # Key was evicted or its file replaced while in use
+            print(f"✗ {e}")
+            return None
+        print(f"✓ Signature: {signature[:60]}...")
+        
+        if verify_with_signer:
+            sig_hex, pub_hex = signature.split()
+            if not CryptoVerifier.verify_ed25519_signature(pub_hex, message, sig_hex):
+                print("✗ cardano-signer rejected the signature")
+                return None
+        
+        return signature
+    
     @staticmethod
     def sign_with_signer(
         message: str,
@@ -149,36 +209,24 @@ class CryptoVerifier:
             return None
         
         try:
-            # Create temp file for message
-            temp_dir = tempfile.gettempdir()
-            msg_file = os.path.join(temp_dir, f"msg_{os.getpid()}.txt")
-            
-            with open(msg_file, 'w', encoding='utf-8') as f:
-                f.write(message)
-            
-            try:
+            with CryptoVerifier._message_file(message) as (msg_file, pass_fds, stdin_input):
                 # Run signing
                 result = subprocess.run(
                     [signer_exe, "sign", "--message-file", msg_file, "--secret-key", skey_file],
+                    input=stdin_input,
+                    pass_fds=pass_fds,
                     capture_output=True,
                     text=True,
                     timeout=10
                 )
-                
-                if result.returncode == 0:
-                    signature = result.stdout.strip()
-                    print(f"✓ Signature: {signature[:60]}...")
-                    return signature
-                else:
-                    print(f"✗ Signing failed: {result.stderr}")
-                    return None
-                    
-            finally:
-                if os.path.exists(msg_file):
-                    try:
-                        os.remove(msg_file)
-                    except:
-                        pass
+            
+            if result.returncode == 0:
+                signature = result.stdout.strip()
+                print(f"✓ Signature: {signature[:60]}...")
+                return signature
+            else:
+                print(f"✗ Signing failed: {result.stderr}")
+                return None
         
         except subprocess.TimeoutExpired:
             print("✗ Signing timeout")
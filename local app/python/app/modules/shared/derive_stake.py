@@ -3,7 +3,9 @@ Core-Crypto: Derive Stake Address
 Extract stake address from Cardano address
 """
 import re
-from typing import Optional
+from typing import Dict, List, Optional
+
+from utils import bech32
 
 
 class StakeAddressDeriver:
@@ -15,6 +17,46 @@ class StakeAddressDeriver:
     MAINNET_STAKE_PREFIX = "stake1"
     TESTNET_STAKE_PREFIX = "stake_test1"
     
+    # Shelley header (CIP-19): high nibble = address type, low nibble = network id
+    # Types 0-3 are base addresses: payment credential + stake credential
+    BASE_ADDRESS_TYPES = (0x0, 0x1, 0x2, 0x3)
+    REWARD_ADDRESS_TYPES = (0xE, 0xF)
+    CREDENTIAL_SIZE = 28
+    
+    @staticmethod
+    def _stake_address_from_payload(payload: bytes) -> Optional[str]:
+        """
+        Build the reward address for a decoded address payload
+        
+        Args:
+            payload: Decoded address bytes (header + credentials)
+            
+        Returns:
+            Stake address or None if the address has no stake credential
+        """
+        if not payload:
+            return None
+        address_type = payload[0] >> 4
+        network_id = payload[0] & 0x0F
+        hrp = "stake" if network_id == 1 else "stake_test"
+        size = StakeAddressDeriver.CREDENTIAL_SIZE
+        
+        if address_type in StakeAddressDeriver.REWARD_ADDRESS_TYPES:
+            if len(payload) != 1 + size:
+                return None
+            return bech32.encode(hrp, payload)
+        
+        if address_type not in StakeAddressDeriver.BASE_ADDRESS_TYPES:
+            return None
+        if len(payload) != 1 + 2 * size:
+            return None
+        
+        # Bit 0 of the type marks a script payment credential, bit 1 a
+        # script stake credential: types 0 and 1 stake with a key hash, 2 and 3 a script
+        stake_is_script = address_type & 0x2
+        header = (0xF0 if stake_is_script else 0xE0) | network_id
+        return bech32.encode(hrp, bytes([header]) + payload[1 + size:])
+    
     @staticmethod
     def get_stake_address(cardano_address: str) -> Optional[str]:
         """
@@ -35,11 +77,60 @@ class StakeAddressDeriver:
             print(f"✗ Invalid Cardano address format: {cardano_address}")
             return None
         
-        print(f"Deriving stake address from: {cardano_address}")
+        decoded = bech32.decode(cardano_address)
+        stake_address = StakeAddressDeriver._stake_address_from_payload(decoded[1])
+        if not stake_address:
+            print(f"✗ Address has no stake credential (enterprise, pointer or Byron): {cardano_address}")
+            return None
         
-        # For now, return the address itself as it would need bech32 decoding
-        # In production, would decode bech32 and extract stake credential
-        return cardano_address
+        return stake_address
+    
+    @staticmethod
+    def get_stake_addresses(addresses: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Derive stake addresses for many addresses offline
+        
+        Args:
+            addresses: Cardano addresses
+            
+        Returns:
+            Dict of address to stake address (None if invalid or no stake credential)
+        """
+        result = {}
+        for address, decoded in zip(addresses, bech32.decode_many(addresses)):
+            if decoded is None or decoded[0] not in StakeAddressDeriver._valid_hrps():
+                result[address] = None
+            else:
+                result[address] = StakeAddressDeriver._stake_address_from_payload(decoded[1])
+        return result
+    
+    @staticmethod
+    def group_by_stake_address(addresses: List[str]) -> Dict[Optional[str], List[str]]:
+        """
+        Group addresses by the stake key they delegate with
+        
+        Args:
+            addresses: Cardano addresses
+            
+        Returns:
+            Dict of stake address to its addresses (None collects addresses without one)
+        """
+        groups: Dict[Optional[str], List[str]] = {}
+        for address, stake_address in StakeAddressDeriver.get_stake_addresses(addresses).items():
+            groups.setdefault(stake_address, []).append(address)
+        return groups
+    
+    @staticmethod
+    def _valid_hrps() -> List[str]:
+        """Human-readable parts of Shelley payment and stake addresses"""
+        return [
+            prefix[:-1] for prefix in (
+                StakeAddressDeriver.MAINNET_ADDR_PREFIX,
+                StakeAddressDeriver.TESTNET_ADDR_PREFIX,
+                StakeAddressDeriver.MAINNET_STAKE_PREFIX,
+                StakeAddressDeriver.TESTNET_STAKE_PREFIX,
+            )
+        ]
     
     @staticmethod
     def is_valid_cardano_address(address: str) -> bool:
@@ -50,17 +141,22 @@ class StakeAddressDeriver:
             address: Address to validate
             
         Returns:
-            True if valid format
+            True if valid bech32 (checksum included) with an address prefix
         """
-        # Check prefixes
-        valid_prefixes = [
-            StakeAddressDeriver.MAINNET_ADDR_PREFIX,
-            StakeAddressDeriver.TESTNET_ADDR_PREFIX,
-            StakeAddressDeriver.MAINNET_STAKE_PREFIX,
-            StakeAddressDeriver.TESTNET_STAKE_PREFIX,
-        ]
+        return bech32.is_valid(address, StakeAddressDeriver._valid_hrps())
+    
+    @staticmethod
+    def validate_addresses(addresses: List[str]) -> List[bool]:
+        """
+        Validate many addresses in one call
         
-        return any(address.startswith(prefix) for prefix in valid_prefixes)
+        Args:
+            addresses: Addresses to validate
+            
+        Returns:
+            True/False per address, in input order
+        """
+        return bech32.validate_many(addresses, StakeAddressDeriver._valid_hrps())
     
     @staticmethod
     def is_enterprise_address(address: str) -> bool:
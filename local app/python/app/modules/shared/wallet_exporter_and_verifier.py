@@ -6,6 +6,9 @@ import csv
 from typing import Dict, List, Optional
 from pathlib import Path
 
+from utils import bech32
+from utils.signature_verifier import SignatureVerifier
+
 
 class WalletExporter:
     """Export wallet data to various formats"""
@@ -188,46 +191,70 @@ class LocalVerifier:
             print(f"✗ Error: {e}")
             return False
     
+    # Human-readable parts of payment and stake addresses, and header network id
+    ADDRESS_HRPS = {
+        "mainnet": ("addr", "stake"),
+        "testnet": ("addr_test", "stake_test"),
+    }
+    NETWORK_IDS = {"mainnet": 1, "testnet": 0}
+    
+    @staticmethod
+    def _check_decoded(decoded, network: str) -> Optional[str]:
+        """Return why a decoded (hrp, payload) is not a valid address, or None"""
+        if decoded is None:
+            return "Invalid bech32 (bad characters or checksum)"
+        hrp, payload = decoded
+        if hrp not in LocalVerifier.ADDRESS_HRPS.get(network, ()):
+            return f"Invalid {network} address prefix: {hrp}"
+        if not payload:
+            return "Empty address payload"
+        # Shelley header: high nibble = address type, low nibble = network id
+        if payload[0] & 0x0F != LocalVerifier.NETWORK_IDS[network]:
+            return f"Invalid {network} network id: {payload[0] & 0x0F}"
+        # 1-byte header + one (enterprise/reward) or two (base) 28-byte credentials
+        address_type = payload[0] >> 4
+        if address_type <= 0x03 and len(payload) != 57:
+            return f"Invalid address length: {len(payload)}"
+        if address_type in (0x06, 0x07, 0x0E, 0x0F) and len(payload) != 29:
+            return f"Invalid address length: {len(payload)}"
+        return None
+    
     @staticmethod
     def verify_address_format(address: str, network: str = "mainnet") -> bool:
         """
         Verify Cardano address format
         
         Args:
-            address: Cardano address
+            address: Cardano address (addr1..., stake1..., addr_test1...)
             network: "mainnet" or "testnet"
             
         Returns:
             True if valid
         """
-        try:
-            import base58
-            
-            # Decode address
-            decoded = base58.b58decode(address)
-            
-            # Check prefix for network
-            if network == "mainnet":
-                # Mainnet prefix: 0x60 (payment) or 0x61 (stake)
-                if decoded[0] not in [0x60, 0x61]:
-                    print(f"✗ Invalid mainnet address prefix: {decoded[0]:02x}")
-                    return False
-            elif network == "testnet":
-                # Testnet prefix: 0x80 (payment) or 0x81 (stake)
-                if decoded[0] not in [0x80, 0x81]:
-                    print(f"✗ Invalid testnet address prefix: {decoded[0]:02x}")
-                    return False
-            
-            # Address should be 57 or 59 bytes
-            if len(decoded) not in [57, 59]:
-                print(f"✗ Invalid address length: {len(decoded)}")
-                return False
-            
-            print(f"✓ Address format valid ({network})")
-            return True
-        except Exception as e:
-            print(f"✗ Error: {e}")
+        error = LocalVerifier._check_decoded(bech32.decode(address), network)
+        if error:
+            print(f"✗ {error}")
             return False
+        
+        print(f"✓ Address format valid ({network})")
+        return True
+    
+    @staticmethod
+    def verify_addresses(addresses: List[str], network: str = "mainnet") -> List[bool]:
+        """
+        Verify many address formats in one call
+        
+        Args:
+            addresses: Cardano addresses
+            network: "mainnet" or "testnet"
+            
+        Returns:
+            True/False per address, in input order
+        """
+        return [
+            LocalVerifier._check_decoded(decoded, network) is None
+            for decoded in bech32.decode_many(addresses)
+        ]
     
     @staticmethod
     def verify_batch(verification_data: List[Dict]) -> Dict:
@@ -235,29 +262,50 @@ class LocalVerifier:
         Verify batch of signatures
         
         Args:
-            verification_data: List of {'message', 'signature', 'address'}
+            verification_data: List of {'message', 'signature', 'address', 'public_key'}
             
         Returns:
-            Verification results
+            Verification results (per-item True/False under 'results')
         """
         results = {
             "total": len(verification_data),
             "valid": 0,
             "invalid": 0,
-            "errors": []
+            "errors": [],
+            "results": [False] * len(verification_data)
         }
         
+        # Check all address checksums in one pass
+        address_valid = LocalVerifier.verify_addresses(
+            [item.get("address", "") for item in verification_data]
+        )
+        
+        pending = []
         for i, item in enumerate(verification_data):
-            try:
-                # Verify signature structure
-                if LocalVerifier.verify_signature_structure(item.get("signature", "")):
-                    results["valid"] += 1
-                else:
-                    results["invalid"] += 1
-                    results["errors"].append(f"Item {i}: Invalid signature")
-            except Exception as e:
-                results["invalid"] += 1
-                results["errors"].append(f"Item {i}: {str(e)}")
+            if not item.get("address"):
+                results["errors"].append(f"Item {i}: Missing address")
+            elif not address_valid[i]:
+                results["errors"].append(f"Item {i}: Invalid address")
+            else:
+                pending.append(i)
+        
+        # Ed25519 check of every signature; the public key must be the
+        # payment or stake key of the item's address
+        signatures_valid = SignatureVerifier.verify_many([
+            (verification_data[i].get("public_key"),
+             verification_data[i].get("message", ""),
+             verification_data[i].get("signature", ""))
+            for i in pending
+        ], claims=[(verification_data[i]["address"], None) for i in pending])
+        
+        for i, valid in zip(pending, signatures_valid):
+            if valid:
+                results["results"][i] = True
+            else:
+                results["errors"].append(f"Item {i}: Invalid signature or key does not match address")
+        
+        results["valid"] = sum(results["results"])
+        results["invalid"] = results["total"] - results["valid"]
         
         print(f"\n✓ Batch verification complete: {results['valid']}/{results['total']} valid")
         return results
@@ -11,6 +11,12 @@ sys.path.insert(0, os.path.dirname(__file__))
 from modules.end_user.key_generator import KeyGenerator
 from utils.bip39 import BIP39
 
+# CIP-19 test mnemonic, account 0: payment key 0/0 (CIP-19) and stake key 2/0 (cardano-address)
+TEST_MNEMONIC = "test walk nut penalty hip pave soap entry language right filter choice"
+EXPECTED_ADDRESS = "addr1vx2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzers66hrl8"
+EXPECTED_PUBLIC_KEY = "addr_vk1w0l2sr2zgfm26ztc6nl9xy8ghsk5sh6ldwemlpmp9xylzy4dtf7st80zhd"
+EXPECTED_STAKE_ADDRESS = "stake1uyevw2xnsc0pvn9t9r9c7qryfqfeerchgrlm3ea2nefr9hqxdekzz"
+
 print("[*] Testing BIP39 mnemonic generation...")
 try:
     bip39 = BIP39()
@@ -22,8 +28,13 @@ try:
     
     # Validate it
     is_valid = bip39.validate_mnemonic(mnemonic)
+    assert is_valid, "generated mnemonic failed validation"
     print(f"✓ Mnemonic validation: {is_valid}")
     
+    # A typo must fail the checksum
+    assert not bip39.validate_mnemonic(TEST_MNEMONIC.replace("choice", "chair")), "bad checksum accepted"
+    print("✓ Bad checksum rejected")
+    
 except Exception as e:
     print(f"✗ BIP39 Error: {e}")
     import traceback
@@ -42,20 +53,28 @@ try:
     # Try to generate ONE address
     print(f"✓ Generating first address from mnemonic...")
     result = kg.generate_addresses(
-        mnemonic=mnemonic,
+        mnemonic=TEST_MNEMONIC,
         account_index=0,
         address_index=0,  # Just generate 1st address
         is_external=True
     )
     
-    if result:
-        print(f"✓ SUCCESS! Address generated:")
-        print(f"  - Address: {result.get('address', 'N/A')}")
-        print(f"  - Index: {result.get('index', 'N/A')}")
-        print(f"  - Chain: {result.get('chain', 'N/A')}")
-    else:
+    if not result:
         print(f"✗ Result is None - likely issue with cardano-address tool")
         sys.exit(1)
+    
+    address_info = result["address_info"]
+    print(f"✓ SUCCESS! Address generated:")
+    print(f"  - Address: {address_info['address']}")
+    print(f"  - Index: {address_info['index']}")
+    print(f"  - Chain: {address_info['chain']}")
+    print(f"  - Stake: {result['stake_address']}")
+    
+    assert address_info["address"] == EXPECTED_ADDRESS, f"address mismatch: {address_info['address']}"
+    assert address_info["public_key"] == EXPECTED_PUBLIC_KEY, f"public key mismatch: {address_info['public_key']}"
+    assert (address_info["index"], address_info["chain"]) == (0, "external")
+    assert result["stake_address"] == EXPECTED_STAKE_ADDRESS, f"stake address mismatch: {result['stake_address']}"
+    print("✓ Keys match the published test vectors")
         
 except Exception as e:
     print(f"✗ KeyGenerator Error: {e}")
@@ -0,0 +1,11 @@
+"""
+Test setup: import app packages the way the app's entry points do
+(utils.* and modules.* from the app directory, shared.* from modules/)
+"""
+import os
+import sys
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, os.path.join(APP_DIR, "modules"))
+sys.path.insert(0, APP_DIR)
@@ -0,0 +1,100 @@
+"""
+Bech32 codec against the BIP173 / BIP350 test vectors and CIP-19 addresses
+"""
+import pytest
+
+from utils import bech32
+
+
+# BIP173 valid checksums
+VALID_BECH32 = [
+    "A12UEL5L",
+    "a12uel5l",
+    "an83characterlonghumanreadablepartthatcontainsthenumber1andtheexcludedcharactersbio1tt5tgs",
+    "abcdef1qpzry9x8gf2tvdw0s3jn54khce6mua7lmqqqxw",
+    "11" + "q" * 82 + "c8247j",
+    "split1checkupstagehandshakeupstreamerranterredcaperred2y9e3w",
+    "?1ezyfcl",
+]
+
+# BIP350 valid checksums, except "11lll...ludsr8" whose data has non-zero
+# padding bits and so has no byte payload for decode() to return
+VALID_BECH32M = [
+    "A1LQFN3A",
+    "a1lqfn3a",
+    "an83characterlonghumanreadablepartthatcontainsthetheexcludedcharactersbioandnumber11sg7hg6",
+    "abcdef1l7aum6echk45nj3s0wdvt2fg8x9yrzpqzd3ryx",
+    "split1checkupstagehandshakeupstreamerranterredcaperredlc445v",
+    "?1v759aa",
+]
+
+# BIP173 invalid strings. Omitted: the 90-character limit vector, since
+# Cardano addresses and keys are longer than 90 characters.
+INVALID_BECH32 = [
+    "\x201nwldj5",      # hrp character out of range
+    "\x7f1axkwrx",      # hrp character out of range
+    "\x801eym55h",      # hrp character out of range
+    "pzry9x0s0muk",     # no separator
+    "1pzry9x0s0muk",    # empty hrp
+    "x1b4n0q5v",        # invalid data character
+    "li1dgmt3",         # checksum too short
+    "de1lg7wt\xff",     # invalid character in checksum
+    "A1G7SGD8",         # checksum computed with uppercase hrp
+    "10a06t8",          # empty hrp
+    "1qzzfhee",         # empty hrp
+]
+
+# CIP-19 mainnet enterprise address: header 0x61 + payment key hash
+ADDRESS = "addr1vx2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzers66hrl8"
+PAYLOAD = bytes.fromhex("619493315cd92eb5d8c4304e67b7e16ae36d61d34502694657811a2c8e")
+
+
+@pytest.mark.parametrize("bech", VALID_BECH32)
+def test_valid_bech32(bech):
+    decoded = bech32.decode(bech)
+    assert decoded is not None
+    assert bech32.encode(*decoded) == bech.lower()
+    assert bech32.decode(bech, bech32.BECH32M) is None
+
+
+@pytest.mark.parametrize("bech", VALID_BECH32M)
+def test_valid_bech32m(bech):
+    decoded = bech32.decode(bech, bech32.BECH32M)
+    assert decoded is not None
+    assert bech32.encode(*decoded, spec=bech32.BECH32M) == bech.lower()
+    assert bech32.decode(bech) is None
+
+
+@pytest.mark.parametrize("bech", INVALID_BECH32)
+def test_invalid_bech32(bech):
+    assert bech32.decode(bech) is None
+    assert not bech32.is_valid(bech)
+
+
+def test_cardano_address_round_trip():
+    assert bech32.decode(ADDRESS) == ("addr", PAYLOAD)
+    assert bech32.encode("addr", PAYLOAD) == ADDRESS
+
+
+def test_single_character_error_is_detected():
+    broken = ADDRESS[:10] + ("q" if ADDRESS[10] != "q" else "p") + ADDRESS[11:]
+    assert bech32.decode(broken) is None
+
+
+def test_hrp_filter():
+    assert bech32.is_valid(ADDRESS, ["addr", "addr_test"])
+    assert not bech32.is_valid(ADDRESS, ["stake"])
+
+
+def test_batch_matches_single():
+    bechs = VALID_BECH32 + INVALID_BECH32 + [ADDRESS]
+    assert bech32.decode_many(bechs) == [bech32.decode(bech) for bech in bechs]
+    assert bech32.validate_many(bechs) == [bech32.is_valid(bech) for bech in bechs]
+    assert bech32.encode_many("addr", [PAYLOAD, PAYLOAD]) == [ADDRESS, ADDRESS]
+
+
+def test_hrp_state_cache_is_bounded():
+    for i in range(1000):
+        bech32.decode(f"x{i}1qqqqqqqq")
+    info = bech32._hrp_state.cache_info()
+    assert info.currsize <= info.maxsize
@@ -0,0 +1,77 @@
+"""
+BIP39 entropy / mnemonic conversion against the reference (Trezor) vectors
+"""
+import pytest
+
+from utils.bip39 import BIP39
+
+
+# python-mnemonic vectors.json (English): (entropy, mnemonic)
+REFERENCE_VECTORS = [
+    ("00000000000000000000000000000000",
+     "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"),
+    ("7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f",
+     "legal winner thank year wave sausage worth useful legal winner thank yellow"),
+    ("80808080808080808080808080808080",
+     "letter advice cage absurd amount doctor acoustic avoid letter advice cage above"),
+    ("ffffffffffffffffffffffffffffffff",
+     "zoo zoo zoo zoo zoo zoo zoo zoo zoo zoo zoo wrong"),
+    ("000000000000000000000000000000000000000000000000",
+     " ".join(["abandon"] * 17 + ["agent"])),
+    ("0000000000000000000000000000000000000000000000000000000000000000",
+     " ".join(["abandon"] * 23 + ["art"])),
+    ("ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff",
+     " ".join(["zoo"] * 23 + ["vote"])),
+    ("9e885d952ad362caeb4efe34a8e91bd2",
+     "ozone drill grab fiber curtain grace pudding thank cruise elder eight picnic"),
+    ("68a79eaca2324873eacc50cb9c6eca8cc68ea5d936f98787c60c7ebc74e6ce7c",
+     "hamster diagram private dutch cause delay private meat slide toddler razor book happy fancy gospel "
+     "tennis maple dilemma loan word shrug inflict delay length"),
+]
+
+
+@pytest.mark.parametrize("entropy,mnemonic", REFERENCE_VECTORS)
+def test_entropy_to_mnemonic(entropy, mnemonic):
+    assert BIP39.entropy_to_mnemonic(bytes.fromhex(entropy)) == mnemonic
+
+
+@pytest.mark.parametrize("entropy,mnemonic", REFERENCE_VECTORS)
+def test_mnemonic_to_entropy(entropy, mnemonic):
+    assert BIP39.mnemonic_to_entropy(mnemonic) == bytes.fromhex(entropy)
+    assert BIP39.validate_checksum(mnemonic)
+
+
+@pytest.mark.parametrize("mnemonic", [
+    " ".join(["abandon"] * 12),                             # checksum mismatch
+    " ".join(["zoo"] * 12),                                 # checksum mismatch
+    REFERENCE_VECTORS[1][1].replace("legal", "legel", 1),   # unknown word
+    " ".join(["abandon"] * 10 + ["about"]),                 # 11 words
+])
+def test_invalid_mnemonics(mnemonic):
+    assert BIP39.mnemonic_to_entropy(mnemonic) is None
+    assert not BIP39.validate_checksum(mnemonic)
+    assert not BIP39.validate_mnemonic(mnemonic)
+
+
+def test_validate_mnemonic_checks_checksum():
+    mnemonic = REFERENCE_VECTORS[7][1]
+    assert BIP39.validate_mnemonic(mnemonic)
+    assert BIP39.validate_mnemonic("  " + mnemonic.upper() + " ")
+    assert not BIP39.validate_mnemonic(mnemonic.replace("picnic", "pizza"))
+    assert not BIP39.validate_mnemonic("")
+
+
+def test_invalid_entropy_length():
+    assert BIP39.entropy_to_mnemonic(bytes(15)) is None
+
+
+@pytest.mark.parametrize("word_count", [12, 15, 24])
+def test_generated_mnemonics_are_valid(word_count):
+    mnemonic = BIP39.generate_mnemonic(word_count)
+    assert len(mnemonic.split()) == word_count
+    assert BIP39.validate_mnemonic(mnemonic)
+
+
+def test_batch_matches_single():
+    mnemonics = [mnemonic for _, mnemonic in REFERENCE_VECTORS] + [" ".join(["abandon"] * 12)]
+    assert BIP39.validate_batch(mnemonics) == [True] * len(REFERENCE_VECTORS) + [False]
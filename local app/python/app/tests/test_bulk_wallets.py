@@ -0,0 +1,70 @@
+"""
+Bulk wallet pipeline: resume after an interrupted run
+"""
+import json
+
+import pytest
+
+from utils.bip39 import BIP39
+from utils.bulk_wallets import BulkWalletPipeline, mnemonic_fingerprint
+from utils.derivation_pool import DerivationPool
+
+
+LINES = 12
+
+
+@pytest.fixture
+def pipeline():
+    pipeline = BulkWalletPipeline(workers=2)
+    # Small window, so most lines are read after the first results come back
+    pipeline.IN_FLIGHT_PER_WORKER = 1
+    yield pipeline
+    DerivationPool.shared().shutdown()
+
+
+@pytest.fixture
+def input_file(tmp_path):
+    path = tmp_path / "mnemonics.txt"
+    path.write_text("\n".join(BIP39.entropy_to_mnemonic(bytes([i]) * 16) for i in range(LINES)) + "\n")
+    return str(path)
+
+
+def read_records(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_resume_skips_finished_lines(pipeline, input_file, tmp_path):
+    output_file = str(tmp_path / "wallets.jsonl")
+    assert pipeline.run(input_file, output_file, resume=False)["succeeded"] == LINES
+
+    # Interrupted run: the first 4 records were never written
+    records = read_records(output_file)
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.writelines(json.dumps(record) + "\n" for record in records[4:])
+
+    summary = pipeline.run(input_file, output_file)
+    assert (summary["succeeded"], summary["skipped"]) == (4, LINES - 4)
+    lines = [record["line"] for record in read_records(output_file)]
+    assert sorted(lines) == list(range(1, LINES + 1))
+
+
+def test_resume_drops_partial_record_and_rederives_changed_lines(pipeline, input_file, tmp_path):
+    output_file = str(tmp_path / "wallets.jsonl")
+    pipeline.run(input_file, output_file, resume=False)
+    with open(output_file, "a", encoding="utf-8") as f:
+        f.write('{"line": 3, "finger')
+
+    # Swap the first two mnemonics: both lines changed since the last run
+    with open(input_file, encoding="utf-8") as f:
+        mnemonics = f.read().splitlines()
+    mnemonics[0], mnemonics[1] = mnemonics[1], mnemonics[0]
+    with open(input_file, "w", encoding="utf-8") as f:
+        f.write("\n".join(mnemonics) + "\n")
+
+    summary = pipeline.run(input_file, output_file)
+    assert (summary["succeeded"], summary["skipped"]) == (2, LINES - 2)
+    records = read_records(output_file)
+    assert len(records) == LINES + 2
+    done = BulkWalletPipeline.completed_lines(output_file)
+    assert done == {i: mnemonic_fingerprint(m) for i, m in enumerate(mnemonics, 1)}
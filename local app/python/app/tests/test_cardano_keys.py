@@ -0,0 +1,79 @@
+"""
+In-process key derivation against CIP-3 (Icarus) and CIP-1852/CIP-19 vectors
+"""
+import pytest
+
+from utils import bech32
+from utils.cardano_keys import HARDENED, CardanoKeyDeriver
+
+
+# CIP-3 Icarus master key generation test vectors
+ICARUS_MNEMONIC = "eight country switch draw meat scout mystery blade tip drift useless good keep usage title"
+ICARUS_ROOTS = [
+    ("", "c065afd2832cd8b087c4d9ab7011f481ee1e0721e78ea5dd609f3ab3f156d245"
+         "d176bd8fd4ec60b4731c3918a2a72a0226c0cd119ec35b47e4d55884667f552a"
+         "23f7fdcd4a10c6cd2c7393ac61d877873e248f417634aa3d812af327ffe9d620"),
+    ("foo", "70531039904019351e1afb361cd1b312a4d0565d4ff9f8062d38acf4b15cce41"
+            "d7b5738d9c893feea55512a3004acb0d222c35d3e3d5cde943a15a9824cbac59"
+            "443cf67e589614076ba01e354b1a432e0e6db3b59e37fc56b5fb0222970a010e"),
+]
+
+# CIP-19 test mnemonic; payment key 1852H/1815H/0H/0/0 is the CIP-19 addr_vk
+CIP19_MNEMONIC = "test walk nut penalty hip pave soap entry language right filter choice"
+PAYMENT_VK = "addr_vk1w0l2sr2zgfm26ztc6nl9xy8ghsk5sh6ldwemlpmp9xylzy4dtf7st80zhd"
+ENTERPRISE = "addr1vx2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzers66hrl8"
+ENTERPRISE_TEST = "addr_test1vz2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzerspjrlsz"
+
+# cardano-address README: stake key 1852H/1815H/0H/2/0 of the same mnemonic
+STAKE_TEST = "stake_test1uqevw2xnsc0pvn9t9r9c7qryfqfeerchgrlm3ea2nefr9hqp8n5xl"
+BASE_TEST = ("addr_test1qz2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzer3jcu5d8ps7zex2k2xt3uqxgjqnnj83ws8lhrn"
+             "648jjxtwq2ytjqp")
+
+
+@pytest.fixture(scope="module")
+def account():
+    root = CardanoKeyDeriver.root_key_from_mnemonic(CIP19_MNEMONIC)
+    return CardanoKeyDeriver.derive_path(root, "1852H/1815H/0H")
+
+
+@pytest.mark.parametrize("passphrase,root_hex", ICARUS_ROOTS)
+def test_icarus_root_key(passphrase, root_hex):
+    assert CardanoKeyDeriver.root_key_from_mnemonic(ICARUS_MNEMONIC, passphrase).hex() == root_hex
+
+
+def test_invalid_mnemonic_has_no_root_key():
+    assert CardanoKeyDeriver.root_key_from_mnemonic(CIP19_MNEMONIC.replace("choice", "chair")) is None
+
+
+def test_payment_key(account):
+    public_key = CardanoKeyDeriver.public_key(CardanoKeyDeriver.derive_path(account, "0/0"))
+    assert bech32.encode("addr_vk", public_key) == PAYMENT_VK
+
+
+def test_enterprise_address(account):
+    public_key = CardanoKeyDeriver.public_key(CardanoKeyDeriver.derive_path(account, "0/0"))
+    assert CardanoKeyDeriver.enterprise_address(public_key) == ENTERPRISE
+    assert CardanoKeyDeriver.enterprise_address(public_key, "testnet") == ENTERPRISE_TEST
+
+
+def test_stake_and_base_address(account):
+    payment = CardanoKeyDeriver.public_key(CardanoKeyDeriver.derive_path(account, "0/0"))
+    stake = CardanoKeyDeriver.public_key(CardanoKeyDeriver.derive_path(account, "2/0"))
+    assert CardanoKeyDeriver.stake_address(stake, "testnet") == STAKE_TEST
+    assert CardanoKeyDeriver.base_address(payment, stake, "testnet") == BASE_TEST
+
+
+def test_full_path_matches_step_by_step(account):
+    root = CardanoKeyDeriver.root_key_from_mnemonic(CIP19_MNEMONIC)
+    assert CardanoKeyDeriver.derive_path(root, "m/1852'/1815'/0'/0/0") == \
+        CardanoKeyDeriver.derive_path(account, "0/0")
+
+
+@pytest.mark.parametrize("path,indices", [
+    ("1852H/1815H/0H", [1852 + HARDENED, 1815 + HARDENED, HARDENED]),
+    ("m/1852'/1815'/0'/2/0", [1852 + HARDENED, 1815 + HARDENED, HARDENED, 2, 0]),
+    ("0/x", None),
+    ("2147483648", None),
+])
+def test_parse_path(path, indices):
+    assert CardanoKeyDeriver.parse_path(path) == indices
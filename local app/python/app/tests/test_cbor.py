@@ -0,0 +1,73 @@
+"""
+CBOR codec: RFC 8949 appendix A examples and malformed input
+"""
+import pytest
+
+from utils import cbor
+
+
+# RFC 8949 appendix A: (encoded hex, decoded value)
+EXAMPLES = [
+    ("00", 0),
+    ("17", 23),
+    ("1818", 24),
+    ("1903e8", 1000),
+    ("1b000000e8d4a51000", 1000000000000),
+    ("20", -1),
+    ("3903e7", -1000),
+    ("f4", False),
+    ("f5", True),
+    ("f6", None),
+    ("40", b""),
+    ("4401020304", b"\x01\x02\x03\x04"),
+    ("6449455446", "IETF"),
+    ("83010203", [1, 2, 3]),
+    ("a201020304", {1: 2, 3: 4}),
+    ("a26161016162820203", {"a": 1, "b": [2, 3]}),
+]
+
+# Indefinite-length examples: same values, not re-encoded
+INDEFINITE = [
+    ("5f42010243030405ff", b"\x01\x02\x03\x04\x05"),
+    ("7f657374726561646d696e67ff", "streaming"),
+    ("9f018202039f0405ffff", [1, [2, 3], [4, 5]]),
+    ("bf61610161629f0203ffff", {"a": 1, "b": [2, 3]}),
+]
+
+MALFORMED = [
+    "1f",           # indefinite-length unsigned integer
+    "3f",           # indefinite-length negative integer
+    "df00",         # indefinite-length tag
+    "1c",           # reserved additional info
+    "ff",           # break outside an indefinite item
+    "8201",         # array shorter than its length
+    "5f01ff",       # integer chunk in an indefinite byte string
+    "a182010201",   # array as map key
+    "bf01ffff",     # break as map value
+    "0000",         # trailing data
+]
+
+
+def decoded(value):
+    return bytes(value) if isinstance(value, memoryview) else value
+
+
+@pytest.mark.parametrize("encoded,value", EXAMPLES)
+def test_decode_examples(encoded, value):
+    assert decoded(cbor.loads(bytes.fromhex(encoded))) == value
+
+
+@pytest.mark.parametrize("encoded,value", EXAMPLES)
+def test_encode_examples(encoded, value):
+    assert cbor.dumps(value).hex() == encoded
+
+
+@pytest.mark.parametrize("encoded,value", INDEFINITE)
+def test_decode_indefinite(encoded, value):
+    assert decoded(cbor.loads(bytes.fromhex(encoded))) == value
+
+
+@pytest.mark.parametrize("encoded", MALFORMED)
+def test_malformed_input_is_rejected(encoded):
+    with pytest.raises(ValueError):
+        cbor.loads(bytes.fromhex(encoded))
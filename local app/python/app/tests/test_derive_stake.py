@@ -0,0 +1,69 @@
+"""
+Stake address extraction against the CIP-19 test vectors
+"""
+import pytest
+
+from shared.derive_stake import StakeAddressDeriver
+
+
+# CIP-19 test vectors: payment key hash 9493315c..., script hash c37b1b5d...,
+# stake key hash 337b62cf...
+STAKE_KEY = "stake1uyehkck0lajq8gr28t9uxnuvgcqrc6070x3k9r8048z8y5gh6ffgw"
+STAKE_SCRIPT = "stake178phkx6acpnf78fuvxn0mkew3l0fd058hzquvz7w36x4gtcccycj5"
+
+BASE_ADDRESSES = [
+    # type 0: key payment, key stake
+    ("addr1qx2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzer3n0d3vllmyqwsx5wktcd8cc3sq835lu7drv2xwl2wywfgse35a3x",
+     STAKE_KEY),
+    # type 1: script payment, key stake
+    ("addr1z8phkx6acpnf78fuvxn0mkew3l0fd058hzquvz7w36x4gten0d3vllmyqwsx5wktcd8cc3sq835lu7drv2xwl2wywfgs9yc0hh",
+     STAKE_KEY),
+    # type 2: key payment, script stake
+    ("addr1yx2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzerkr0vd4msrxnuwnccdxlhdjar77j6lg0wypcc9uar5d2shs2z78ve",
+     STAKE_SCRIPT),
+    # type 3: script payment, script stake
+    ("addr1x8phkx6acpnf78fuvxn0mkew3l0fd058hzquvz7w36x4gt7r0vd4msrxnuwnccdxlhdjar77j6lg0wypcc9uar5d2shskhj42g",
+     STAKE_SCRIPT),
+]
+
+NO_STAKE_CREDENTIAL = [
+    "addr1gx2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzer5pnz75xxcrzqf96k",
+    "addr128phkx6acpnf78fuvxn0mkew3l0fd058hzquvz7w36x4gtupnz75xxcrtw79hu",
+    "addr1vx2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzers66hrl8",
+    "addr1w8phkx6acpnf78fuvxn0mkew3l0fd058hzquvz7w36x4gtcyjy7wx",
+]
+
+
+@pytest.mark.parametrize("address,stake_address", BASE_ADDRESSES)
+def test_base_address_stake_credential(address, stake_address):
+    assert StakeAddressDeriver.get_stake_address(address) == stake_address
+
+
+@pytest.mark.parametrize("address", NO_STAKE_CREDENTIAL)
+def test_pointer_and_enterprise_addresses_have_no_stake_address(address):
+    assert StakeAddressDeriver.get_stake_address(address) is None
+
+
+@pytest.mark.parametrize("stake_address", [STAKE_KEY, STAKE_SCRIPT])
+def test_reward_address_maps_to_itself(stake_address):
+    assert StakeAddressDeriver.get_stake_address(stake_address) == stake_address
+
+
+def test_testnet_base_address():
+    address = ("addr_test1qz2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzer3n0d3vllmyqwsx5wktcd8cc3sq835lu7"
+               "drv2xwl2wywfgs68faae")
+    assert StakeAddressDeriver.get_stake_address(address) == \
+        "stake_test1uqehkck0lajq8gr28t9uxnuvgcqrc6070x3k9r8048z8y5gssrtvn"
+
+
+def test_batch_matches_single():
+    addresses = [address for address, _ in BASE_ADDRESSES] + NO_STAKE_CREDENTIAL + ["addr1invalid"]
+    expected = {address: stake for address, stake in BASE_ADDRESSES}
+    expected.update({address: None for address in NO_STAKE_CREDENTIAL + ["addr1invalid"]})
+    assert StakeAddressDeriver.get_stake_addresses(addresses) == expected
+
+
+def test_group_by_stake_address():
+    groups = StakeAddressDeriver.group_by_stake_address([address for address, _ in BASE_ADDRESSES])
+    assert sorted(groups) == sorted([STAKE_KEY, STAKE_SCRIPT])
+    assert len(groups[STAKE_KEY]) == 2 and len(groups[STAKE_SCRIPT]) == 2
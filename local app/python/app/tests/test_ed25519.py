@@ -0,0 +1,96 @@
+"""
+Ed25519 signing and verification against the RFC 8032 section 7.1 vectors
+"""
+import pytest
+
+from utils import ed25519
+from utils.cardano_keys import CardanoKeyDeriver
+from utils.message_signer import MessageSigner
+
+
+# RFC 8032 section 7.1, TEST 1-3: (secret key, public key, message, signature)
+RFC8032_VECTORS = [
+    ("9d61b19deffd5a60ba844af492ec2cc44449c5697b326919703bac031cae7f60",
+     "d75a980182b10ab7d54bfed3c964073a0ee172f3daa62325af021a68f707511a",
+     "",
+     "e5564300c360ac729086e2cc806e828a84877f1eb8e5d974d873e065224901555"
+     "fb8821590a33bacc61e39701cf9b46bd25bf5f0595bbe24655141438e7a100b"),
+    ("4ccd089b28ff96da9db6c346ec114e0f5b8a319f35aba624da8cf6ed4fb8a6fb",
+     "3d4017c3e843895a92b70aa74d1b7ebc9c982ccf2ec4968cc0cd55f12af4660c",
+     "72",
+     "92a009a9f0d4cab8720e820b5f642540a2b27b5416503f8fb3762223ebdb69da"
+     "085ac1e43e15996e458f3613d0f11d8c387b2eaeb4302aeeb00d291612bb0c00"),
+    ("c5aa8df43f9f837bedb7442f31dcb7b166d38535076f094b85ce3a2e0b4458f7",
+     "fc51cd8e6218a1a38da47ed00230f0580816ed13ba3303ac5deb911548908025",
+     "af82",
+     "6291d657deec24024827e69c3abe01a30ce548a284743a445e3680d7db5ac3ac"
+     "18ff9b538d16f290ae67f760984dc6594a7c15e9716ed28dc027beceea1ec40a"),
+]
+VECTORS = [tuple(bytes.fromhex(field) for field in vector) for vector in RFC8032_VECTORS]
+
+# Group order L
+L = 2 ** 252 + 27742317777372353535851937790883648493
+
+
+@pytest.mark.parametrize("seed,public_key,message,signature", VECTORS)
+def test_public_key(seed, public_key, message, signature):
+    assert ed25519.public_key_from_scalar(ed25519.expand_seed(seed)) == public_key
+
+
+@pytest.mark.parametrize("seed,public_key,message,signature", VECTORS)
+def test_sign(seed, public_key, message, signature):
+    assert ed25519.sign(seed, message) == signature
+
+
+@pytest.mark.parametrize("seed,public_key,message,signature", VECTORS)
+def test_verify(seed, public_key, message, signature):
+    assert ed25519.verify(public_key, message, signature)
+    assert not ed25519.verify(public_key, message + b"x", signature)
+    assert not ed25519.verify(public_key, message, signature[:63] + bytes([signature[63] ^ 1]))
+
+
+@pytest.mark.parametrize("seed,public_key,message,signature", VECTORS)
+def test_message_signer_matches_rfc(seed, public_key, message, signature):
+    signer = MessageSigner(seed)
+    assert signer.public_key == public_key
+    assert signer.sign_hex(message) == f"{signature.hex()} {public_key.hex()}"
+
+
+def test_non_canonical_s_is_rejected():
+    _, public_key, message, signature = VECTORS[0]
+    s = int.from_bytes(signature[32:], "little") + L
+    assert not ed25519.verify(public_key, message, signature[:32] + s.to_bytes(32, "little"))
+
+
+def test_malformed_inputs_are_rejected():
+    _, public_key, message, signature = VECTORS[1]
+    assert not ed25519.verify(public_key[:31], message, signature)
+    assert not ed25519.verify(public_key, message, signature[:63])
+
+
+def test_batch_matches_single():
+    _, public_key, message, signature = VECTORS[2]
+    items = [(v[1], v[2], v[3]) for v in VECTORS] + [(public_key, message + b"x", signature)]
+    assert ed25519.verify_batch(items) == [True, True, True, False]
+    assert ed25519.verify_batch([]) == []
+
+
+def test_extended_key_signature():
+    # BIP32-Ed25519 keys sign with kL || kR directly (CIP-19 payment key)
+    root = CardanoKeyDeriver.root_key_from_mnemonic(
+        "test walk nut penalty hip pave soap entry language right filter choice")
+    xprv = CardanoKeyDeriver.derive_path(root, "1852H/1815H/0H/0/0")
+    public_key = CardanoKeyDeriver.public_key(xprv)
+    signature = MessageSigner(xprv).sign("hello")
+    assert ed25519.verify(public_key, b"hello", signature)
+    assert ed25519.sign_extended(xprv, b"hello") == signature
+
+
+@pytest.mark.parametrize("scalar", [1, 16, 2 ** 200, L - 1, 0x0f0f0f0f])
+def test_secret_base_mult_runs_fixed_steps(scalar, monkeypatch):
+    expected = ed25519._encode_point(ed25519._scalar_mult_base_vartime(scalar))
+    calls = []
+    add = ed25519._point_add
+    monkeypatch.setattr(ed25519, "_point_add", lambda p1, p2: calls.append(1) or add(p1, p2))
+    assert ed25519._encode_point(ed25519._scalar_mult_base(scalar)) == expected
+    assert len(calls) == 64
@@ -0,0 +1,77 @@
+"""
+Key store: cached signers are wiped on invalidation and refuse to sign
+"""
+import json
+import os
+
+import pytest
+
+from utils import ed25519
+from utils.key_store import KeyStore
+
+
+# RFC 8032 section 7.1 TEST 1 and TEST 2 secret keys
+SEEDS = [
+    bytes.fromhex("9d61b19deffd5a60ba844af492ec2cc44449c5697b326919703bac031cae7f60"),
+    bytes.fromhex("4ccd089b28ff96da9db6c346ec114e0f5b8a319f35aba624da8cf6ed4fb8a6fb"),
+]
+
+
+def write_skey(path, seed):
+    path.write_text(json.dumps({
+        "type": "PaymentSigningKeyShelley_ed25519",
+        "description": "Payment Signing Key",
+        "cborHex": "5820" + seed.hex(),
+    }))
+    return str(path)
+
+
+@pytest.fixture
+def skey_files(tmp_path):
+    return [write_skey(tmp_path / f"key{i}.skey", seed) for i, seed in enumerate(SEEDS)]
+
+
+def test_sign_after_invalidate_raises(skey_files):
+    store = KeyStore()
+    signer = store.get(skey_files[0])
+    assert signer.sign(b"") == ed25519.sign(SEEDS[0], b"")
+
+    store.invalidate(skey_files[0])
+    assert signer.wiped
+    with pytest.raises(ValueError):
+        signer.sign(b"")
+    with pytest.raises(ValueError):
+        signer.sign_hex("message")
+
+    # A fresh get() loads the key again
+    assert store.get(skey_files[0]).sign(b"") == ed25519.sign(SEEDS[0], b"")
+
+
+def test_evicted_signer_refuses_to_sign(skey_files):
+    store = KeyStore(max_entries=1)
+    first = store.get(skey_files[0])
+    second = store.get(skey_files[1])
+    with pytest.raises(ValueError):
+        first.sign(b"x")
+    assert second.sign(b"x") == ed25519.sign(SEEDS[1], b"x")
+
+
+def test_replaced_file_wipes_old_signer(skey_files, tmp_path):
+    store = KeyStore()
+    old = store.get(skey_files[0])
+    write_skey(tmp_path / "key0.skey", SEEDS[1])
+    # Same size as before; make sure the mtime differs too
+    os.utime(skey_files[0], ns=(0, 0))
+    new = store.get(skey_files[0])
+    assert new is not old
+    with pytest.raises(ValueError):
+        old.sign(b"")
+    assert new.sign(b"") == ed25519.sign(SEEDS[1], b"")
+
+
+def test_clear_wipes_all(skey_files):
+    store = KeyStore()
+    signers = [store.get(path) for path in skey_files]
+    store.clear()
+    assert len(store) == 0
+    assert all(signer.wiped for signer in signers)
@@ -0,0 +1,105 @@
+"""
+Signature verification bound to the claimed address and stake address
+"""
+import pytest
+
+from modules.admin.GenerateChallenge import generate_signing_challenge
+from modules.admin.VerifySignature import verify_user_signature, verify_user_signatures
+from utils.cardano_keys import CardanoKeyDeriver
+from utils.message_signer import MessageSigner
+from utils.signature_verifier import SignatureVerifier
+
+
+MNEMONIC = "test walk nut penalty hip pave soap entry language right filter choice"
+# CIP-19 stake address whose key is not derived from MNEMONIC
+OTHER_STAKE = "stake1uyehkck0lajq8gr28t9uxnuvgcqrc6070x3k9r8048z8y5gh6ffgw"
+
+
+@pytest.fixture(scope="module")
+def wallet():
+    account = CardanoKeyDeriver.derive_path(
+        CardanoKeyDeriver.root_key_from_mnemonic(MNEMONIC), "1852H/1815H/0H")
+    payment = CardanoKeyDeriver.derive_path(account, "0/0")
+    stake = CardanoKeyDeriver.derive_path(account, "2/0")
+    payment_public = CardanoKeyDeriver.public_key(payment)
+    stake_public = CardanoKeyDeriver.public_key(stake)
+    return {
+        "payment_signer": MessageSigner(payment),
+        "stake_signer": MessageSigner(stake),
+        "address": CardanoKeyDeriver.base_address(payment_public, stake_public),
+        "enterprise": CardanoKeyDeriver.enterprise_address(payment_public),
+        "stake_address": CardanoKeyDeriver.stake_address(stake_public),
+    }
+
+
+@pytest.fixture
+def challenge():
+    return generate_signing_challenge()
+
+
+def submission(signer, challenge, address, stake_address=None):
+    return {
+        "challenge_id": challenge["challenge_id"],
+        "signature": signer.sign_hex(challenge["message"]),
+        "address": address,
+        "stake_address": stake_address,
+    }
+
+
+def test_payment_key_with_stake_address(wallet, challenge):
+    data = submission(wallet["payment_signer"], challenge, wallet["address"], wallet["stake_address"])
+    assert verify_user_signature(challenge, data)
+
+
+def test_stake_key_with_stake_address(wallet, challenge):
+    data = submission(wallet["stake_signer"], challenge, wallet["address"], wallet["stake_address"])
+    assert verify_user_signature(challenge, data)
+
+
+def test_payment_key_without_stake_address(wallet, challenge):
+    assert verify_user_signature(challenge, submission(wallet["payment_signer"], challenge, wallet["address"]))
+    assert verify_user_signature(challenge, submission(wallet["payment_signer"], challenge, wallet["enterprise"]))
+
+
+def test_stake_address_of_another_wallet_is_rejected(wallet, challenge):
+    data = submission(wallet["payment_signer"], challenge, wallet["address"], OTHER_STAKE)
+    assert not verify_user_signature(challenge, data)
+
+
+def test_stake_address_not_in_address_is_rejected(wallet, challenge):
+    # An enterprise address carries no stake credential to match
+    data = submission(wallet["payment_signer"], challenge, wallet["enterprise"], wallet["stake_address"])
+    assert not verify_user_signature(challenge, data)
+
+
+def test_key_of_another_address_is_rejected(wallet, challenge):
+    assert not verify_user_signature(challenge, submission(wallet["stake_signer"], challenge, wallet["enterprise"]))
+    other = CardanoKeyDeriver.derive_path(
+        CardanoKeyDeriver.root_key_from_mnemonic(MNEMONIC), "1852H/1815H/0H/0/1")
+    assert not verify_user_signature(challenge, submission(MessageSigner(other), challenge, wallet["address"]))
+
+
+def test_submitted_message_is_ignored(wallet, challenge):
+    data = submission(wallet["payment_signer"], challenge, wallet["address"])
+    data["signature"] = wallet["payment_signer"].sign_hex("something else")
+    data["message"] = "something else"
+    assert not verify_user_signature(challenge, data)
+
+
+def test_batch_matches_single(wallet, challenge):
+    submissions = [
+        submission(wallet["payment_signer"], challenge, wallet["address"], wallet["stake_address"]),
+        submission(wallet["stake_signer"], challenge, wallet["address"], wallet["stake_address"]),
+        submission(wallet["payment_signer"], challenge, wallet["address"], OTHER_STAKE),
+        submission(wallet["stake_signer"], challenge, wallet["enterprise"]),
+    ]
+    assert verify_user_signatures(challenge, submissions) == [True, True, False, False]
+
+
+def test_credentials(wallet):
+    payment_hash = CardanoKeyDeriver.key_hash(wallet["payment_signer"].public_key)
+    stake_hash = CardanoKeyDeriver.key_hash(wallet["stake_signer"].public_key)
+    assert SignatureVerifier.credentials(wallet["address"]) == (payment_hash, (False, stake_hash))
+    assert SignatureVerifier.credentials(wallet["enterprise"]) == (payment_hash, None)
+    assert SignatureVerifier.credentials(wallet["stake_address"]) == (None, (False, stake_hash))
+    assert SignatureVerifier.credentials("addr1invalid") == (None, None)
@@ -0,0 +1,55 @@
+"""
+Tool registry: failed lookups expire, version mismatches are not cached
+"""
+import os
+import stat
+
+import pytest
+
+from utils.tool_registry import ToolRegistry
+
+
+TOOL = "cardano-signer"
+
+
+@pytest.fixture
+def tool_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("CARDANO_SIGNER_PATH", str(tmp_path))
+    monkeypatch.delenv("CARDANO_SIGNER_VERSION", raising=False)
+    monkeypatch.delenv(ToolRegistry.CONFIG_ENV, raising=False)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("PATH", str(tmp_path / "empty"))
+    ToolRegistry.refresh()
+    yield tmp_path
+    ToolRegistry.refresh()
+
+
+def install(tool_dir, version):
+    exe = tool_dir / TOOL
+    exe.write_text(f"#!/bin/sh\necho 'cardano-signer {version}'\n")
+    exe.chmod(exe.stat().st_mode | stat.S_IXUSR)
+    return str(exe)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="shell script stand-in for the tool")
+def test_tool_installed_after_failed_lookup_is_found(tool_dir, monkeypatch):
+    assert ToolRegistry.resolve(TOOL) is None
+    exe = install(tool_dir, "1.0.0")
+    # The miss is remembered for MISS_TTL seconds only
+    assert ToolRegistry.resolve(TOOL) is None
+    monkeypatch.setattr(ToolRegistry, "MISS_TTL", 0.0)
+    assert ToolRegistry.resolve(TOOL) == exe
+    assert ToolRegistry.validate(TOOL)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="shell script stand-in for the tool")
+def test_version_mismatch_is_not_valid(tool_dir, monkeypatch):
+    exe = install(tool_dir, "1.0.0")
+    monkeypatch.setenv("CARDANO_SIGNER_VERSION", "2.0.0")
+    assert ToolRegistry.resolve(TOOL) == exe
+    assert not ToolRegistry.validate(TOOL)
+
+    # Dropped from the cache: the upgraded tool is picked up
+    install(tool_dir, "2.0.0")
+    assert ToolRegistry.validate(TOOL)
+    assert ToolRegistry.get_version(TOOL) == "cardano-signer 2.0.0"
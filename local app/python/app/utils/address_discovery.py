@@ -0,0 +1,156 @@
+"""
+Address Discovery: Gap-limit scan for a wallet's used addresses
+Derive external/internal chains in batches and check usage in bulk
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from utils.address_generator import DerivationSession
+from utils.cardano_address import CardanoAddressGenerator
+from utils.derivation_pool import DerivationPool
+
+
+class AddressDiscovery:
+    """Find used addresses of an account using a gap limit
+    
+    Each chain is scanned in batches. While one batch is being checked
+    on-chain, the next one is already being derived. Scanning a chain stops
+    once gap_limit consecutive addresses after the last used one are unused.
+    
+    Wallets receive funds at base addresses (payment key + the account's
+    stake key), so an index counts as used when either its base address
+    or its enterprise (payment-key-only) address has on-chain history.
+    """
+    
+    DEFAULT_GAP_LIMIT = 20
+    
+    def __init__(self, usage_checker: Callable[[List[str]], Iterable[str]],
+                 gap_limit: int = DEFAULT_GAP_LIMIT, batch_size: int = None,
+                 workers: int = 1):
+        """
+        Initialize address discovery
+        
+        Args:
+            usage_checker: Takes a list of addresses, returns those that are used
+            gap_limit: Consecutive unused addresses that end a chain
+            batch_size: Addresses derived and checked per round (default: gap_limit)
+            workers: Worker processes for derivation (1 = in this process)
+        """
+        self.usage_checker = usage_checker
+        self.gap_limit = gap_limit
+        self.batch_size = batch_size or gap_limit
+        self.workers = workers
+    
+    def _derive_batch(self, session: DerivationSession, start: int, is_external: bool) -> List[Dict]:
+        indices = list(range(start, start + self.batch_size))
+        if self.workers > 1:
+            batch = DerivationPool.shared(self.workers).derive_addresses(
+                session.account_key, indices, is_external,
+                session.network, session.cardano_address_exe
+            )
+        else:
+            batch = []
+            for index in indices:
+                addr_info = session.derive_payment_address(index, is_external)
+                if addr_info:
+                    batch.append(addr_info)
+        return self._add_base_addresses(session, batch)
+    
+    @staticmethod
+    def _add_base_addresses(session: DerivationSession, batch: List[Dict]) -> List[Dict]:
+        """Set "base_address" (payment key + account stake key) on each address info"""
+        if not session.stake_public_key and not session.derive_stake_address():
+            raise RuntimeError("failed to derive the account stake key")
+        for addr_info in batch:
+            base_address = CardanoAddressGenerator.get_delegated_address(
+                addr_info["address"], session.stake_public_key, session.cardano_address_exe
+            )
+            if not base_address:
+                raise RuntimeError(f"failed to build base address for index {addr_info['index']}")
+            addr_info["base_address"] = base_address
+        return batch
+    
+    def scan_chain(self, session: DerivationSession, is_external: bool = True) -> Dict:
+        """
+        Scan one chain until the gap limit is reached
+        
+        Args:
+            session: Opened derivation session
+            is_external: True for external (0/i), False for internal (1/i)
+            
+        Returns:
+            Dict with "used" address infos and "scanned" count
+        """
+        chain = "external" if is_external else "internal"
+        used = []
+        last_used = -1
+        next_start = 0
+        
+        with ThreadPoolExecutor(max_workers=1) as deriver:
+            pending = deriver.submit(self._derive_batch, session, next_start, is_external)
+            while True:
+                batch = pending.result()
+                next_start += self.batch_size
+                if len(batch) < self.batch_size:
+                    raise RuntimeError(f"failed to derive {chain} addresses")
+                
+                # Derive the next batch while this one is checked on-chain
+                pending = deriver.submit(self._derive_batch, session, next_start, is_external)
+                
+                candidates = [a["base_address"] for a in batch] + [a["address"] for a in batch]
+                used_set: Set[str] = set(self.usage_checker(candidates))
+                for addr_info in batch:
+                    if addr_info["base_address"] in used_set or addr_info["address"] in used_set:
+                        used.append(addr_info)
+                        last_used = addr_info["index"]
+                
+                if next_start - last_used - 1 >= self.gap_limit:
+                    break
+        
+        print(f"✓ {chain}: {len(used)} used, scanned {next_start}")
+        return {"used": used, "scanned": next_start}
+    
+    def discover(self, mnemonic: str, account_index: int = 0,
+                 network: str = "mainnet") -> Optional[Dict]:
+        """
+        Discover used external and internal addresses of an account
+        
+        Args:
+            mnemonic: BIP39 mnemonic phrase
+            account_index: BIP44 account index
+            network: "mainnet" or "testnet"
+            
+        Returns:
+            Dict with used addresses per chain and stake address, or None
+        """
+        print(f"[*] Discovering used addresses (gap limit {self.gap_limit})...")
+        
+        session = DerivationSession(mnemonic, account_index, network)
+        if not session.open():
+            return None
+        
+        stake_addr = session.derive_stake_address()
+        
+        try:
+            # External and internal chains are scanned concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                external = executor.submit(self.scan_chain, session, True)
+                internal = executor.submit(self.scan_chain, session, False)
+                external_result = external.result()
+                internal_result = internal.result()
+        except Exception as e:
+            print(f"✗ Address discovery failed: {e}")
+            return None
+        
+        return {
+            "account_index": account_index,
+            "network": network,
+            "gap_limit": self.gap_limit,
+            "stake_address": stake_addr,
+            "external": external_result["used"],
+            "internal": internal_result["used"],
+            "scanned": {
+                "external": external_result["scanned"],
+                "internal": internal_result["scanned"]
+            }
+        }
@@ -4,66 +4,146 @@ Step-by-step address generation from mnemonic
 """
 from typing import Optional
 from utils.cardano_address import CardanoAddressGenerator
-from shared.derive_stake import StakeAddressDeriver
 
 
-class AddressGenerator:
-    """Generate Cardano addresses step by step"""
+class DerivationSession:
+    """Derive many addresses from one mnemonic
     
-    @staticmethod
-    def generate_payment_address(mnemonic: str, account_index: int = 0,
-                                address_index: int = 0, is_external: bool = True,
-                                network: str = "mainnet") -> Optional[dict]:
+    The root key (PBKDF2) and the account key (1852H/1815H/accountH) are
+    computed once in open(); each address then only derives its chain/index
+    child from the account key.
+    """
+    
+    def __init__(self, mnemonic: str, account_index: int = 0, network: str = "mainnet"):
         """
-        Generate a single payment address
+        Initialize derivation session
         
         Args:
             mnemonic: BIP39 mnemonic phrase
             account_index: BIP44 account index
-            address_index: Address index in chain
-            is_external: True for external (0/i), False for internal (1/i)
             network: "mainnet" or "testnet"
+        """
+        self.mnemonic = mnemonic
+        self.account_index = account_index
+        self.network = network
+        self.cardano_address_exe = None
+        self.root_key = None
+        self.account_key = None
+        self.stake_address = None
+        self.stake_public_key = None
+    
+    @staticmethod
+    def from_account_key(account_key: str, network: str = "mainnet",
+                         cardano_address_exe: str = None) -> "DerivationSession":
+        """
+        Create an already-open session from a derived account key
+        
+        Args:
+            account_key: Account key (acct_xsk...)
+            network: "mainnet" or "testnet"
+            cardano_address_exe: Path to cardano-address
             
         Returns:
-            Dict with address info or None
+            DerivationSession
         """
-        print(f"[*] Generating {'external' if is_external else 'internal'} address {address_index}...")
+        session = DerivationSession("", network=network)
+        session.account_key = account_key
+        session.cardano_address_exe = cardano_address_exe
+        return session
+    
+    @staticmethod
+    def from_root_key(root_key: str, account_index: int = 0, network: str = "mainnet",
+                      cardano_address_exe: str = None) -> Optional["DerivationSession"]:
+        """
+        Create a session for one account of an already-derived root key
         
-        # Find cardano-address tool
-        cardano_address_exe = CardanoAddressGenerator.find_cardano_address_exe()
-        if not cardano_address_exe:
-            print("✗ cardano-address tool not found")
+        Args:
+            root_key: Root key (root_xsk...)
+            account_index: BIP44 account index
+            network: "mainnet" or "testnet"
+            cardano_address_exe: Path to cardano-address
+            
+        Returns:
+            Opened DerivationSession or None
+        """
+        session = DerivationSession("", account_index, network)
+        session.root_key = root_key
+        session.cardano_address_exe = cardano_address_exe
+        if not session._open_account():
             return None
+        return session
+    
+    def open(self) -> bool:
+        """
+        Derive root and account keys
+        
+        Returns:
+            True if successful
+        """
+        # Find cardano-address tool (not needed by the in-process backend)
+        if CardanoAddressGenerator.requires_executable():
+            self.cardano_address_exe = CardanoAddressGenerator.find_cardano_address_exe()
+            if not self.cardano_address_exe:
+                print("✗ cardano-address tool not found")
+                return False
         
         # Generate root key
-        root_key = CardanoAddressGenerator.get_root_key(mnemonic, cardano_address_exe)
-        if not root_key:
+        self.root_key = CardanoAddressGenerator.get_root_key(self.mnemonic, self.cardano_address_exe)
+        if not self.root_key:
             print("✗ Failed to generate root key")
-            return None
+            return False
         
+        return self._open_account()
+    
+    def _open_account(self) -> bool:
+        """Derive the account key from the root key"""
         # Derive account key (BIP44: m/1852H/1815H/accountH)
-        account_path = f"1852H/1815H/{account_index}H"
-        account_key = CardanoAddressGenerator.derive_key(root_key, account_path, cardano_address_exe)
-        if not account_key:
+        account_path = f"1852H/1815H/{self.account_index}H"
+        self.account_key = CardanoAddressGenerator.derive_key(
+            self.root_key, account_path, self.cardano_address_exe
+        )
+        if not self.account_key:
             print(f"✗ Failed to derive account key")
+            return False
+        
+        return True
+    
+    def derive_payment_address(self, address_index: int = 0,
+                               is_external: bool = True) -> Optional[dict]:
+        """
+        Derive a payment address from the account key
+        
+        Args:
+            address_index: Address index in chain
+            is_external: True for external (0/i), False for internal (1/i)
+            
+        Returns:
+            Dict with address info or None
+        """
+        if not self.account_key:
+            print("✗ Derivation session not opened")
             return None
         
         # Derive payment key
         chain = 0 if is_external else 1
         payment_path = f"{chain}/{address_index}"
-        payment_key = CardanoAddressGenerator.derive_key(account_key, payment_path, cardano_address_exe)
+        payment_key = CardanoAddressGenerator.derive_key(
+            self.account_key, payment_path, self.cardano_address_exe
+        )
         if not payment_key:
             print(f"✗ Failed to derive payment key")
             return None
         
         # Get public key
-        pub_key = CardanoAddressGenerator.get_public_key(payment_key, cardano_address_exe)
+        pub_key = CardanoAddressGenerator.get_public_key(payment_key, self.cardano_address_exe)
         if not pub_key:
             print(f"✗ Failed to get public key")
             return None
         
         # Generate payment address
-        payment_addr = CardanoAddressGenerator.get_payment_address(pub_key, network, cardano_address_exe)
+        payment_addr = CardanoAddressGenerator.get_payment_address(
+            pub_key, self.network, self.cardano_address_exe
+        )
         if not payment_addr:
             print(f"✗ Failed to generate payment address")
             return None
@@ -77,52 +157,92 @@ class AddressGenerator:
             "public_key": pub_key
         }
     
-    @staticmethod
-    def generate_stake_address(mnemonic: str, account_index: int = 0) -> Optional[str]:
+    def derive_stake_address(self) -> Optional[str]:
         """
-        Generate stake address
+        Derive the account stake address (computed once per session)
         
-        Args:
-            mnemonic: BIP39 mnemonic phrase
-            account_index: BIP44 account index
-            
         Returns:
             Stake address or None
         """
-        print("[*] Generating stake address...")
+        if self.stake_address:
+            return self.stake_address
         
-        # Find cardano-address tool
-        cardano_address_exe = CardanoAddressGenerator.find_cardano_address_exe()
-        if not cardano_address_exe:
-            print("✗ cardano-address tool not found")
-            return None
-        
-        # Generate root key
-        root_key = CardanoAddressGenerator.get_root_key(mnemonic, cardano_address_exe)
-        if not root_key:
-            print("✗ Failed to generate root key")
-            return None
-        
-        # Derive account key
-        account_path = f"1852H/1815H/{account_index}H"
-        account_key = CardanoAddressGenerator.derive_key(root_key, account_path, cardano_address_exe)
-        if not account_key:
-            print(f"✗ Failed to derive account key")
+        if not self.account_key:
+            print("✗ Derivation session not opened")
             return None
         
         # Derive stake key (BIP44: m/1852H/1815H/accountH/2/0)
-        stake_path = "2/0"
-        stake_key = CardanoAddressGenerator.derive_key(account_key, stake_path, cardano_address_exe)
+        stake_key = CardanoAddressGenerator.derive_key(self.account_key, "2/0", self.cardano_address_exe)
         if not stake_key:
             print("✗ Failed to derive stake key")
             return None
         
+        # Get stake public key
+        stake_pub = CardanoAddressGenerator.get_public_key(stake_key, self.cardano_address_exe)
+        if not stake_pub:
+            print("✗ Failed to get stake public key")
+            return None
+        
         # Get stake address
-        stake_deriver = StakeAddressDeriver()
-        stake_addr = stake_deriver.get_stake_address(stake_key)
+        stake_addr = CardanoAddressGenerator.get_stake_address(
+            stake_pub, self.network, self.cardano_address_exe
+        )
         if not stake_addr:
             print("✗ Failed to generate stake address")
             return None
         
         print(f"✓ Stake address: {stake_addr[:40]}...")
+        self.stake_public_key = stake_pub
+        self.stake_address = stake_addr
         return stake_addr
+
+
+class AddressGenerator:
+    """Generate Cardano addresses step by step"""
+    
+    @staticmethod
+    def generate_payment_address(mnemonic: str, account_index: int = 0,
+                                address_index: int = 0, is_external: bool = True,
+                                network: str = "mainnet") -> Optional[dict]:
+        """
+        Generate a single payment address
+        
+        Args:
+            mnemonic: BIP39 mnemonic phrase
+            account_index: BIP44 account index
+            address_index: Address index in chain
+            is_external: True for external (0/i), False for internal (1/i)
+            network: "mainnet" or "testnet"
+            
+        Returns:
+            Dict with address info or None
+        """
+        print(f"[*] Generating {'external' if is_external else 'internal'} address {address_index}...")
+        
+        session = DerivationSession(mnemonic, account_index, network)
+        if not session.open():
+            return None
+        
+        return session.derive_payment_address(address_index, is_external)
+    
+    @staticmethod
+    def generate_stake_address(mnemonic: str, account_index: int = 0,
+                               network: str = "mainnet") -> Optional[str]:
+        """
+        Generate stake address
+        
+        Args:
+            mnemonic: BIP39 mnemonic phrase
+            account_index: BIP44 account index
+            network: "mainnet" or "testnet"
+            
+        Returns:
+            Stake address or None
+        """
+        print("[*] Generating stake address...")
+        
+        session = DerivationSession(mnemonic, account_index, network)
+        if not session.open():
+            return None
+        
+        return session.derive_stake_address()
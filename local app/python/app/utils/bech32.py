@@ -0,0 +1,220 @@
+"""
+Bech32: Encode and decode Cardano bech32 strings
+Keys (root_xsk, addr_vk, ...) and Shelley addresses (addr1, stake1, ...)
+
+Cardano uses the original bech32 checksum (BIP173); bech32m (BIP350)
+is supported for completeness. The checksum is computed with a 32-entry
+lookup table, and the checksum state of each human-readable part is
+cached, so batches of addresses sharing "addr"/"stake" only pay for
+their data characters.
+"""
+import functools
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+
+CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+GENERATOR = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
+
+# Checksum constants
+BECH32 = 1
+BECH32M = 0x2bc830a3
+
+
+def _build_polymod_table() -> List[int]:
+    """XOR of GENERATOR terms for every 5-bit value shifted out of the state"""
+    table = []
+    for top in range(32):
+        term = 0
+        for i in range(5):
+            if (top >> i) & 1:
+                term ^= GENERATOR[i]
+        table.append(term)
+    return table
+
+
+_POLYMOD_TABLE = _build_polymod_table()
+
+# Character -> 5-bit value (-1 for characters outside the charset)
+_CHARSET_REV = [-1] * 128
+for _i, _c in enumerate(CHARSET):
+    _CHARSET_REV[ord(_c)] = _i
+
+
+def _polymod(values: Iterable[int], chk: int = 1) -> int:
+    table = _POLYMOD_TABLE
+    for value in values:
+        chk = ((chk & 0x1ffffff) << 5) ^ value ^ table[chk >> 25]
+    return chk
+
+
+def _hrp_expand(hrp: str) -> List[int]:
+    return [ord(c) >> 5 for c in hrp] + [0] + [ord(c) & 31 for c in hrp]
+
+
+@functools.lru_cache(maxsize=64)
+def _hrp_state(hrp: str) -> int:
+    """Checksum state after the expanded hrp (bounded: decoded hrps are untrusted)"""
+    return _polymod(_hrp_expand(hrp))
+
+
+def convert_bits(data: bytes, from_bits: int, to_bits: int, pad: bool = True) -> Optional[List[int]]:
+    """
+    Regroup a sequence of from_bits-wide integers into to_bits-wide integers
+    
+    Args:
+        data: Input values
+        from_bits: Bit width of input values
+        to_bits: Bit width of output values
+        pad: Pad the final group with zero bits
+        
+    Returns:
+        List of regrouped values or None if padding is invalid
+    """
+    acc = 0
+    bits = 0
+    ret = []
+    maxv = (1 << to_bits) - 1
+    for value in data:
+        if value < 0 or value >> from_bits:
+            return None
+        acc = (acc << from_bits) | value
+        bits += from_bits
+        while bits >= to_bits:
+            bits -= to_bits
+            ret.append((acc >> bits) & maxv)
+    if pad:
+        if bits:
+            ret.append((acc << (to_bits - bits)) & maxv)
+    elif bits >= from_bits or ((acc << (to_bits - bits)) & maxv):
+        return None
+    return ret
+
+
+def encode(hrp: str, data: bytes, spec: int = BECH32) -> str:
+    """
+    Encode bytes as a bech32 string
+    
+    Cardano does not apply the BIP173 90-character limit, so extended
+    keys and base addresses encode without truncation.
+    
+    Args:
+        hrp: Human-readable part (e.g. "addr", "root_xsk")
+        data: Payload bytes
+        spec: BECH32 or BECH32M
+        
+    Returns:
+        Bech32 string
+    """
+    values = convert_bits(data, 8, 5)
+    polymod = _polymod(values + [0] * 6, _hrp_state(hrp)) ^ spec
+    checksum = [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
+    return hrp + "1" + "".join([CHARSET[d] for d in values + checksum])
+
+
+def encode_many(hrp: str, payloads: Iterable[bytes], spec: int = BECH32) -> List[str]:
+    """
+    Encode many payloads with the same human-readable part
+    
+    Args:
+        hrp: Human-readable part
+        payloads: Payload bytes
+        spec: BECH32 or BECH32M
+        
+    Returns:
+        Bech32 strings in input order
+    """
+    return [encode(hrp, data, spec) for data in payloads]
+
+
+def _decode_values(bech: str) -> Optional[Tuple[str, List[int]]]:
+    """Split a bech32 string into hrp and 5-bit values, checking characters only"""
+    if not bech or not isinstance(bech, str):
+        return None
+    if bech.lower() != bech:
+        if bech.upper() != bech:
+            return None
+        bech = bech.lower()
+    pos = bech.rfind("1")
+    if pos < 1 or pos + 7 > len(bech):
+        return None
+    hrp = bech[:pos]
+    if any(ord(c) < 33 or ord(c) > 126 for c in hrp):
+        return None
+    rev = _CHARSET_REV
+    values = []
+    for c in bech[pos + 1:]:
+        code = ord(c)
+        value = rev[code] if code < 128 else -1
+        if value < 0:
+            return None
+        values.append(value)
+    return hrp, values
+
+
+def decode(bech: str, spec: int = BECH32) -> Optional[Tuple[str, bytes]]:
+    """
+    Decode a bech32 string
+    
+    Args:
+        bech: Bech32 string
+        spec: BECH32 or BECH32M (checksum constant the string must match)
+        
+    Returns:
+        (hrp, payload bytes) or None if invalid
+    """
+    parts = _decode_values(bech)
+    if parts is None:
+        return None
+    hrp, values = parts
+    if _polymod(values, _hrp_state(hrp)) != spec:
+        return None
+    data = convert_bits(values[:-6], 5, 8, pad=False)
+    if data is None:
+        return None
+    return hrp, bytes(data)
+
+
+def decode_many(bechs: Iterable[str], spec: int = BECH32) -> List[Optional[Tuple[str, bytes]]]:
+    """
+    Decode and checksum-validate many bech32 strings in one call
+    
+    Args:
+        bechs: Bech32 strings
+        spec: BECH32 or BECH32M
+        
+    Returns:
+        (hrp, payload bytes) or None per input, in input order
+    """
+    return [decode(bech, spec) for bech in bechs]
+
+
+def is_valid(bech: str, hrps: Sequence[str] = None, spec: int = BECH32) -> bool:
+    """
+    Check a bech32 string (checksum, characters, padding and optionally hrp)
+    
+    Args:
+        bech: Bech32 string
+        hrps: Accepted human-readable parts (None accepts any)
+        spec: BECH32 or BECH32M
+        
+    Returns:
+        True if valid
+    """
+    decoded = decode(bech, spec)
+    return decoded is not None and (hrps is None or decoded[0] in hrps)
+
+
+def validate_many(bechs: Iterable[str], hrps: Sequence[str] = None,
+                  spec: int = BECH32) -> List[bool]:
+    """
+    Check many bech32 strings in one call
+    
+    Args:
+        bechs: Bech32 strings
+        hrps: Accepted human-readable parts (None accepts any)
+        spec: BECH32 or BECH32M
+        
+    Returns:
+        True/False per input, in input order
+    """
+    return [is_valid(bech, hrps, spec) for bech in bechs]
@@ -2,10 +2,38 @@
 BIP39: Mnemonic & Wordlist Support
 """
 import os
-from typing import List, Optional
+import secrets
+from typing import List, Mapping, Optional, Sequence, Tuple
 import random
 import hashlib
 
+from utils import wordlists
+
+
+def _read_wordlist(path: str) -> List[str]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.strip().lower() for line in f if line.strip() and line.strip().isalpha()]
+
+
+def get_wordlist() -> Tuple[str, ...]:
+    """
+    Get the shared BIP39 English wordlist (bundled in utils/wordlists)
+    
+    Returns:
+        Tuple of 2048 words
+    """
+    return wordlists.get().words
+
+
+def get_word_index() -> Mapping[str, int]:
+    """
+    Get the shared word -> index map (read-only)
+    
+    Returns:
+        Mapping of word to its 11-bit index
+    """
+    return wordlists.get().index
+
 
 class BIP39:
     """BIP39 Mnemonic support"""
@@ -15,35 +43,23 @@ class BIP39:
     @staticmethod
     def load_wordlist(path: str = None) -> List[str]:
         """
-        Load BIP39 wordlist from file
+        Load BIP39 wordlist
         
         Args:
-            path: Path to wordlist file (auto-find if None)
+            path: Path to wordlist file (None returns the shared English list)
             
         Returns:
             List of words or empty list if not found
         """
         if path is None:
-            # Search common locations
-            paths = [
-                "./wordlist.txt",
-                "./end-user-app/wordlist.txt",
-                "./local app/powershell/end-user-app/wordlist.txt",
-                os.path.join(os.path.dirname(__file__), "../../data/wordlist.txt"),
-            ]
-            
-            for p in paths:
-                if os.path.exists(p):
-                    path = p
-                    break
+            return list(get_wordlist())
         
-        if not path or not os.path.exists(path):
+        if not os.path.exists(path):
             print(f"⚠️  Wordlist not found at {path}")
             return []
         
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                words = [line.strip().lower() for line in f if line.strip() and line.strip().isalpha()]
+            words = _read_wordlist(path)
             print(f"✓ Loaded {len(words)} words from {path}")
             return words
         except Exception as e:
@@ -53,13 +69,13 @@ class BIP39:
     @staticmethod
     def validate_mnemonic(mnemonic: str) -> bool:
         """
-        Validate mnemonic format
+        Validate mnemonic word count, words and BIP39 checksum
         
         Args:
             mnemonic: Mnemonic phrase (space-separated words)
             
         Returns:
-            True if valid format
+            True if valid
         """
         if not mnemonic or not isinstance(mnemonic, str):
             return False
@@ -70,26 +86,31 @@ class BIP39:
             print(f"✗ Invalid word count: {len(words)} (must be 12, 15, or 24)")
             return False
         
+        if not BIP39.validate_checksum(mnemonic):
+            print("✗ Unknown word or invalid checksum")
+            return False
+        
         return True
     
     @staticmethod
-    def validate_words_exist(mnemonic: str, wordlist: List[str]) -> bool:
+    def validate_words_exist(mnemonic: str, wordlist: List[str] = None) -> bool:
         """
         Validate all words exist in wordlist
         
         Args:
             mnemonic: Mnemonic phrase
-            wordlist: List of valid words
+            wordlist: List of valid words (default: shared English list)
             
         Returns:
             True if all words valid
         """
-        if not wordlist:
+        known = get_word_index() if wordlist is None else set(wordlist)
+        if not known:
             print("⚠️  No wordlist to validate against")
             return False
         
         words = mnemonic.strip().lower().split()
-        invalid_words = [w for w in words if w not in wordlist]
+        invalid_words = [w for w in words if w not in known]
         
         if invalid_words:
             print(f"✗ Invalid words: {', '.join(invalid_words)}")
@@ -97,6 +118,137 @@ class BIP39:
         
         return True
     
+    @staticmethod
+    def mnemonic_to_entropy(mnemonic: str) -> Optional[bytes]:
+        """
+        Recover entropy from a mnemonic and check its BIP39 checksum
+        
+        Word indices are packed 11 bits at a time into one integer; the
+        low len(words)/3 bits are the checksum, the rest is the entropy.
+        
+        Args:
+            mnemonic: Mnemonic phrase (12-24 words)
+            
+        Returns:
+            Entropy bytes or None if a word is unknown or the checksum fails
+        """
+        word_index = get_word_index()
+        words = mnemonic.lower().split()
+        if len(words) not in (12, 15, 18, 21, 24):
+            return None
+        
+        bits = 0
+        for word in words:
+            index = word_index.get(word)
+            if index is None:
+                return None
+            bits = (bits << 11) | index
+        
+        checksum_bits = len(words) // 3
+        entropy = (bits >> checksum_bits).to_bytes(checksum_bits * 4, "big")
+        if hashlib.sha256(entropy).digest()[0] >> (8 - checksum_bits) != bits & ((1 << checksum_bits) - 1):
+            return None
+        return entropy
+    
+    @staticmethod
+    def validate_checksum(mnemonic: str) -> bool:
+        """
+        Validate mnemonic words and BIP39 checksum
+        
+        Args:
+            mnemonic: Mnemonic phrase
+            
+        Returns:
+            True if every word is in the wordlist and the checksum matches
+        """
+        return BIP39.mnemonic_to_entropy(mnemonic) is not None
+    
+    @staticmethod
+    def validate_batch(mnemonics: List[str]) -> List[bool]:
+        """
+        Validate many mnemonics (words and checksum) without output
+        
+        Args:
+            mnemonics: Mnemonic phrases
+            
+        Returns:
+            True/False per mnemonic, in input order
+        """
+        to_entropy = BIP39.mnemonic_to_entropy
+        return [to_entropy(m) is not None for m in mnemonics]
+    
+    @staticmethod
+    def entropy_to_mnemonic(entropy: bytes, wordlist: Sequence[str] = None) -> Optional[str]:
+        """
+        Encode entropy as a mnemonic with BIP39 checksum bits
+        
+        Args:
+            entropy: 16, 20, 24, 28 or 32 bytes
+            wordlist: 2048-word list (default: shared English list)
+            
+        Returns:
+            Mnemonic phrase or None if the entropy length is invalid
+        """
+        if len(entropy) not in (16, 20, 24, 28, 32):
+            print(f"✗ Invalid entropy length: {len(entropy)} bytes")
+            return None
+        
+        words = wordlist or get_wordlist()
+        checksum_bits = len(entropy) // 4
+        bits = ((int.from_bytes(entropy, "big") << checksum_bits)
+                | hashlib.sha256(entropy).digest()[0] >> (8 - checksum_bits))
+        word_count = len(entropy) * 3 // 4
+        return " ".join([words[(bits >> (11 * i)) & 0x7FF] for i in range(word_count - 1, -1, -1)])
+    
+    @staticmethod
+    def generate_mnemonic(word_count: int = 12) -> Optional[str]:
+        """
+        Generate a random mnemonic from OS entropy (secrets module)
+        
+        Args:
+            word_count: Number of words (12, 15, or 24)
+            
+        Returns:
+            Mnemonic phrase or None
+        """
+        if word_count not in BIP39.VALID_WORD_COUNTS:
+            print(f"✗ Invalid word count: {word_count} (must be 12, 15, or 24)")
+            return None
+        
+        return BIP39.entropy_to_mnemonic(secrets.token_bytes(word_count * 4 // 3))
+    
+    @staticmethod
+    def generate_batch(count: int, word_count: int = 12) -> List[str]:
+        """
+        Generate many random mnemonics from a single OS entropy read
+        
+        Args:
+            count: Number of mnemonics
+            word_count: Number of words each (12, 15, or 24)
+            
+        Returns:
+            List of mnemonic phrases (empty if word_count is invalid)
+        """
+        if word_count not in BIP39.VALID_WORD_COUNTS:
+            print(f"✗ Invalid word count: {word_count} (must be 12, 15, or 24)")
+            return []
+        
+        size = word_count * 4 // 3
+        checksum_bits = size // 4
+        checksum_shift = 8 - checksum_bits
+        shifts = [11 * i for i in range(word_count - 1, -1, -1)]
+        words = get_wordlist()
+        sha256 = hashlib.sha256
+        from_bytes = int.from_bytes
+        
+        buffer = os.urandom(size * count)
+        mnemonics = []
+        for offset in range(0, size * count, size):
+            entropy = buffer[offset:offset + size]
+            bits = (from_bytes(entropy, "big") << checksum_bits) | sha256(entropy).digest()[0] >> checksum_shift
+            mnemonics.append(" ".join([words[(bits >> shift) & 0x7FF] for shift in shifts]))
+        return mnemonics
+    
     @staticmethod
     def normalize_mnemonic(mnemonic: str) -> str:
         """
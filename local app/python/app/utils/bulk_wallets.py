@@ -0,0 +1,248 @@
+"""
+Bulk Wallets: Mnemonic file to addresses pipeline
+Derive thousands of wallets on a worker pool, streaming results to JSONL
+"""
+import contextlib
+import hashlib
+import io
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Dict, Iterator, Optional, Tuple
+
+from utils.bip39 import BIP39
+from utils.derivation_pool import DerivationPool
+from utils.multi_address_generator import MultiAddressGenerator
+
+
+def mnemonic_fingerprint(mnemonic: str) -> str:
+    """Short non-reversible id of a mnemonic, written instead of the phrase"""
+    return hashlib.sha256(BIP39.normalize_mnemonic(mnemonic).encode()).hexdigest()[:16]
+
+
+def derive_wallet(line_no: int, mnemonic: str, account_index: int = 0,
+                  address_count: int = 1, network: str = "mainnet") -> Dict:
+    """
+    Worker task: derive addresses and stake address of one mnemonic
+    
+    Args:
+        line_no: Line number of the mnemonic in the input file
+        mnemonic: BIP39 mnemonic phrase
+        account_index: BIP44 account index
+        address_count: External addresses to derive
+        network: "mainnet" or "testnet"
+        
+    Returns:
+        Result record for the JSONL output
+    """
+    record = {"line": line_no, "fingerprint": mnemonic_fingerprint(mnemonic)}
+    
+    # Per-step progress output is discarded; the pipeline reports per wallet
+    with contextlib.redirect_stdout(io.StringIO()):
+        if not BIP39.validate_mnemonic(mnemonic):
+            record.update({"success": False, "error": "Invalid mnemonic"})
+            return record
+        
+        generator = MultiAddressGenerator("", network)
+        result = generator.generate_multiple_addresses(
+            BIP39.normalize_mnemonic(mnemonic), account_index, address_count
+        )
+    
+    if not result:
+        record.update({"success": False, "error": "Derivation failed"})
+        return record
+    
+    record.update({
+        "success": True,
+        "account_index": account_index,
+        "network": network,
+        "addresses": [a["address"] for a in result["addresses"]],
+        "stake_address": result["stake_address"]
+    })
+    return record
+
+
+class BulkWalletPipeline:
+    """Turn a file of mnemonics (one per line) into a JSONL file of addresses
+    
+    Mnemonics are read lazily and at most `workers * IN_FLIGHT_PER_WORKER`
+    are in flight, so memory stays bounded regardless of input size. Each
+    result is appended as soon as it completes; on restart, lines that
+    already have a successful record for the same mnemonic (fingerprint)
+    are skipped. If the input was edited in between, changed lines are
+    derived again and the newer record for a line supersedes older ones.
+    """
+    
+    IN_FLIGHT_PER_WORKER = 4
+    
+    def __init__(self, network: str = "mainnet", account_index: int = 0,
+                 address_count: int = 1, workers: int = None):
+        """
+        Initialize bulk pipeline
+        
+        Args:
+            network: "mainnet" or "testnet"
+            account_index: BIP44 account index
+            address_count: External addresses per wallet
+            workers: Worker processes (default: CPU count)
+        """
+        self.network = network
+        self.account_index = account_index
+        self.address_count = address_count
+        self.workers = workers or os.cpu_count() or 1
+    
+    @staticmethod
+    def _read_mnemonics(input_file: str) -> Iterator[Tuple[int, str]]:
+        with open(input_file, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                mnemonic = line.strip()
+                if mnemonic and not mnemonic.startswith('#'):
+                    yield line_no, mnemonic
+    
+    @staticmethod
+    def repair_output(output_file: str):
+        """
+        Make the output end on a complete record before appending
+        
+        A run killed mid-write leaves a partial last line; it is cut off so
+        the next record starts on its own line. A complete record that only
+        lacks its newline gets one.
+        
+        Args:
+            output_file: JSONL output path
+        """
+        if not os.path.exists(output_file):
+            return
+        with open(output_file, 'rb+') as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            if size == 0:
+                return
+            f.seek(size - 1)
+            if f.read(1) == b"\n":
+                return
+            
+            # Find the start of the last line
+            start = size
+            while start > 0:
+                step = min(4096, start)
+                f.seek(start - step)
+                newline = f.read(step).rfind(b"\n")
+                if newline >= 0:
+                    start = start - step + newline + 1
+                    break
+                start -= step
+            f.seek(start)
+            try:
+                json.loads(f.read().decode('utf-8'))
+            except ValueError:
+                f.truncate(start)
+                print(f"⚠️  Dropped a partial record at the end of {output_file}")
+                return
+            f.write(b"\n")
+    
+    @staticmethod
+    def completed_lines(output_file: str) -> Dict[int, str]:
+        """
+        Read the lines already derived successfully
+        
+        Args:
+            output_file: JSONL output path
+            
+        Returns:
+            Dict of input line number -> mnemonic fingerprint
+        """
+        done = {}
+        if not os.path.exists(output_file):
+            return done
+        with open(output_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                # Later records for a line replace earlier ones
+                if record.get("success"):
+                    done[record["line"]] = record.get("fingerprint")
+                else:
+                    done.pop(record.get("line"), None)
+        return done
+    
+    def run(self, input_file: str, output_file: str, resume: bool = True) -> Optional[Dict]:
+        """
+        Derive every mnemonic in input_file
+        
+        Args:
+            input_file: Text file with one mnemonic per line
+            output_file: JSONL output path (appended to)
+            resume: Skip lines with a successful record for the same mnemonic
+            
+        Returns:
+            Summary dict or None
+        """
+        if not os.path.exists(input_file):
+            print(f"✗ Mnemonic file not found: {input_file}")
+            return None
+        
+        if resume:
+            self.repair_output(output_file)
+        done = self.completed_lines(output_file) if resume else {}
+        if done:
+            print(f"[*] Resuming: {len(done)} wallets already done")
+        
+        print(f"[*] Deriving wallets from {input_file} on {self.workers} workers...")
+        
+        executor = DerivationPool.shared(self.workers).executor
+        max_in_flight = self.workers * self.IN_FLIGHT_PER_WORKER
+        mnemonics = self._read_mnemonics(input_file)
+        pending = set()
+        succeeded = 0
+        failed = 0
+        skipped = 0
+        
+        os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+        with open(output_file, 'a' if resume else 'w', encoding='utf-8') as out:
+            exhausted = False
+            while pending or not exhausted:
+                while not exhausted and len(pending) < max_in_flight:
+                    item = next(mnemonics, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    line_no, mnemonic = item
+                    if line_no in done:
+                        # Skip only if the line still holds the mnemonic that was derived
+                        if done[line_no] == mnemonic_fingerprint(mnemonic):
+                            skipped += 1
+                            continue
+                        print(f"⚠️  Line {line_no} changed since the last run, deriving again")
+                    pending.add(executor.submit(
+                        derive_wallet, line_no, mnemonic, self.account_index,
+                        self.address_count, self.network
+                    ))
+                
+                if not pending:
+                    break
+                
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    record = future.result()
+                    out.write(json.dumps(record) + "\n")
+                    if record["success"]:
+                        succeeded += 1
+                    else:
+                        failed += 1
+                        print(f"✗ Line {record['line']}: {record['error']}")
+                out.flush()
+                
+                total = succeeded + failed
+                if total and total % 100 == 0:
+                    print(f"  ... {total} wallets processed")
+        
+        print(f"✓ Bulk derivation complete: {succeeded} ok, {failed} failed -> {output_file}")
+        return {
+            "succeeded": succeeded,
+            "failed": failed,
+            "skipped": skipped,
+            "output_file": output_file
+        }
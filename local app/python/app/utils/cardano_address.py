@@ -1,91 +1,156 @@
 """
 Cardano-Address: Integration with cardano-address tool
 Generate addresses from recovery phrases
+
+Backends (CARDANO_ADDRESS_BACKEND environment variable):
+    native      In-process derivation (utils.cardano_keys), falls back to
+                the cardano-address tool if the native path fails
+    subprocess  Always call the cardano-address tool
+    crosscheck  Run both and reject results that disagree
 """
 import subprocess
 import os
-from typing import Optional
+from typing import Callable, List, Optional
+
+from utils import bech32
+from utils.cardano_keys import CardanoKeyDeriver
+from utils.root_key_cache import RootKeyCache
+from utils.tool_registry import ToolRegistry
 
 
 class CardanoAddressGenerator:
     """Generate Cardano addresses using cardano-address tool"""
     
+    BACKEND_NATIVE = "native"
+    BACKEND_SUBPROCESS = "subprocess"
+    BACKEND_CROSSCHECK = "crosscheck"
+    
+    BACKEND = os.environ.get("CARDANO_ADDRESS_BACKEND", BACKEND_NATIVE).lower()
+    
+    @staticmethod
+    def requires_executable() -> bool:
+        """True if the selected backend always needs the cardano-address tool"""
+        return CardanoAddressGenerator.BACKEND != CardanoAddressGenerator.BACKEND_NATIVE
+    
     @staticmethod
     def find_cardano_address_exe() -> Optional[str]:
         """
-        Find cardano-address executable
+        Find cardano-address executable (cached in ToolRegistry)
         
         Returns:
             Path to executable or None
         """
-        common_paths = [
-            "./tools/cardano-addresses/cardano-address.exe",
-            "./tools/cardano-addresses/cardano-address",
-            "./cardano-address.exe",
-            "./cardano-address",
-            "cardano-address.exe",
-            "cardano-address",
-        ]
-        
-        for path in common_paths:
-            if os.path.exists(path):
-                return os.path.abspath(path)
-        
-        # Try to find in PATH
-        try:
-            result = subprocess.run(
-                ["which" if os.name != "nt" else "where", "cardano-address"],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                return result.stdout.strip().split('\n')[0]
-        except:
-            pass
-        
-        return None
+        return ToolRegistry.resolve("cardano-address")
     
     @staticmethod
-    def get_root_key(mnemonic: str, cardano_address_exe: str = None) -> Optional[str]:
+    def _run_backend(step: str, native: Callable[[], Optional[str]],
+                     external: Callable[[str], Optional[str]],
+                     cardano_address_exe: str = None) -> Optional[str]:
         """
-        Generate root key from mnemonic
+        Run one derivation step on the selected backend
         
         Args:
-            mnemonic: BIP39 mnemonic phrase
+            step: Step name for log messages
+            native: In-process implementation
+            external: cardano-address implementation, takes the executable path
             cardano_address_exe: Path to cardano-address
             
         Returns:
-            Root key or None
+            Step result or None
         """
+        backend = CardanoAddressGenerator.BACKEND
+        
+        native_result = None
+        if backend != CardanoAddressGenerator.BACKEND_SUBPROCESS:
+            try:
+                native_result = native()
+            except Exception as e:
+                print(f"✗ Native {step} error: {e}")
+            if backend == CardanoAddressGenerator.BACKEND_NATIVE and native_result:
+                return native_result
+        
         if not cardano_address_exe:
             cardano_address_exe = CardanoAddressGenerator.find_cardano_address_exe()
         
         if not cardano_address_exe:
+            if backend == CardanoAddressGenerator.BACKEND_CROSSCHECK and native_result:
+                print(f"⚠️  cardano-address not found, {step} not cross-checked")
+                return native_result
             print("✗ cardano-address not found")
             return None
         
+        external_result = external(cardano_address_exe)
+        
+        if backend == CardanoAddressGenerator.BACKEND_CROSSCHECK:
+            if native_result != external_result:
+                print(f"✗ Cross-check mismatch for {step}")
+                return None
+            print(f"✓ Cross-checked {step}")
+        
+        return external_result
+    
+    @staticmethod
+    def _run_tool(args: List[str], stdin: str, error_label: str) -> Optional[str]:
+        """Run cardano-address with input on stdin and return stripped stdout"""
         try:
-            # Create root key from mnemonic
+            # Feed stdin directly instead of `echo ... |` so no shell is spawned
             result = subprocess.run(
-                f"echo '{mnemonic}' | {cardano_address_exe} key from-recovery-phrase Shelley",
-                shell=True,
+                args,
+                input=stdin + "\n",
                 capture_output=True,
                 text=True
             )
             
             if result.returncode == 0:
-                root_key = result.stdout.strip()
-                print(f"✓ Generated root key")
-                return root_key
+                return result.stdout.strip()
             else:
-                print(f"✗ Error generating root key: {result.stderr}")
+                print(f"✗ {error_label}: {result.stderr}")
                 return None
         except Exception as e:
             print(f"✗ Error: {e}")
             return None
     
     @staticmethod
-    def derive_key(root_key: str, derivation_path: str, 
+    def get_root_key(mnemonic: str, cardano_address_exe: str = None) -> Optional[str]:
+        """
+        Generate root key from mnemonic
+        
+        Args:
+            mnemonic: BIP39 mnemonic phrase
+            cardano_address_exe: Path to cardano-address
+            
+        Returns:
+            Root key or None
+        """
+        # PBKDF2 is skipped when the same mnemonic was used recently;
+        # crosscheck always runs both backends so a cached key is never trusted
+        cache = RootKeyCache.shared()
+        crosscheck = CardanoAddressGenerator.BACKEND == CardanoAddressGenerator.BACKEND_CROSSCHECK
+        cached = None if crosscheck else cache.get(mnemonic)
+        if cached:
+            print(f"✓ Generated root key (cached)")
+            return bech32.encode(CardanoKeyDeriver.ROOT_XSK, cached)
+        
+        def native():
+            root = CardanoKeyDeriver.root_key_from_mnemonic(mnemonic)
+            return bech32.encode(CardanoKeyDeriver.ROOT_XSK, root) if root else None
+        
+        def external(exe):
+            return CardanoAddressGenerator._run_tool(
+                [exe, "key", "from-recovery-phrase", "Shelley"], mnemonic,
+                "Error generating root key"
+            )
+        
+        root_key = CardanoAddressGenerator._run_backend("root key", native, external, cardano_address_exe)
+        if root_key:
+            print(f"✓ Generated root key")
+            decoded = bech32.decode(root_key)
+            if decoded:
+                cache.put(mnemonic, "", decoded[1])
+        return root_key
+    
+    @staticmethod
+    def derive_key(root_key: str, derivation_path: str,
                   cardano_address_exe: str = None) -> Optional[str]:
         """
         Derive key using BIP44 path
@@ -98,31 +163,31 @@ class CardanoAddressGenerator:
         Returns:
             Derived key or None
         """
-        if not cardano_address_exe:
-            cardano_address_exe = CardanoAddressGenerator.find_cardano_address_exe()
-        
-        if not cardano_address_exe:
-            print("✗ cardano-address not found")
-            return None
+        def native():
+            decoded = bech32.decode(root_key)
+            indices = CardanoKeyDeriver.parse_path(derivation_path)
+            if not decoded or not indices:
+                return None
+            prefix = CardanoKeyDeriver.child_key_prefix(decoded[0], indices)
+            if not prefix:
+                return None
+            xprv = decoded[1]
+            for index in indices:
+                xprv = CardanoKeyDeriver.derive_child(xprv, index)
+            return bech32.encode(prefix, xprv)
         
-        try:
-            result = subprocess.run(
-                f"echo '{root_key}' | {cardano_address_exe} key child {derivation_path}",
-                shell=True,
-                capture_output=True,
-                text=True
+        def external(exe):
+            return CardanoAddressGenerator._run_tool(
+                [exe, "key", "child", derivation_path], root_key,
+                "Error deriving key"
             )
-            
-            if result.returncode == 0:
-                key = result.stdout.strip()
-                print(f"✓ Derived key for path {derivation_path}")
-                return key
-            else:
-                print(f"✗ Error deriving key: {result.stderr}")
-                return None
-        except Exception as e:
-            print(f"✗ Error: {e}")
-            return None
+        
+        key = CardanoAddressGenerator._run_backend(
+            f"path {derivation_path}", native, external, cardano_address_exe
+        )
+        if key:
+            print(f"✓ Derived key for path {derivation_path}")
+        return key
     
     @staticmethod
     def get_public_key(private_key: str, cardano_address_exe: str = None) -> Optional[str]:
@@ -136,31 +201,23 @@ class CardanoAddressGenerator:
         Returns:
             Public key or None
         """
-        if not cardano_address_exe:
-            cardano_address_exe = CardanoAddressGenerator.find_cardano_address_exe()
-        
-        if not cardano_address_exe:
-            print("✗ cardano-address not found")
-            return None
+        def native():
+            decoded = bech32.decode(private_key)
+            if not decoded or not decoded[0].endswith("_xsk"):
+                return None
+            hrp = decoded[0][:-len("_xsk")] + "_vk"
+            return bech32.encode(hrp, CardanoKeyDeriver.public_key(decoded[1]))
         
-        try:
-            result = subprocess.run(
-                f"echo '{private_key}' | {cardano_address_exe} key public --without-chain-code",
-                shell=True,
-                capture_output=True,
-                text=True
+        def external(exe):
+            return CardanoAddressGenerator._run_tool(
+                [exe, "key", "public", "--without-chain-code"], private_key,
+                "Error"
             )
-            
-            if result.returncode == 0:
-                pub_key = result.stdout.strip()
-                print(f"✓ Generated public key")
-                return pub_key
-            else:
-                print(f"✗ Error: {result.stderr}")
-                return None
-        except Exception as e:
-            print(f"✗ Error: {e}")
-            return None
+        
+        pub_key = CardanoAddressGenerator._run_backend("public key", native, external, cardano_address_exe)
+        if pub_key:
+            print(f"✓ Generated public key")
+        return pub_key
     
     @staticmethod
     def get_payment_address(public_key: str, network: str = "mainnet",
@@ -176,32 +233,55 @@ class CardanoAddressGenerator:
         Returns:
             Payment address or None
         """
-        if not cardano_address_exe:
-            cardano_address_exe = CardanoAddressGenerator.find_cardano_address_exe()
-        
-        if not cardano_address_exe:
-            print("✗ cardano-address not found")
-            return None
+        def native():
+            decoded = bech32.decode(public_key)
+            if not decoded or decoded[0] not in ("addr_vk", "addr_xvk"):
+                return None
+            return CardanoKeyDeriver.enterprise_address(decoded[1], network)
         
-        try:
-            network_tag = "0" if network == "mainnet" else "1"
-            result = subprocess.run(
-                f"echo '{public_key}' | {cardano_address_exe} address payment --network-tag {network_tag}",
-                shell=True,
-                capture_output=True,
-                text=True
+        def external(exe):
+            network_tag = CardanoKeyDeriver.network_id(network)
+            return CardanoAddressGenerator._run_tool(
+                [exe, "address", "payment", "--network-tag", str(network_tag)], public_key,
+                "Error"
             )
+        
+        addr = CardanoAddressGenerator._run_backend("payment address", native, external, cardano_address_exe)
+        if addr:
+            print(f"✓ Generated payment address")
+        return addr
+    
+    @staticmethod
+    def get_stake_address(public_key: str, network: str = "mainnet",
+                         cardano_address_exe: str = None) -> Optional[str]:
+        """
+        Generate stake (reward) address from stake public key
+        
+        Args:
+            public_key: Stake public key (stake_vk...)
+            network: "mainnet" or "testnet"
+            cardano_address_exe: Path to cardano-address
             
-            if result.returncode == 0:
-                addr = result.stdout.strip()
-                print(f"✓ Generated payment address")
-                return addr
-            else:
-                print(f"✗ Error: {result.stderr}")
+        Returns:
+            Stake address or None
+        """
+        def native():
+            decoded = bech32.decode(public_key)
+            if not decoded or decoded[0] not in ("stake_vk", "stake_xvk"):
                 return None
-        except Exception as e:
-            print(f"✗ Error: {e}")
-            return None
+            return CardanoKeyDeriver.stake_address(decoded[1], network)
+        
+        def external(exe):
+            network_tag = CardanoKeyDeriver.network_id(network)
+            return CardanoAddressGenerator._run_tool(
+                [exe, "address", "stake", "--network-tag", str(network_tag)], public_key,
+                "Error"
+            )
+        
+        addr = CardanoAddressGenerator._run_backend("stake address", native, external, cardano_address_exe)
+        if addr:
+            print(f"✓ Generated stake address")
+        return addr
     
     @staticmethod
     def get_delegated_address(payment_address: str, stake_key: str,
@@ -217,28 +297,25 @@ class CardanoAddressGenerator:
         Returns:
             Delegated address or None
         """
-        if not cardano_address_exe:
-            cardano_address_exe = CardanoAddressGenerator.find_cardano_address_exe()
-        
-        if not cardano_address_exe:
-            print("✗ cardano-address not found")
-            return None
+        def native():
+            address = bech32.decode(payment_address)
+            stake = bech32.decode(stake_key)
+            if not address or not stake or stake[0] not in ("stake_vk", "stake_xvk"):
+                return None
+            header, payment_hash = address[1][0], address[1][1:29]
+            if header & 0xF0 != CardanoKeyDeriver.ENTERPRISE_ADDRESS or len(address[1]) != 29:
+                return None
+            base_header = CardanoKeyDeriver.BASE_ADDRESS | (header & 0x0F)
+            payload = bytes([base_header]) + payment_hash + CardanoKeyDeriver.key_hash(stake[1])
+            return bech32.encode(address[0], payload)
         
-        try:
-            result = subprocess.run(
-                f"echo '{payment_address}' | {cardano_address_exe} address delegation '{stake_key}'",
-                shell=True,
-                capture_output=True,
-                text=True
+        def external(exe):
+            return CardanoAddressGenerator._run_tool(
+                [exe, "address", "delegation", stake_key], payment_address,
+                "Error"
             )
-            
-            if result.returncode == 0:
-                addr = result.stdout.strip()
-                print(f"✓ Generated delegated address")
-                return addr
-            else:
-                print(f"✗ Error: {result.stderr}")
-                return None
-        except Exception as e:
-            print(f"✗ Error: {e}")
-            return None
+        
+        addr = CardanoAddressGenerator._run_backend("delegated address", native, external, cardano_address_exe)
+        if addr:
+            print(f"✓ Generated delegated address")
+        return addr
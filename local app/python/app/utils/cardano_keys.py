@@ -0,0 +1,256 @@
+"""
+Cardano Keys: In-process CIP-1852 key derivation
+Pure-Python Ed25519-BIP32 (Icarus / Shelley) without the cardano-address tool
+
+Keys are handled as raw bytes:
+    xprv = kL (32) || kR (32) || chain code (32)
+    pub  = A (32)
+"""
+import hashlib
+import hmac
+from typing import List, Optional
+
+from utils import bech32, ed25519
+from utils.bip39 import BIP39
+
+
+HARDENED = 0x80000000
+
+
+# ===== Key derivation =====
+
+class CardanoKeyDeriver:
+    """Derive Cardano Shelley keys and addresses in-process"""
+    
+    # Bech32 prefixes produced by cardano-address
+    ROOT_XSK = "root_xsk"
+    ACCOUNT_XSK = "acct_xsk"
+    ADDRESS_XSK = "addr_xsk"
+    STAKE_XSK = "stake_xsk"
+    
+    # Shelley address header types (CIP-19)
+    BASE_ADDRESS = 0x00
+    ENTERPRISE_ADDRESS = 0x60
+    REWARD_ADDRESS = 0xE0
+    
+    @staticmethod
+    def mnemonic_to_entropy(mnemonic: str) -> Optional[bytes]:
+        """
+        Recover BIP39 entropy from a mnemonic and check its checksum
+        
+        Args:
+            mnemonic: BIP39 mnemonic phrase
+            
+        Returns:
+            Entropy bytes or None if invalid
+        """
+        return BIP39.mnemonic_to_entropy(mnemonic)
+    
+    @staticmethod
+    def root_key_from_entropy(entropy: bytes, passphrase: str = "") -> bytes:
+        """
+        Generate Icarus root xprv from BIP39 entropy
+        
+        Args:
+            entropy: BIP39 entropy bytes
+            passphrase: Optional second-factor passphrase
+            
+        Returns:
+            96-byte root xprv
+        """
+        key = bytearray(hashlib.pbkdf2_hmac(
+            "sha512", passphrase.encode("utf-8"), entropy, 4096, 96
+        ))
+        key[0] &= 0xF8
+        key[31] &= 0x1F
+        key[31] |= 0x40
+        return bytes(key)
+    
+    @staticmethod
+    def root_key_from_mnemonic(mnemonic: str, passphrase: str = "") -> Optional[bytes]:
+        """
+        Generate Icarus root xprv from mnemonic (same as `key from-recovery-phrase Shelley`)
+        
+        Args:
+            mnemonic: BIP39 mnemonic phrase
+            passphrase: Optional second-factor passphrase
+            
+        Returns:
+            96-byte root xprv or None if mnemonic is invalid
+        """
+        entropy = CardanoKeyDeriver.mnemonic_to_entropy(mnemonic)
+        if entropy is None:
+            return None
+        return CardanoKeyDeriver.root_key_from_entropy(entropy, passphrase)
+    
+    @staticmethod
+    def public_key(xprv: bytes) -> bytes:
+        """
+        Get the 32-byte Ed25519 public key of an extended private key
+        
+        Args:
+            xprv: Extended private key (at least kL)
+            
+        Returns:
+            32-byte public key
+        """
+        return ed25519.public_key_from_scalar(xprv[:32])
+    
+    @staticmethod
+    def derive_child(xprv: bytes, index: int) -> bytes:
+        """
+        Derive child xprv (BIP32-Ed25519, derivation scheme V2)
+        
+        Args:
+            xprv: 96-byte parent xprv
+            index: Child index (>= HARDENED for hardened derivation)
+            
+        Returns:
+            96-byte child xprv
+        """
+        kl, kr, chain_code = xprv[:32], xprv[32:64], xprv[64:96]
+        index_bytes = index.to_bytes(4, "little")
+        
+        if index >= HARDENED:
+            z = hmac.new(chain_code, b"\x00" + kl + kr + index_bytes, hashlib.sha512).digest()
+            i = hmac.new(chain_code, b"\x01" + kl + kr + index_bytes, hashlib.sha512).digest()
+        else:
+            pub = CardanoKeyDeriver.public_key(xprv)
+            z = hmac.new(chain_code, b"\x02" + pub + index_bytes, hashlib.sha512).digest()
+            i = hmac.new(chain_code, b"\x03" + pub + index_bytes, hashlib.sha512).digest()
+        
+        zl = int.from_bytes(z[:28], "little")
+        zr = int.from_bytes(z[32:], "little")
+        child_kl = (8 * zl + int.from_bytes(kl, "little")) % 2 ** 256
+        child_kr = (zr + int.from_bytes(kr, "little")) % 2 ** 256
+        return child_kl.to_bytes(32, "little") + child_kr.to_bytes(32, "little") + i[32:]
+    
+    @staticmethod
+    def parse_path(derivation_path: str) -> Optional[List[int]]:
+        """
+        Parse derivation path such as "1852H/1815H/0H/0/0"
+        
+        Args:
+            derivation_path: Slash-separated path, H or ' marks hardened
+            
+        Returns:
+            List of child indices or None if invalid
+        """
+        indices = []
+        for part in derivation_path.strip().strip("/").split("/"):
+            if part in ("m", ""):
+                continue
+            hardened = part[-1] in ("H", "h", "'")
+            number = part[:-1] if hardened else part
+            if not number.isdigit() or int(number) >= HARDENED:
+                return None
+            indices.append(int(number) + HARDENED if hardened else int(number))
+        return indices
+    
+    @staticmethod
+    def derive_path(xprv: bytes, derivation_path: str) -> Optional[bytes]:
+        """
+        Derive xprv along a path
+        
+        Args:
+            xprv: 96-byte parent xprv
+            derivation_path: Path relative to xprv (e.g. "1852H/1815H/0H")
+            
+        Returns:
+            96-byte xprv or None if path is invalid
+        """
+        indices = CardanoKeyDeriver.parse_path(derivation_path)
+        if indices is None:
+            return None
+        for index in indices:
+            xprv = CardanoKeyDeriver.derive_child(xprv, index)
+        return xprv
+    
+    @staticmethod
+    def key_hash(public_key: bytes) -> bytes:
+        """Blake2b-224 hash of a public key (payment/stake credential)"""
+        return hashlib.blake2b(public_key[:32], digest_size=28).digest()
+    
+    @staticmethod
+    def network_id(network: str) -> int:
+        """Shelley network id: 1 for mainnet, 0 for test networks"""
+        return 1 if network == "mainnet" else 0
+    
+    @staticmethod
+    def enterprise_address(payment_public_key: bytes, network: str = "mainnet") -> str:
+        """
+        Build enterprise (payment-only) address
+        
+        Args:
+            payment_public_key: Payment public key
+            network: "mainnet" or "testnet"
+            
+        Returns:
+            Bech32 address (addr1v... / addr_test1v...)
+        """
+        header = CardanoKeyDeriver.ENTERPRISE_ADDRESS | CardanoKeyDeriver.network_id(network)
+        hrp = "addr" if network == "mainnet" else "addr_test"
+        return bech32.encode(hrp, bytes([header]) + CardanoKeyDeriver.key_hash(payment_public_key))
+    
+    @staticmethod
+    def base_address(payment_public_key: bytes, stake_public_key: bytes,
+                     network: str = "mainnet") -> str:
+        """
+        Build base (payment + stake) address
+        
+        Args:
+            payment_public_key: Payment public key
+            stake_public_key: Stake public key
+            network: "mainnet" or "testnet"
+            
+        Returns:
+            Bech32 address (addr1q... / addr_test1q...)
+        """
+        header = CardanoKeyDeriver.BASE_ADDRESS | CardanoKeyDeriver.network_id(network)
+        hrp = "addr" if network == "mainnet" else "addr_test"
+        payload = (bytes([header]) + CardanoKeyDeriver.key_hash(payment_public_key)
+                   + CardanoKeyDeriver.key_hash(stake_public_key))
+        return bech32.encode(hrp, payload)
+    
+    @staticmethod
+    def stake_address(stake_public_key: bytes, network: str = "mainnet") -> str:
+        """
+        Build reward (stake) address
+        
+        Args:
+            stake_public_key: Stake public key
+            network: "mainnet" or "testnet"
+            
+        Returns:
+            Bech32 stake address (stake1... / stake_test1...)
+        """
+        header = CardanoKeyDeriver.REWARD_ADDRESS | CardanoKeyDeriver.network_id(network)
+        hrp = "stake" if network == "mainnet" else "stake_test"
+        return bech32.encode(hrp, bytes([header]) + CardanoKeyDeriver.key_hash(stake_public_key))
+    
+    @staticmethod
+    def child_key_prefix(parent_prefix: str, indices: List[int]) -> Optional[str]:
+        """
+        Bech32 prefix cardano-address gives a derived key
+        
+        Args:
+            parent_prefix: Prefix of the parent key (root_xsk or acct_xsk)
+            indices: Derivation indices applied to the parent
+            
+        Returns:
+            Child prefix or None if the depth is not a CIP-1852 level
+        """
+        if parent_prefix == CardanoKeyDeriver.ROOT_XSK:
+            depth = len(indices)
+            role = indices[3] if depth == 5 else None
+        elif parent_prefix == CardanoKeyDeriver.ACCOUNT_XSK:
+            depth = len(indices) + 3
+            role = indices[0] if depth == 5 else None
+        else:
+            return None
+        
+        if depth == 3:
+            return CardanoKeyDeriver.ACCOUNT_XSK
+        if depth == 5:
+            return CardanoKeyDeriver.STAKE_XSK if role == 2 else CardanoKeyDeriver.ADDRESS_XSK
+        return None
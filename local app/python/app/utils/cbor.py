@@ -0,0 +1,214 @@
+"""
+CBOR: Minimal reader/writer for COSE structures (RFC 8949)
+Byte strings are returned as memoryview slices of the input, not copies
+"""
+import struct
+from typing import Any, Tuple, Union
+
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+_BREAK = object()
+
+MAX_DEPTH = 32
+
+
+class CBORReader:
+    """Decode CBOR items from a buffer
+    
+    Nothing is copied while reading: byte strings come back as memoryview
+    slices of the input and every length is checked against the buffer
+    before it is used. Tags are read and dropped (the tagged value is
+    returned). Malformed input raises ValueError.
+    """
+    
+    def __init__(self, data: Buffer):
+        """
+        Initialize reader
+        
+        Args:
+            data: Encoded CBOR
+        """
+        self.view = memoryview(data).cast("B")
+        self.pos = 0
+    
+    def at_end(self) -> bool:
+        return self.pos >= len(self.view)
+    
+    def _take(self, size: int) -> memoryview:
+        end = self.pos + size
+        if size < 0 or end > len(self.view):
+            raise ValueError(f"CBOR truncated at offset {self.pos}")
+        chunk = self.view[self.pos:end]
+        self.pos = end
+        return chunk
+    
+    def _head(self) -> Tuple[int, int, int]:
+        """Read an initial byte and argument: (major type, additional info, value)"""
+        initial = self._take(1)[0]
+        major, info = initial >> 5, initial & 0x1F
+        if info < 24:
+            return major, info, info
+        if info <= 27:
+            size = 1 << (info - 24)
+            return major, info, int.from_bytes(self._take(size), "big")
+        if info == 31:
+            # Indefinite length (strings, arrays, maps) or break (major 7) only
+            if major in (0, 1, 6):
+                raise ValueError(f"Indefinite length not allowed for CBOR major type {major}")
+            return major, info, -1
+        raise ValueError(f"Invalid CBOR additional info {info}")
+    
+    def read(self, depth: int = 0) -> Any:
+        """
+        Read the next item
+        
+        Args:
+            depth: Current nesting depth (internal)
+            
+        Returns:
+            Decoded value (bstr -> memoryview, tstr -> str, array -> list, map -> dict)
+        """
+        if depth > MAX_DEPTH:
+            raise ValueError("CBOR nested too deeply")
+        
+        major, info, value = self._head()
+        
+        if major == 0:
+            return value
+        if major == 1:
+            return -1 - value
+        if major in (2, 3):
+            if value < 0:
+                # Indefinite length: concatenated definite-length chunks
+                chunks = []
+                while True:
+                    chunk = self.read(depth + 1)
+                    if chunk is _BREAK:
+                        break
+                    if not isinstance(chunk, memoryview if major == 2 else str):
+                        raise ValueError("Invalid chunk in indefinite-length CBOR string")
+                    chunks.append(bytes(chunk) if major == 2 else chunk)
+                return b"".join(chunks) if major == 2 else "".join(chunks)
+            data = self._take(value)
+            return data if major == 2 else str(data, "utf-8")
+        if major == 4:
+            items = []
+            while value < 0 or len(items) < value:
+                item = self.read(depth + 1)
+                if item is _BREAK:
+                    if value >= 0:
+                        raise ValueError("Unexpected CBOR break")
+                    break
+                items.append(item)
+            return items
+        if major == 5:
+            result = {}
+            count = 0
+            while value < 0 or count < value:
+                key = self.read(depth + 1)
+                if key is _BREAK:
+                    if value >= 0:
+                        raise ValueError("Unexpected CBOR break")
+                    break
+                if isinstance(key, memoryview):
+                    key = bytes(key)
+                elif isinstance(key, (list, dict)):
+                    raise ValueError("Unsupported CBOR map key (array or map)")
+                item = self.read(depth + 1)
+                if item is _BREAK:
+                    raise ValueError("Unexpected CBOR break")
+                result[key] = item
+                count += 1
+            return result
+        if major == 6:
+            return self.read(depth + 1)
+        
+        # Major type 7: simple values and floats
+        if info == 20:
+            return False
+        if info == 21:
+            return True
+        if info in (22, 23):
+            return None
+        if info == 25:
+            return struct.unpack(">e", value.to_bytes(2, "big"))[0]
+        if info == 26:
+            return struct.unpack(">f", value.to_bytes(4, "big"))[0]
+        if info == 27:
+            return struct.unpack(">d", value.to_bytes(8, "big"))[0]
+        if info == 31:
+            return _BREAK
+        raise ValueError(f"Unsupported CBOR simple value {value}")
+
+
+def loads(data: Buffer) -> Any:
+    """
+    Decode exactly one CBOR item
+    
+    Args:
+        data: Encoded CBOR
+        
+    Returns:
+        Decoded value (byte strings as memoryview slices of data)
+    """
+    reader = CBORReader(data)
+    value = reader.read()
+    if value is _BREAK:
+        raise ValueError("Unexpected CBOR break")
+    if not reader.at_end():
+        raise ValueError(f"Trailing data after CBOR item at offset {reader.pos}")
+    return value
+
+
+def _encode_head(major: int, value: int) -> bytes:
+    if value < 24:
+        return bytes([major << 5 | value])
+    for info, size in ((24, 1), (25, 2), (26, 4), (27, 8)):
+        if value < 1 << (8 * size):
+            return bytes([major << 5 | info]) + value.to_bytes(size, "big")
+    raise ValueError("CBOR integer too large")
+
+
+def _encode(value: Any, out: list):
+    if value is None:
+        out.append(b"\xf6")
+    elif value is True:
+        out.append(b"\xf5")
+    elif value is False:
+        out.append(b"\xf4")
+    elif isinstance(value, int):
+        out.append(_encode_head(0, value) if value >= 0 else _encode_head(1, -1 - value))
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        out.append(_encode_head(2, len(value)))
+        out.append(value)
+    elif isinstance(value, str):
+        data = value.encode("utf-8")
+        out.append(_encode_head(3, len(data)))
+        out.append(data)
+    elif isinstance(value, (list, tuple)):
+        out.append(_encode_head(4, len(value)))
+        for item in value:
+            _encode(item, out)
+    elif isinstance(value, dict):
+        out.append(_encode_head(5, len(value)))
+        for key, item in value.items():
+            _encode(key, out)
+            _encode(item, out)
+    else:
+        raise ValueError(f"Cannot encode {type(value).__name__} as CBOR")
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Encode a value as CBOR (definite lengths, shortest integer heads)
+    
+    Args:
+        value: int, bytes, str, list, dict, bool or None
+        
+    Returns:
+        Encoded CBOR
+    """
+    out = []
+    _encode(value, out)
+    return b"".join(out)
@@ -0,0 +1,328 @@
+"""
+Chain Cache: Two-tier TTL cache for Koios lookups
+In-memory LRU in front of an SQLite store, keyed by endpoint + address
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+class ChainCache:
+    """Per-endpoint TTL cache with stale-while-revalidate
+    
+    Values are kept as JSON text, so every hit hands out a fresh copy
+    that callers may modify. The memory tier answers repeat lookups in
+    microseconds; the SQLite tier keeps results across restarts and is
+    promoted into memory on a hit. An entry older than its endpoint's
+    TTL is still served as "stale" for STALE_WINDOW seconds so the
+    caller can refresh it in the background; after that it is a miss.
+    """
+    
+    FRESH = "fresh"
+    STALE = "stale"
+    
+    # Seconds an entry is fresh (None: never expires)
+    ENDPOINT_TTLS = {
+        "account_info": 20.0,
+        "account_assets": 20.0,
+        "account_addresses": 60.0,
+        "address_info": 20.0,
+        "address_assets": 20.0,
+        "address_txs": 20.0,
+        "asset_info": 3600.0,
+        "pool_info": 6 * 3600.0,
+        "pool_metadata": 6 * 3600.0,
+        "pool_list": 6 * 3600.0,
+        "tx_info": None,
+        "tx_metadata": None,
+        "block_info": None,
+    }
+    DEFAULT_TTL = 20.0
+    STALE_WINDOW = 300.0
+    DEFAULT_MAX_ENTRIES = 10000
+    PATH_ENV = "KOIOS_CACHE_PATH"
+    DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "data", "chain_cache.sqlite3")
+    
+    _shared: Optional["ChainCache"] = None
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, path: Optional[str] = None, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 ttls: Dict[str, Optional[float]] = None, stale_window: float = STALE_WINDOW):
+        """
+        Initialize chain cache
+        
+        Args:
+            path: SQLite file (None: memory tier only)
+            max_entries: Maximum entries in the memory tier
+            ttls: Per-endpoint TTL overrides
+            stale_window: Seconds past the TTL an entry is served as stale
+        """
+        self.max_entries = max_entries
+        self.ttls = dict(ChainCache.ENDPOINT_TTLS)
+        self.ttls.update(ttls or {})
+        self.stale_window = stale_window
+        self._memory: "OrderedDict[Tuple[str, str], Tuple[float, str]]" = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "disk_hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0}
+        self._db = self._open(path) if path else None
+    
+    @staticmethod
+    def shared() -> "ChainCache":
+        """
+        Get the process-wide cache (SQLite file from KOIOS_CACHE_PATH;
+        set it empty to keep the cache in memory only)
+        
+        Returns:
+            ChainCache
+        """
+        if ChainCache._shared is None:
+            with ChainCache._shared_lock:
+                if ChainCache._shared is None:
+                    path = os.environ.get(ChainCache.PATH_ENV, ChainCache.DEFAULT_PATH)
+                    ChainCache._shared = ChainCache(path or None)
+        return ChainCache._shared
+    
+    # ===== SQLite tier =====
+    
+    def _open(self, path: str) -> Optional[sqlite3.Connection]:
+        try:
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "endpoint TEXT NOT NULL, key TEXT NOT NULL, stored_at REAL NOT NULL, value TEXT NOT NULL, "
+                "PRIMARY KEY (endpoint, key)) WITHOUT ROWID"
+            )
+            self._prune(db)
+            return db
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️  Chain cache store unavailable, using memory only: {e}")
+            return None
+    
+    def _prune(self, db: sqlite3.Connection):
+        """Delete entries past their stale window"""
+        now = time.time()
+        db.execute("BEGIN")
+        for endpoint, ttl in self.ttls.items():
+            if ttl is not None:
+                db.execute("DELETE FROM entries WHERE endpoint = ? AND stored_at < ?",
+                           (endpoint, now - ttl - self.stale_window))
+        placeholders = ",".join("?" * len(self.ttls))
+        db.execute(f"DELETE FROM entries WHERE endpoint NOT IN ({placeholders}) AND stored_at < ?",
+                   (*self.ttls, now - self.DEFAULT_TTL - self.stale_window))
+        db.execute("COMMIT")
+    
+    # ===== Lookups =====
+    
+    def ttl(self, endpoint: str) -> Optional[float]:
+        """
+        Freshness lifetime of an endpoint's entries
+        
+        Args:
+            endpoint: Koios endpoint name
+            
+        Returns:
+            Seconds, or None if entries never expire
+        """
+        return self.ttls.get(endpoint, self.DEFAULT_TTL)
+    
+    def _state(self, endpoint: str, stored_at: float, now: float) -> Optional[str]:
+        ttl = self.ttl(endpoint)
+        if ttl is None:
+            return ChainCache.FRESH
+        age = now - stored_at
+        if age <= ttl:
+            return ChainCache.FRESH
+        if age <= ttl + self.stale_window:
+            return ChainCache.STALE
+        return None
+    
+    def _remember(self, entry_key: Tuple[str, str], stored_at: float, text: str):
+        """Insert into the memory tier; caller holds the lock"""
+        self._memory[entry_key] = (stored_at, text)
+        self._memory.move_to_end(entry_key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+    
+    def get(self, endpoint: str, key: str) -> Tuple[Any, Optional[str]]:
+        """
+        Look up one entry
+        
+        Args:
+            endpoint: Koios endpoint name
+            key: Address, stake address, pool id, ...
+            
+        Returns:
+            (value, "fresh" or "stale"), or (None, None) on a miss
+        """
+        entry_key = (endpoint, key)
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(entry_key)
+            from_disk = False
+            if entry is None and self._db is not None:
+                row = self._db.execute(
+                    "SELECT stored_at, value FROM entries WHERE endpoint = ? AND key = ?", entry_key
+                ).fetchone()
+                if row is not None:
+                    entry = (row[0], row[1])
+                    from_disk = True
+            
+            state = self._state(endpoint, entry[0], now) if entry is not None else None
+            if state is None:
+                if entry is not None:
+                    self._memory.pop(entry_key, None)
+                self._stats["misses"] += 1
+                return None, None
+            
+            if from_disk:
+                self._remember(entry_key, *entry)
+                self._stats["disk_hits"] += 1
+            else:
+                self._memory.move_to_end(entry_key)
+            self._stats["hits" if state == ChainCache.FRESH else "stale_hits"] += 1
+        return json.loads(entry[1]), state
+    
+    def get_fresh(self, endpoint: str, keys: Iterable[str]) -> Optional[Dict[str, Any]]:
+        """
+        Look up several entries from the memory tier, all or nothing
+        
+        Only counted as hits when every key is fresh in memory, so a
+        caller can fall back to get() per key without double counting.
+        
+        Args:
+            endpoint: Koios endpoint name
+            keys: Addresses, stake addresses, pool ids, ...
+            
+        Returns:
+            Dict key -> value, or None if any key is missing or stale
+        """
+        now = time.time()
+        texts = {}
+        with self._lock:
+            for key in keys:
+                entry = self._memory.get((endpoint, key))
+                if entry is None or self._state(endpoint, entry[0], now) != ChainCache.FRESH:
+                    return None
+                texts[key] = entry[1]
+            for key in texts:
+                self._memory.move_to_end((endpoint, key))
+            self._stats["hits"] += len(texts)
+        return {key: json.loads(text) for key, text in texts.items()}
+    
+    def put_many(self, endpoint: str, values: Dict[str, Any]):
+        """
+        Store entries of one endpoint (one SQLite transaction)
+        
+        Args:
+            endpoint: Koios endpoint name
+            values: key -> JSON-serializable value
+        """
+        if not values or self.ttl(endpoint) == 0:
+            return
+        now = time.time()
+        rows = [(endpoint, key, now, json.dumps(value, separators=(",", ":"))) for key, value in values.items()]
+        with self._lock:
+            for _, key, stored_at, text in rows:
+                self._remember((endpoint, key), stored_at, text)
+            if self._db is not None:
+                try:
+                    self._db.execute("BEGIN")
+                    self._db.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)", rows)
+                    self._db.execute("COMMIT")
+                except sqlite3.Error as e:
+                    if self._db.in_transaction:
+                        self._db.execute("ROLLBACK")
+                    print(f"⚠️  Chain cache write failed: {e}")
+    
+    def put(self, endpoint: str, key: str, value: Any):
+        """
+        Store one entry
+        
+        Args:
+            endpoint: Koios endpoint name
+            key: Address, stake address, pool id, ...
+            value: JSON-serializable value
+        """
+        self.put_many(endpoint, {key: value})
+    
+    # ===== Background refresh bookkeeping =====
+    
+    def claim_refresh(self, endpoint: str, keys: Iterable[str]) -> list:
+        """
+        Mark stale keys as being refreshed
+        
+        Args:
+            endpoint: Koios endpoint name
+            keys: Stale keys
+            
+        Returns:
+            Keys not already being refreshed by another caller
+        """
+        with self._lock:
+            claimed = [key for key in keys if (endpoint, key) not in self._refreshing]
+            self._refreshing.update((endpoint, key) for key in claimed)
+            if claimed:
+                self._stats["refreshes"] += 1
+        return claimed
+    
+    def release_refresh(self, endpoint: str, keys: Iterable[str]):
+        """Clear the refresh marks set by claim_refresh"""
+        with self._lock:
+            self._refreshing.difference_update((endpoint, key) for key in keys)
+    
+    # ===== Maintenance =====
+    
+    def invalidate(self, endpoint: str, key: str = None):
+        """
+        Drop entries of an endpoint (one key, or all of them)
+        
+        Args:
+            endpoint: Koios endpoint name
+            key: Key to drop (default: every key of the endpoint)
+        """
+        with self._lock:
+            for entry_key in [k for k in self._memory if k[0] == endpoint and key in (None, k[1])]:
+                del self._memory[entry_key]
+            if self._db is not None:
+                if key is None:
+                    self._db.execute("DELETE FROM entries WHERE endpoint = ?", (endpoint,))
+                else:
+                    self._db.execute("DELETE FROM entries WHERE endpoint = ? AND key = ?", (endpoint, key))
+    
+    def clear(self):
+        """Drop every entry from both tiers and reset the metrics"""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM entries")
+            for name in self._stats:
+                self._stats[name] = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache metrics since start (or the last clear)
+        
+        Returns:
+            Dict with hits, disk_hits, stale_hits, misses, refreshes,
+            hit_rate (fresh + stale hits over lookups) and memory_entries
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        lookups = stats["hits"] + stats["stale_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["hits"] + stats["stale_hits"]) / lookups if lookups else 0.0
+        return stats
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._memory)
@@ -0,0 +1,403 @@
+"""
+Chain Query Engine: Asyncio Koios client with rate limiting
+Token bucket + concurrency semaphore on a background event loop, sync wrappers,
+per-address result caching
+"""
+import asyncio
+import concurrent.futures
+import os
+import threading
+import time
+from functools import partial
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from utils.chain_cache import ChainCache
+from utils.http_session import HttpSession
+
+
+# (endpoint, JSON payload or None for GET)
+Call = Tuple[str, Optional[Dict]]
+
+
+class TokenBucket:
+    """Async token bucket: `rate` requests per second, bursts up to `burst`
+    
+    Only used from the engine's event loop, so no lock is needed: tokens
+    are checked and taken without awaiting in between.
+    """
+    
+    def __init__(self, rate: float, burst: int):
+        """
+        Initialize token bucket
+        
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity
+        """
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+    
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class ChainQueryEngine:
+    """Rate-limited, bounded-concurrency Koios queries
+    
+    Requests are coroutines on one background event loop. Each waits for
+    a token-bucket slot (matched to the Koios tier) and a semaphore slot,
+    then runs on the pooled HTTP session in a worker thread, so many
+    lookups overlap their network latency. Sync callers (GUI handlers,
+    the existing module functions) use call/call_many/iter_completed.
+    
+    With a cache, POST lookups keyed by a list of addresses (or stake
+    addresses, pool ids, ...) are answered per key: cached keys are served
+    directly, only the missing ones are requested, and stale keys are
+    refreshed in the background while their cached rows are returned.
+    """
+    
+    # Requests per second and burst per Koios tier (override: KOIOS_RATE_LIMIT)
+    TIER_LIMITS = {
+        "public": (5.0, 10),
+        "free": (10.0, 50),
+        "pro": (50.0, 250),
+    }
+    DEFAULT_TIER = "public"
+    DEFAULT_CONCURRENCY = 8
+    DEFAULT_URL = "https://api.koios.rest/api/v1"
+    TIMEOUT = 30
+    
+    # Payload list field -> row field holding the same key
+    KEY_FIELDS = {
+        "_addresses": "address",
+        "_stake_addresses": "stake_address",
+        "_pool_bech32_ids": "pool_id_bech32",
+        "_tx_hashes": "tx_hash",
+        "_block_hashes": "hash",
+    }
+    
+    _shared: Optional["ChainQueryEngine"] = None
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, base_url: str = None, rate: float = None, burst: int = None,
+                 concurrency: int = DEFAULT_CONCURRENCY, api_token: str = None,
+                 tier: str = DEFAULT_TIER, cache: ChainCache = None):
+        """
+        Initialize engine
+        
+        Args:
+            base_url: API base URL (default: KOIOS_API_URL or mainnet)
+            rate: Requests per second (default: tier limit)
+            burst: Requests allowed back to back (default: tier limit)
+            concurrency: Maximum requests in flight
+            api_token: Koios bearer token (tiers above public)
+            tier: Koios tier name
+            cache: Result cache (default: none)
+        """
+        tier_rate, tier_burst = ChainQueryEngine.TIER_LIMITS.get(
+            tier, ChainQueryEngine.TIER_LIMITS[ChainQueryEngine.DEFAULT_TIER]
+        )
+        self.base_url = (base_url or os.environ.get("KOIOS_API_URL") or ChainQueryEngine.DEFAULT_URL).rstrip("/")
+        self.rate = rate or tier_rate
+        self.burst = burst or tier_burst
+        self.concurrency = concurrency
+        self.headers = {"Content-Type": "application/json"}
+        if api_token:
+            self.headers["Authorization"] = f"Bearer {api_token}"
+        
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="chain-query"
+        )
+        self._bucket: Optional[TokenBucket] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._start_lock = threading.Lock()
+        self.cache = cache
+        self._refresh_tasks = set()
+    
+    @staticmethod
+    def shared() -> "ChainQueryEngine":
+        """
+        Get the process-wide engine (KOIOS_TIER, KOIOS_RATE_LIMIT,
+        KOIOS_CONCURRENCY, KOIOS_API_TOKEN from the environment),
+        backed by the shared chain cache
+        
+        Returns:
+            ChainQueryEngine
+        """
+        if ChainQueryEngine._shared is None:
+            with ChainQueryEngine._shared_lock:
+                if ChainQueryEngine._shared is None:
+                    try:
+                        rate = float(os.environ.get("KOIOS_RATE_LIMIT", 0)) or None
+                        concurrency = int(os.environ.get("KOIOS_CONCURRENCY", ChainQueryEngine.DEFAULT_CONCURRENCY))
+                    except ValueError:
+                        rate, concurrency = None, ChainQueryEngine.DEFAULT_CONCURRENCY
+                    ChainQueryEngine._shared = ChainQueryEngine(
+                        rate=rate,
+                        concurrency=concurrency,
+                        api_token=os.environ.get("KOIOS_API_TOKEN"),
+                        tier=os.environ.get("KOIOS_TIER", ChainQueryEngine.DEFAULT_TIER),
+                        cache=ChainCache.shared()
+                    )
+        return ChainQueryEngine._shared
+    
+    # ===== Event loop =====
+    
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop thread on first use"""
+        if self._loop is None:
+            with self._start_lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    self._thread = threading.Thread(target=loop.run_forever, name="chain-query-loop", daemon=True)
+                    self._thread.start()
+                    self._loop = loop
+        return self._loop
+    
+    def _submit(self, coro) -> concurrent.futures.Future:
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            # Blocking here would deadlock the loop the coroutine needs
+            coro.close()
+            raise RuntimeError("Sync call from the engine's own event loop; await the coroutine instead")
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+    
+    # ===== Async API =====
+    
+    def _url(self, endpoint: str) -> str:
+        return endpoint if endpoint.startswith(("http://", "https://")) else f"{self.base_url}/{endpoint}"
+    
+    def _send(self, endpoint: str, payload: Optional[Dict]) -> Any:
+        """Blocking HTTP request on the pooled session (runs in a worker thread)"""
+        session = HttpSession.shared()
+        if payload is None:
+            response = session.get(self._url(endpoint), headers=self.headers, timeout=self.TIMEOUT)
+        else:
+            response = session.post(self._url(endpoint), headers=self.headers, json=payload, timeout=self.TIMEOUT)
+        response.raise_for_status()
+        return response.json()
+    
+    # ===== Cache =====
+    
+    def _cache_keys(self, endpoint: str, payload: Optional[Dict]) -> Optional[Tuple[str, List[str]]]:
+        """(payload field, unique keys) if the call can be answered per key"""
+        if self.cache is None or not payload or len(payload) != 1 or "/" in endpoint:
+            return None
+        field, keys = next(iter(payload.items()))
+        if field not in self.KEY_FIELDS or not isinstance(keys, list):
+            return None
+        return field, list(dict.fromkeys(keys))
+    
+    def _lookup(self, endpoint: str, keys: List[str]) -> Tuple[Dict[str, List], List[str], List[str]]:
+        """Split keys into cached rows, stale keys and missing keys"""
+        cached, stale, missing = {}, [], []
+        for key in keys:
+            rows, state = self.cache.get(endpoint, key)
+            if state is None:
+                missing.append(key)
+                continue
+            cached[key] = rows
+            if state == ChainCache.STALE:
+                stale.append(key)
+        return cached, stale, missing
+    
+    def _fetch_keys(self, endpoint: str, field: str, keys: List[str]) -> Tuple[Optional[Dict[str, List]], Any]:
+        """
+        Request keys and cache their rows (runs in a worker thread)
+        
+        Returns:
+            (Dict key -> rows or None if rows cannot be matched to keys, raw response)
+        """
+        rows = self._send(endpoint, {field: keys})
+        if not isinstance(rows, list):
+            return None, rows
+        key_field = self.KEY_FIELDS[field]
+        if len(keys) == 1:
+            grouped = {keys[0]: rows}
+        elif all(isinstance(row, dict) and row.get(key_field) in keys for row in rows):
+            grouped = {key: [] for key in keys}
+            for row in rows:
+                grouped[row[key_field]].append(row)
+        else:
+            return None, rows
+        # Keys without rows are cached too: "not on chain" is an answer
+        self.cache.put_many(endpoint, grouped)
+        return grouped, rows
+    
+    async def _refresh(self, endpoint: str, field: str, keys: List[str]):
+        try:
+            async with self._semaphore:
+                await self._bucket.acquire()
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(self._executor, partial(self._fetch_keys, endpoint, field, keys))
+        except Exception:
+            pass
+        finally:
+            self.cache.release_refresh(endpoint, keys)
+    
+    def _start_refresh(self, endpoint: str, field: str, stale: List[str]):
+        """Refresh stale keys in the background (engine loop only)"""
+        claimed = self.cache.claim_refresh(endpoint, stale)
+        if claimed:
+            task = asyncio.ensure_future(self._refresh(endpoint, field, claimed))
+            self._refresh_tasks.add(task)
+            task.add_done_callback(self._refresh_tasks.discard)
+    
+    @staticmethod
+    def _merge(keys: List[str], grouped: Dict[str, List]) -> List:
+        return [row for key in keys for row in grouped.get(key, ())]
+    
+    def _cached_result(self, endpoint: str, payload: Optional[Dict]) -> Optional[List]:
+        """Rows if every key is cached and fresh, else None (sync fast path)"""
+        cache_keys = self._cache_keys(endpoint, payload)
+        if cache_keys is None:
+            return None
+        keys = cache_keys[1]
+        cached = self.cache.get_fresh(endpoint, keys)
+        return None if cached is None else self._merge(keys, cached)
+    
+    # ===== Requests =====
+    
+    async def request(self, endpoint: str, payload: Optional[Dict] = None) -> Any:
+        """
+        Rate-limited request (POST with payload, GET without), served
+        from the cache where possible
+        
+        Args:
+            endpoint: Endpoint name (e.g. "account_info") or absolute URL
+            payload: JSON body, or None for GET
+            
+        Returns:
+            Decoded JSON response
+        """
+        if asyncio.get_running_loop() is not self._loop:
+            # Awaited from another event loop: run on the engine's loop,
+            # where the semaphore and token bucket live
+            return await asyncio.wrap_future(self._submit(self.request(endpoint, payload)))
+        
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._bucket = TokenBucket(self.rate, self.burst)
+        
+        cache_keys = self._cache_keys(endpoint, payload)
+        if cache_keys is None:
+            send = partial(self._send, endpoint, payload)
+        else:
+            field, keys = cache_keys
+            cached, stale, missing = self._lookup(endpoint, keys)
+            if stale:
+                self._start_refresh(endpoint, field, stale)
+            if not missing:
+                return self._merge(keys, cached)
+            send = partial(self._fetch_keys, endpoint, field, missing)
+        
+        async with self._semaphore:
+            await self._bucket.acquire()
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(self._executor, send)
+        if cache_keys is None:
+            return response
+        grouped, rows = response
+        if grouped is None:
+            if not cached:
+                return rows
+            # Rows could not be matched to keys: cached rows first, then the rest
+            return self._merge(keys, cached) + list(rows or [])
+        cached.update(grouped)
+        return self._merge(keys, cached)
+    
+    async def _indexed(self, index: int, call: Call) -> Tuple[int, Any]:
+        try:
+            return index, await self.request(*call)
+        except Exception as e:
+            return index, e
+    
+    async def stream(self, calls: Iterable[Call]) -> AsyncIterator[Tuple[int, Any]]:
+        """
+        Run calls concurrently, yielding results as they complete
+        
+        Args:
+            calls: (endpoint, payload) pairs
+            
+        Yields:
+            (call index, response or Exception)
+        """
+        tasks = [asyncio.ensure_future(self._indexed(i, call)) for i, call in enumerate(calls)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    # ===== Sync wrappers =====
+    
+    def call(self, endpoint: str, payload: Optional[Dict] = None) -> Any:
+        """
+        Blocking rate-limited request
+        
+        Args:
+            endpoint: Endpoint name or absolute URL
+            payload: JSON body, or None for GET
+            
+        Returns:
+            Decoded JSON response (HTTP errors are raised)
+        """
+        rows = self._cached_result(endpoint, payload)
+        if rows is not None:
+            return rows
+        return self._submit(self.request(endpoint, payload)).result()
+    
+    def iter_completed(self, calls: Iterable[Call]) -> Iterator[Tuple[int, Any]]:
+        """
+        Run calls concurrently, yielding results in completion order
+        
+        Args:
+            calls: (endpoint, payload) pairs
+            
+        Yields:
+            (call index, response or Exception)
+        """
+        futures = {}
+        hits = []
+        for i, call in enumerate(calls):
+            rows = self._cached_result(*call)
+            if rows is not None:
+                hits.append((i, rows))
+            else:
+                futures[self._submit(self._indexed(i, call))] = i
+        try:
+            yield from hits
+            for future in concurrent.futures.as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+    
+    def call_many(self, calls: Iterable[Call]) -> List[Any]:
+        """
+        Run calls concurrently and wait for all of them
+        
+        Args:
+            calls: (endpoint, payload) pairs
+            
+        Returns:
+            Response or Exception per call, in input order
+        """
+        calls = list(calls)
+        results: List[Any] = [None] * len(calls)
+        for index, result in self.iter_completed(calls):
+            results[index] = result
+        return results
@@ -0,0 +1,242 @@
+"""
+Derivation Pool: Bulk address derivation across CPU cores
+Long-lived worker processes that derive batches of addresses per task
+"""
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from utils.address_generator import DerivationSession
+
+
+CHAINS = ("external", "internal")
+
+
+def normalize_chains(chains: Iterable[str]) -> List[str]:
+    """
+    Validate chain names, expanding "both" (ValueError on unknown names)
+    
+    Args:
+        chains: Chain names ("external", "internal" or "both")
+        
+    Returns:
+        Chain names without duplicates, in the given order
+    """
+    result = []
+    for chain in chains:
+        chain = chain.strip().lower()
+        expanded = CHAINS if chain == "both" else (chain,)
+        for name in expanded:
+            if name not in CHAINS:
+                raise ValueError(f"unknown chain '{chain}' (expected external, internal or both)")
+            if name not in result:
+                result.append(name)
+    if not result:
+        raise ValueError("no chains given")
+    return result
+
+
+def _derive_batch(account_key: str, network: str, is_external: bool,
+                  indices: List[int], cardano_address_exe: str = None) -> List[Dict]:
+    """
+    Worker task: derive a batch of payment addresses from one account key
+    
+    Args:
+        account_key: Account key (acct_xsk...)
+        network: "mainnet" or "testnet"
+        is_external: True for external (0/i), False for internal (1/i)
+        indices: Address indices to derive
+        cardano_address_exe: Path to cardano-address
+        
+    Returns:
+        List of address info dicts (failed indices are omitted)
+    """
+    session = DerivationSession.from_account_key(account_key, network, cardano_address_exe)
+    results = []
+    for index in indices:
+        addr_info = session.derive_payment_address(index, is_external)
+        if addr_info:
+            results.append(addr_info)
+    return results
+
+
+def derive_account(root_key: str, account_index: int, address_count: int,
+                   chains: List[str], network: str = "mainnet",
+                   cardano_address_exe: str = None) -> Optional[Dict]:
+    """
+    Worker task: derive addresses and stake address of one account
+    
+    Args:
+        root_key: Root key (root_xsk...)
+        account_index: BIP44 account index
+        address_count: Addresses per chain
+        chains: Chains to derive ("external", "internal")
+        network: "mainnet" or "testnet"
+        cardano_address_exe: Path to cardano-address
+        
+    Returns:
+        Dict with account addresses or None
+    """
+    chains = normalize_chains(chains)
+    session = DerivationSession.from_root_key(root_key, account_index, network, cardano_address_exe)
+    if not session:
+        return None
+    
+    addresses = []
+    for chain in chains:
+        for index in range(address_count):
+            addr_info = session.derive_payment_address(index, chain == "external")
+            if addr_info:
+                addresses.append(addr_info)
+    
+    return {
+        "account_index": account_index,
+        "network": network,
+        "addresses": addresses,
+        "stake_address": session.derive_stake_address()
+    }
+
+
+class DerivationPool:
+    """Process pool for bulk key derivation
+    
+    Workers are started once and reused, so bulk generation pays the
+    process start-up cost once instead of once per address. Each task
+    carries a batch of derivation paths and returns all of its results.
+    At most IN_FLIGHT_PER_WORKER tasks per worker are queued at a time, so
+    results are streamed and never held for the whole job.
+    """
+    
+    BATCH_SIZE = 32
+    IN_FLIGHT_PER_WORKER = 2
+    
+    _shared: Optional["DerivationPool"] = None
+    
+    def __init__(self, workers: int = None):
+        """
+        Initialize derivation pool
+        
+        Args:
+            workers: Number of worker processes (default: CPU count)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+    
+    @staticmethod
+    def shared(workers: int = None) -> "DerivationPool":
+        """
+        Get the process-wide pool, creating it on first use
+        
+        Args:
+            workers: Number of worker processes (default: CPU count)
+            
+        Returns:
+            DerivationPool
+        """
+        pool = DerivationPool._shared
+        if pool is None or (workers and pool.workers != workers):
+            if pool is not None:
+                pool.shutdown()
+            pool = DerivationPool(workers)
+            DerivationPool._shared = pool
+        return pool
+    
+    def shutdown(self):
+        """Stop worker processes"""
+        self.executor.shutdown(wait=True)
+        if DerivationPool._shared is self:
+            DerivationPool._shared = None
+    
+    def _stream(self, tasks: Iterable[Tuple[Callable, tuple]]) -> Iterator:
+        """
+        Run tasks with a bounded number in flight, yielding results as they complete
+        
+        Args:
+            tasks: (function, args) pairs, consumed lazily
+            
+        Yields:
+            Task results, in completion order
+        """
+        tasks = iter(tasks)
+        limit = self.workers * self.IN_FLIGHT_PER_WORKER
+        pending = set()
+        try:
+            while True:
+                for fn, args in tasks:
+                    pending.add(self.executor.submit(fn, *args))
+                    if len(pending) >= limit:
+                        break
+                if not pending:
+                    return
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+    
+    def iter_addresses(self, account_key: str, indices: List[int], is_external: bool = True,
+                       network: str = "mainnet", cardano_address_exe: str = None) -> Iterator[Dict]:
+        """
+        Derive payment addresses in batches, yielding them as batches complete
+        
+        Args:
+            account_key: Account key (acct_xsk...)
+            indices: Address indices to derive
+            is_external: True for external (0/i), False for internal (1/i)
+            network: "mainnet" or "testnet"
+            cardano_address_exe: Path to cardano-address
+            
+        Yields:
+            Address info dicts, in completion order
+        """
+        tasks = (
+            (_derive_batch, (account_key, network, is_external,
+                             indices[i:i + self.BATCH_SIZE], cardano_address_exe))
+            for i in range(0, len(indices), self.BATCH_SIZE)
+        )
+        for batch in self._stream(tasks):
+            yield from batch
+    
+    def derive_addresses(self, account_key: str, indices: List[int], is_external: bool = True,
+                         network: str = "mainnet", cardano_address_exe: str = None) -> List[Dict]:
+        """
+        Derive payment addresses in batches
+        
+        Args:
+            account_key: Account key (acct_xsk...)
+            indices: Address indices to derive
+            is_external: True for external (0/i), False for internal (1/i)
+            network: "mainnet" or "testnet"
+            cardano_address_exe: Path to cardano-address
+            
+        Returns:
+            Address info dicts ordered by index
+        """
+        results = list(self.iter_addresses(account_key, indices, is_external, network, cardano_address_exe))
+        return sorted(results, key=lambda info: info["index"])
+    
+    def iter_accounts(self, root_key: str, account_indices: List[int], address_count: int,
+                      chains: List[str], network: str = "mainnet",
+                      cardano_address_exe: str = None) -> Iterator[Optional[Dict]]:
+        """
+        Derive several accounts of one root key, one task per account
+        
+        Args:
+            root_key: Root key (root_xsk...)
+            account_indices: BIP44 account indices
+            address_count: Addresses per chain
+            chains: Chains to derive ("external", "internal")
+            network: "mainnet" or "testnet"
+            cardano_address_exe: Path to cardano-address
+            
+        Yields:
+            Account dicts (None for failed accounts), in completion order
+        """
+        chains = normalize_chains(chains)
+        tasks = (
+            (derive_account, (root_key, account_index, address_count,
+                              chains, network, cardano_address_exe))
+            for account_index in account_indices
+        )
+        yield from self._stream(tasks)
@@ -0,0 +1,321 @@
+"""
+Ed25519: Pure-Python curve arithmetic, signing and verification
+Standard (RFC 8032) and extended (BIP32-Ed25519) signing keys
+
+Extended keys are kL (32) || kR (32): kL is the already-clamped scalar
+and kR the nonce prefix, so no SHA-512 expansion of a seed is needed.
+"""
+import hashlib
+import secrets
+from typing import List, Optional, Sequence, Tuple
+
+
+# ===== Curve =====
+
+_P = 2 ** 255 - 19
+_L = 2 ** 252 + 27742317777372353535851937790883648493
+_D = -121665 * pow(121666, _P - 2, _P) % _P
+_D2 = 2 * _D % _P
+
+_BY = 4 * pow(5, _P - 2, _P) % _P
+_BX = 15112221349535400772501151409588531511454012693041857206046113283949847762202
+_B = (_BX, _BY, 1, _BX * _BY % _P)
+_IDENTITY = (0, 1, 1, 0)
+
+# sqrt(-1), used when decoding points
+_SQRT_M1 = pow(2, (_P - 1) // 4, _P)
+
+
+def _point_add(p1: tuple, p2: tuple) -> tuple:
+    x1, y1, z1, t1 = p1
+    x2, y2, z2, t2 = p2
+    a = (y1 - x1) * (y2 - x2) % _P
+    b = (y1 + x1) * (y2 + x2) % _P
+    c = t1 * _D2 * t2 % _P
+    d = 2 * z1 * z2 % _P
+    e, f, g, h = b - a, d - c, d + c, b + a
+    return (e * f % _P, g * h % _P, f * g % _P, e * h % _P)
+
+
+def _point_double(p1: tuple) -> tuple:
+    x1, y1, z1, _ = p1
+    a = x1 * x1 % _P
+    b = y1 * y1 % _P
+    c = 2 * z1 * z1 % _P
+    e = ((x1 + y1) * (x1 + y1) - a - b) % _P
+    g = b - a
+    f = g - c
+    h = -a - b
+    return (e * f % _P, g * h % _P, f * g % _P, e * h % _P)
+
+
+def _point_neg(p1: tuple) -> tuple:
+    x1, y1, z1, t1 = p1
+    return (-x1 % _P, y1, z1, -t1 % _P)
+
+
+def _is_identity(p1: tuple) -> bool:
+    x1, y1, z1, _ = p1
+    return x1 % _P == 0 and (y1 - z1) % _P == 0
+
+
+def _build_base_table() -> List[List[tuple]]:
+    # table[i][j] = j * 16^i * B, so a scalar multiplication is 64 additions
+    table = []
+    base = _B
+    for _ in range(64):
+        row = [_IDENTITY]
+        for _ in range(15):
+            row.append(_point_add(row[-1], base))
+        table.append(row)
+        base = _point_add(row[15], base)
+    return table
+
+
+_BASE_TABLE = _build_base_table()
+
+
+def _scalar_mult_base(scalar: int) -> tuple:
+    """scalar * B for secret scalars: one addition per nibble, zero nibbles included"""
+    scalar %= _L
+    point = _IDENTITY
+    for row in _BASE_TABLE:
+        # row[0] is the identity; the addition formula is complete
+        point = _point_add(point, row[scalar & 15])
+        scalar >>= 4
+    return point
+
+
+def _scalar_mult_base_vartime(scalar: int) -> tuple:
+    """scalar * B for public scalars (verification): zero nibbles are skipped"""
+    scalar %= _L
+    point = _IDENTITY
+    for row in _BASE_TABLE:
+        nibble = scalar & 15
+        if nibble:
+            point = _point_add(point, row[nibble])
+        scalar >>= 4
+    return point
+
+
+def _multi_scalar_mult(pairs: Sequence[Tuple[int, tuple]]) -> tuple:
+    """Sum of scalar_i * point_i, sharing the doublings (Straus, 4-bit windows)"""
+    tables = []
+    bits = 0
+    for scalar, point in pairs:
+        row = [_IDENTITY, point]
+        for _ in range(14):
+            row.append(_point_add(row[-1], point))
+        tables.append((scalar, row))
+        bits = max(bits, scalar.bit_length())
+    
+    result = _IDENTITY
+    for shift in range((bits + 3) // 4 * 4 - 4, -4, -4):
+        if result is not _IDENTITY:
+            for _ in range(4):
+                result = _point_double(result)
+        for scalar, row in tables:
+            nibble = (scalar >> shift) & 15
+            if nibble:
+                result = _point_add(result, row[nibble])
+    return result
+
+
+def _encode_point(point: tuple) -> bytes:
+    x, y, z, _ = point
+    zinv = pow(z, _P - 2, _P)
+    x = x * zinv % _P
+    y = y * zinv % _P
+    return (y | ((x & 1) << 255)).to_bytes(32, "little")
+
+
+def _decode_point(data: bytes) -> Optional[tuple]:
+    if len(data) != 32:
+        return None
+    value = int.from_bytes(data, "little")
+    sign = value >> 255
+    y = value & ((1 << 255) - 1)
+    if y >= _P:
+        return None
+    
+    # x^2 = (y^2 - 1) / (d y^2 + 1)
+    x2 = (y * y - 1) * pow(_D * y * y + 1, _P - 2, _P) % _P
+    x = pow(x2, (_P + 3) // 8, _P)
+    if (x * x - x2) % _P:
+        x = x * _SQRT_M1 % _P
+        if (x * x - x2) % _P:
+            return None
+    if x == 0 and sign:
+        return None
+    if x & 1 != sign:
+        x = _P - x
+    return (x, y, 1, x * y % _P)
+
+
+# ===== Signing =====
+
+def _clamp(h: bytes) -> bytes:
+    k = bytearray(h[:32])
+    k[0] &= 248
+    k[31] &= 127
+    k[31] |= 64
+    return bytes(k)
+
+
+def public_key_from_scalar(kl: bytes) -> bytes:
+    """
+    Public key A = kL * B
+    
+    Args:
+        kl: 32-byte little-endian scalar (clamped)
+        
+    Returns:
+        32-byte public key
+    """
+    return _encode_point(_scalar_mult_base(int.from_bytes(kl[:32], "little")))
+
+
+def expand_seed(seed: bytes) -> bytes:
+    """
+    Expand a 32-byte RFC 8032 seed to an extended key kL || kR
+    
+    Args:
+        seed: 32-byte private key seed
+        
+    Returns:
+        64-byte extended key
+    """
+    h = hashlib.sha512(seed).digest()
+    return _clamp(h[:32]) + h[32:]
+
+
+def sign_extended(extended_key: bytes, message: bytes, public_key: bytes = None) -> bytes:
+    """
+    Sign with an extended key (kL || kR)
+    
+    Args:
+        extended_key: 64-byte extended key (longer keys are truncated)
+        message: Message bytes
+        public_key: 32-byte public key (computed from kL if None)
+        
+    Returns:
+        64-byte signature R || S
+    """
+    kl, kr = extended_key[:32], extended_key[32:64]
+    if public_key is None:
+        public_key = public_key_from_scalar(kl)
+    r = int.from_bytes(hashlib.sha512(kr + message).digest(), "little") % _L
+    big_r = _encode_point(_scalar_mult_base(r))
+    k = int.from_bytes(hashlib.sha512(big_r + public_key + message).digest(), "little") % _L
+    s = (r + k * int.from_bytes(kl, "little")) % _L
+    return big_r + s.to_bytes(32, "little")
+
+
+def sign(seed: bytes, message: bytes) -> bytes:
+    """
+    Sign with a 32-byte RFC 8032 seed
+    
+    Args:
+        seed: 32-byte private key seed
+        message: Message bytes
+        
+    Returns:
+        64-byte signature
+    """
+    return sign_extended(expand_seed(seed), message)
+
+
+# ===== Verification =====
+
+def _challenge(r_bytes: bytes, public_key: bytes, message: bytes) -> int:
+    return int.from_bytes(hashlib.sha512(r_bytes + public_key + message).digest(), "little") % _L
+
+
+def _parse(public_key: bytes, message: bytes, signature: bytes) -> Optional[Tuple[tuple, tuple, int, int]]:
+    """Decode (A, R, S, k) of one signature, or None if it is malformed"""
+    if len(signature) != 64:
+        return None
+    s = int.from_bytes(signature[32:], "little")
+    if s >= _L:
+        return None
+    point_a = _decode_point(public_key)
+    point_r = _decode_point(signature[:32])
+    if point_a is None or point_r is None:
+        return None
+    return point_a, point_r, s, _challenge(signature[:32], public_key, message)
+
+
+def _check(parsed: Sequence[Tuple[tuple, tuple, int, int]]) -> bool:
+    """
+    Cofactored check of sum z_i (S_i B - R_i - k_i A_i) == 0
+    
+    A single signature uses z = 1; a batch uses random 128-bit z_i so a
+    forged signature cannot cancel out against the others.
+    """
+    if len(parsed) == 1:
+        point_a, point_r, s, k = parsed[0]
+        point = _point_add(_scalar_mult_base_vartime(s), _point_neg(point_r))
+        point = _point_add(point, _multi_scalar_mult([(k, _point_neg(point_a))]))
+    else:
+        s_sum = 0
+        pairs = []
+        for point_a, point_r, s, k in parsed:
+            z = secrets.randbits(128) | 1
+            s_sum += z * s
+            pairs.append((z, _point_neg(point_r)))
+            pairs.append((z * k % _L, _point_neg(point_a)))
+        point = _point_add(_scalar_mult_base_vartime(s_sum % _L), _multi_scalar_mult(pairs))
+    
+    for _ in range(3):
+        point = _point_double(point)
+    return _is_identity(point)
+
+
+def verify(public_key: bytes, message: bytes, signature: bytes) -> bool:
+    """
+    Verify one signature
+    
+    Args:
+        public_key: 32-byte public key
+        message: Message bytes
+        signature: 64-byte signature R || S
+        
+    Returns:
+        True if valid
+    """
+    parsed = _parse(public_key, message, signature)
+    return parsed is not None and _check([parsed])
+
+
+def verify_batch(items: Sequence[Tuple[bytes, bytes, bytes]]) -> List[bool]:
+    """
+    Verify many signatures with one combined check
+    
+    The combined check costs roughly half as much per signature as
+    separate checks. If it fails, the batch is split in halves until the
+    invalid signatures are found, so every item still gets its own result.
+    
+    Args:
+        items: (public key, message, signature) tuples
+        
+    Returns:
+        True/False per item, in input order
+    """
+    results = [False] * len(items)
+    pending = []
+    for i, (public_key, message, signature) in enumerate(items):
+        parsed = _parse(public_key, message, signature)
+        if parsed is not None:
+            pending.append((i, parsed))
+    
+    stack = [pending] if pending else []
+    while stack:
+        group = stack.pop()
+        if _check([parsed for _, parsed in group]):
+            for i, _ in group:
+                results[i] = True
+        elif len(group) > 1:
+            middle = len(group) // 2
+            stack.append(group[middle:])
+            stack.append(group[:middle])
+    return results
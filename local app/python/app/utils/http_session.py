@@ -0,0 +1,85 @@
+"""
+HTTP Session: One pooled requests.Session for all chain-API calls
+Keep-alive connections, bounded pool, retries with backoff, compression
+"""
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class HttpSession:
+    """Process-wide HTTP session
+    
+    Connections are kept alive and reused, so a warm lookup costs about
+    one round trip instead of a new TCP + TLS handshake. 429 and 5xx
+    responses are retried with exponential backoff (honouring
+    Retry-After); POST is retried too because Koios POST endpoints are
+    read-only queries.
+    """
+    
+    POOL_SIZE = 16
+    RETRIES = 3
+    BACKOFF_FACTOR = 0.5
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    
+    _shared: Optional[requests.Session] = None
+    _lock = threading.Lock()
+    
+    @staticmethod
+    def _accept_encoding() -> str:
+        """gzip/deflate always; brotli only if urllib3 can decode it"""
+        try:
+            import brotli  # noqa: F401
+            return "gzip, deflate, br"
+        except ImportError:
+            return "gzip, deflate"
+    
+    @staticmethod
+    def create(pool_size: int = POOL_SIZE, retries: int = RETRIES) -> requests.Session:
+        """
+        Create a pooled session
+        
+        Args:
+            pool_size: Maximum kept-alive connections per host
+            retries: Retries for connection errors, 429 and 5xx
+            
+        Returns:
+            requests.Session
+        """
+        retry = Retry(
+            total=retries,
+            backoff_factor=HttpSession.BACKOFF_FACTOR,
+            status_forcelist=HttpSession.RETRY_STATUSES,
+            allowed_methods=frozenset(["GET", "POST"]),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size,
+                              max_retries=retry, pool_block=True)
+        
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({
+            "Accept": "application/json",
+            "Accept-Encoding": HttpSession._accept_encoding(),
+            "Connection": "keep-alive"
+        })
+        return session
+    
+    @staticmethod
+    def shared() -> requests.Session:
+        """
+        Get the process-wide session, creating it on first use
+        
+        Returns:
+            requests.Session
+        """
+        if HttpSession._shared is None:
+            with HttpSession._lock:
+                if HttpSession._shared is None:
+                    HttpSession._shared = HttpSession.create()
+        return HttpSession._shared
@@ -0,0 +1,122 @@
+"""
+Key Store: Parsed signing keys cached by file identity
+Each .skey is read, parsed and decoded once; later signatures are pure CPU
+"""
+import atexit
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from utils.message_signer import MessageSigner
+
+
+class KeyStore:
+    """Cache of loaded signing keys keyed by path and file identity
+    
+    An entry is reused while the file's device, inode, size and mtime are
+    unchanged; a replaced or edited file is parsed again and the old key is
+    wiped. Key bytes live in the signer's bytearray, memory-locked where the
+    OS allows it, and are zeroized on eviction, invalidation or clear().
+    A caller still holding a wiped signer gets ValueError from sign(), so
+    it should call get() again rather than keep the signer around.
+    """
+    
+    DEFAULT_MAX_ENTRIES = 16
+    
+    _shared: Optional["KeyStore"] = None
+    
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize key store
+        
+        Args:
+            max_entries: Maximum number of loaded keys
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[tuple, MessageSigner]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def shared() -> "KeyStore":
+        """
+        Get the process-wide key store
+        
+        Returns:
+            KeyStore
+        """
+        if KeyStore._shared is None:
+            KeyStore._shared = KeyStore()
+            atexit.register(KeyStore._shared.clear)
+        return KeyStore._shared
+    
+    @staticmethod
+    def _identity(file_path: str) -> Optional[tuple]:
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+    
+    def get(self, file_path: str) -> Optional[MessageSigner]:
+        """
+        Get the signer for a .skey file, loading it if new or changed
+        
+        Args:
+            file_path: Path to .skey file
+            
+        Returns:
+            MessageSigner or None if the file is missing or not a supported key
+        """
+        path = os.path.abspath(file_path)
+        identity = KeyStore._identity(path)
+        if identity is None:
+            print(f"✗ Skey file not found: {file_path}")
+            self.invalidate(path)
+            return None
+        
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry and entry[0] == identity:
+                self._entries.move_to_end(path)
+                return entry[1]
+        
+        signer = MessageSigner.from_skey_file(path)
+        if signer is None:
+            self.invalidate(path)
+            return None
+        signer.lock_memory()
+        
+        with self._lock:
+            old = self._entries.pop(path, None)
+            if old:
+                old[1].wipe()
+            while len(self._entries) >= self.max_entries:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                evicted.wipe()
+            self._entries[path] = (identity, signer)
+        return signer
+    
+    def invalidate(self, file_path: str):
+        """
+        Drop and wipe the cached key of one file
+        
+        Args:
+            file_path: Path to .skey file
+        """
+        with self._lock:
+            entry = self._entries.pop(os.path.abspath(file_path), None)
+        if entry:
+            entry[1].wipe()
+    
+    def clear(self):
+        """Wipe and drop all loaded keys"""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for _, signer in entries:
+            signer.wipe()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,124 @@
+"""
+Koios Client: Batched Koios REST queries for address lists
+Splits address lists into chunks and queries chunks concurrently
+"""
+from typing import Dict, Iterable, List, Optional
+
+from utils.chain_query import ChainQueryEngine
+
+
+class KoiosClient:
+    """Koios client for many addresses at once
+    
+    Koios POST endpoints take arrays, so an address list is split into
+    chunks of CHUNK_SIZE and every (endpoint, chunk) request runs
+    concurrently on the chain query engine. Rows are merged back per
+    address as requests complete; a failed chunk marks only its own
+    addresses with the error.
+    """
+    
+    CHUNK_SIZE = 500
+    
+    _shared: Optional["KoiosClient"] = None
+    
+    def __init__(self, base_url: str = None, chunk_size: int = CHUNK_SIZE,
+                 engine: ChainQueryEngine = None):
+        """
+        Initialize Koios client
+        
+        Args:
+            base_url: API base URL (default: the shared engine's)
+            chunk_size: Addresses per request
+            engine: Chain query engine (default: shared, or a new one for base_url)
+        """
+        if engine is None:
+            engine = ChainQueryEngine(base_url) if base_url else ChainQueryEngine.shared()
+        self.engine = engine
+        self.chunk_size = chunk_size
+    
+    @staticmethod
+    def shared() -> "KoiosClient":
+        """
+        Get the process-wide client
+        
+        Returns:
+            KoiosClient
+        """
+        if KoiosClient._shared is None:
+            KoiosClient._shared = KoiosClient()
+        return KoiosClient._shared
+    
+    @staticmethod
+    def chunks(items: List[str], size: int) -> List[List[str]]:
+        """Split a list into consecutive chunks of at most size items"""
+        return [items[i:i + size] for i in range(0, len(items), size)]
+    
+    def post(self, endpoint: str, payload: Dict) -> List[Dict]:
+        """
+        POST to a Koios endpoint
+        
+        Args:
+            endpoint: Endpoint name (e.g. "address_info")
+            payload: JSON body
+            
+        Returns:
+            Response rows
+        """
+        return self.engine.call(endpoint, payload) or []
+    
+    def query_addresses(self, addresses: Iterable[str],
+                        endpoints: Iterable[str] = ("address_info", "address_assets")) -> Dict[str, Dict]:
+        """
+        Query address endpoints for any number of addresses
+        
+        Args:
+            addresses: Payment addresses (duplicates are queried once)
+            endpoints: "address_info" and/or "address_assets"
+            
+        Returns:
+            Dict address -> {"info": row or None, "assets": [rows], "error": str or None}
+        """
+        unique = list(dict.fromkeys(addresses))
+        results = {address: {"info": None, "assets": [], "error": None} for address in unique}
+        tasks = [
+            (endpoint, chunk)
+            for chunk in KoiosClient.chunks(unique, self.chunk_size)
+            for endpoint in endpoints
+        ]
+        if not tasks:
+            return results
+        
+        calls = [(endpoint, {"_addresses": chunk}) for endpoint, chunk in tasks]
+        for index, rows in self.engine.iter_completed(calls):
+            endpoint, chunk = tasks[index]
+            if isinstance(rows, Exception):
+                for address in chunk:
+                    results[address]["error"] = f"{endpoint}: {rows}"
+                continue
+            
+            for row in rows or []:
+                entry = results.get(row.get("address"))
+                if entry is None:
+                    continue
+                if endpoint == "address_info":
+                    entry["info"] = row
+                elif "asset_list" in row:
+                    entry["assets"].extend(row["asset_list"] or [])
+                else:
+                    entry["assets"].append(row)
+        
+        print(f"✓ Queried {len(unique)} addresses in {len(tasks)} requests")
+        return results
+    
+    def address_info(self, addresses: Iterable[str]) -> Dict[str, Optional[Dict]]:
+        """
+        address_info for any number of addresses
+        
+        Args:
+            addresses: Payment addresses
+            
+        Returns:
+            Dict address -> info row (None if unknown to the chain or failed)
+        """
+        results = self.query_addresses(addresses, ("address_info",))
+        return {address: entry["info"] for address, entry in results.items()}
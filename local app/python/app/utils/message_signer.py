@@ -0,0 +1,146 @@
+"""
+Message Signer: In-process Ed25519 signing with a Cardano signing key
+Replaces a cardano-signer subprocess per signature
+"""
+import ctypes
+import os
+import threading
+from typing import Optional, Union
+
+from utils import ed25519
+from utils.skey_handler import SkeyHandler
+
+
+def _lock_memory(buffer: bytearray, lock: bool = True) -> bool:
+    """Best-effort mlock/VirtualLock so key bytes are not written to swap"""
+    try:
+        address = ctypes.c_void_p(ctypes.addressof((ctypes.c_char * len(buffer)).from_buffer(buffer)))
+        size = ctypes.c_size_t(len(buffer))
+        if os.name == "nt":
+            kernel32 = ctypes.windll.kernel32
+            func = kernel32.VirtualLock if lock else kernel32.VirtualUnlock
+            return bool(func(address, size))
+        libc = ctypes.CDLL(None)
+        func = libc.mlock if lock else libc.munlock
+        return func(address, size) == 0
+    except Exception:
+        return False
+
+
+class MessageSigner:
+    """Sign messages with one loaded signing key
+    
+    Normal (32-byte seed) and extended BIP32-Ed25519 keys are both turned
+    into kL || kR once, held in a bytearray and reused for every signature.
+    Output matches `cardano-signer sign`: "<signature hex> <public key hex>".
+    Once wiped, the signer refuses to sign instead of using the zeroed key.
+    """
+    
+    def __init__(self, key: bytes):
+        """
+        Initialize signer
+        
+        Args:
+            key: Raw key bytes (32 seed, 64 kL||kR, 96 xprv, 128 cardano-cli bip32)
+        """
+        if len(key) == 32:
+            self._key = bytearray(ed25519.expand_seed(key))
+        else:
+            self._key = bytearray(key[:64])
+        
+        if len(key) == 128:
+            # kL || kR || public key || chain code
+            self.public_key = bytes(key[64:96])
+        else:
+            self.public_key = ed25519.public_key_from_scalar(bytes(self._key[:32]))
+        self._locked = False
+        self._wiped = False
+        self._key_lock = threading.Lock()
+    
+    @staticmethod
+    def from_signing_key(signing_key: str) -> Optional["MessageSigner"]:
+        """
+        Create signer from a signing key string
+        
+        Args:
+            signing_key: cborHex, hex or bech32 signing key
+            
+        Returns:
+            MessageSigner or None if the key is not recognized
+        """
+        raw = SkeyHandler.decode_signing_key(signing_key)
+        if raw is None:
+            return None
+        return MessageSigner(raw)
+    
+    @staticmethod
+    def from_skey_file(skey_file: str) -> Optional["MessageSigner"]:
+        """
+        Create signer from a .skey file
+        
+        Args:
+            skey_file: Path to .skey file
+            
+        Returns:
+            MessageSigner or None
+        """
+        content = SkeyHandler.load_skey(skey_file)
+        if not content:
+            return None
+        signing_key = SkeyHandler.extract_signing_key(content)
+        return MessageSigner.from_signing_key(signing_key)
+    
+    def sign(self, message: Union[str, bytes]) -> bytes:
+        """
+        Sign a message (ValueError if the key has been wiped)
+        
+        Args:
+            message: Message text (UTF-8) or bytes
+            
+        Returns:
+            64-byte Ed25519 signature
+        """
+        if isinstance(message, str):
+            message = message.encode("utf-8")
+        with self._key_lock:
+            if self._wiped:
+                raise ValueError("Signing key has been wiped")
+            key = bytes(self._key)
+        return ed25519.sign_extended(key, message, self.public_key)
+    
+    def sign_hex(self, message: Union[str, bytes]) -> str:
+        """
+        Sign a message, formatted like `cardano-signer sign` (ValueError if wiped)
+        
+        Args:
+            message: Message text (UTF-8) or bytes
+            
+        Returns:
+            "<signature hex> <public key hex>"
+        """
+        return f"{self.sign(message).hex()} {self.public_key.hex()}"
+    
+    def lock_memory(self) -> bool:
+        """
+        Lock the key bytes in RAM (best effort)
+        
+        Returns:
+            True if the OS locked the pages
+        """
+        if not self._locked:
+            self._locked = _lock_memory(self._key)
+        return self._locked
+    
+    @property
+    def wiped(self) -> bool:
+        """True once wipe() has run"""
+        return self._wiped
+    
+    def wipe(self):
+        """Overwrite the key material; later sign() calls raise ValueError"""
+        with self._key_lock:
+            self._wiped = True
+            self._key[:] = bytes(len(self._key))
+            if self._locked:
+                _lock_memory(self._key, lock=False)
+                self._locked = False
@@ -2,9 +2,11 @@
 BIP39 Mnemonic Generator
 Generate random BIP39 mnemonics
 """
-import random
+import secrets
 from typing import List, Optional
 
+from utils.bip39 import BIP39
+
 
 class MnemonicGenerator:
     """Generate BIP39 mnemonics"""
@@ -17,48 +19,21 @@ class MnemonicGenerator:
         Load BIP39 wordlist from file
         
         Args:
-            path: Path to wordlist file (auto-find if None)
+            path: Path to wordlist file (None returns the shared English list)
             
         Returns:
             List of words or empty list if not found
         """
-        import os
-        
-        if path is None:
-            paths = [
-                "./wordlist.txt",
-                "./end-user-app/wordlist.txt",
-                "./python/data/wordlist.txt",
-                os.path.join(os.path.dirname(__file__), "../../data/wordlist.txt"),
-                os.path.join(os.path.dirname(__file__), "../data/wordlist.txt"),
-            ]
-            
-            for p in paths:
-                if os.path.exists(p):
-                    path = p
-                    break
-        
-        if not path or not os.path.exists(path):
-            print(f"⚠️  Wordlist not found")
-            return []
-        
-        try:
-            with open(path, 'r', encoding='utf-8') as f:
-                words = [line.strip().lower() for line in f if line.strip() and line.strip().isalpha()]
-            print(f"✓ Loaded {len(words)} words from wordlist")
-            return words
-        except Exception as e:
-            print(f"✗ Error loading wordlist: {e}")
-            return []
+        return BIP39.load_wordlist(path)
     
     @staticmethod
     def generate_mnemonic(word_count: int = 12, wordlist: List[str] = None) -> Optional[str]:
         """
-        Generate random BIP39 mnemonic
+        Generate random BIP39 mnemonic (OS entropy, valid checksum)
         
         Args:
             word_count: Number of words (12, 15, or 24)
-            wordlist: List of valid BIP39 words
+            wordlist: 2048-word list (default: shared English list)
             
         Returns:
             Mnemonic phrase or None
@@ -67,18 +42,28 @@ class MnemonicGenerator:
             print(f"✗ Invalid word count: {word_count} (must be 12, 15, or 24)")
             return None
         
-        if not wordlist:
-            wordlist = MnemonicGenerator.load_wordlist()
-        
-        if not wordlist:
-            print("✗ No wordlist available for mnemonic generation")
+        if wordlist is not None and len(wordlist) != 2048:
+            print("✗ Wordlist must have 2048 words")
             return None
         
         try:
-            words = random.choices(wordlist, k=word_count)
-            mnemonic = " ".join(words)
+            mnemonic = BIP39.entropy_to_mnemonic(secrets.token_bytes(word_count * 4 // 3), wordlist)
             print(f"✓ Generated {word_count}-word mnemonic")
             return mnemonic
         except Exception as e:
             print(f"✗ Error generating mnemonic: {e}")
             return None
+    
+    @staticmethod
+    def generate_batch(count: int, word_count: int = 12) -> List[str]:
+        """
+        Generate many random mnemonics from one entropy read
+        
+        Args:
+            count: Number of mnemonics
+            word_count: Number of words each (12, 15, or 24)
+            
+        Returns:
+            List of mnemonic phrases
+        """
+        return BIP39.generate_batch(count, word_count)
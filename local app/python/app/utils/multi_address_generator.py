@@ -6,7 +6,9 @@ import json
 import os
 from typing import List, Dict, Optional
 from utils.cardano_address import CardanoAddressGenerator
-from utils.address_generator import AddressGenerator
+from utils.address_generator import DerivationSession
+from utils.derivation_pool import CHAINS, DerivationPool, derive_account, normalize_chains
+from utils.wallet_index import WalletIndex
 
 
 class MultiAddressGenerator:
@@ -24,9 +26,12 @@ class MultiAddressGenerator:
         self.network = network
         self.addresses = []
         self.stake_address = None
+        self.account_index = 0
+        self.index = WalletIndex()
     
     def generate_multiple_addresses(self, mnemonic: str, account_index: int = 0,
-                                   address_count: int = 5, is_external: bool = True) -> Optional[Dict]:
+                                   address_count: int = 5, is_external: bool = True,
+                                   workers: int = 1) -> Optional[Dict]:
         """
         Generate multiple addresses
         
@@ -35,34 +40,51 @@ class MultiAddressGenerator:
             account_index: BIP44 account index
             address_count: Number of addresses to generate
             is_external: True for external, False for internal
+            workers: Worker processes for bulk derivation (1 = in this process)
             
         Returns:
             Dict with addresses and stake address or None
         """
         print(f"[*] Generating {address_count} {'external' if is_external else 'internal'} addresses...")
         
+        # Root and account keys are derived once for all addresses
+        session = DerivationSession(mnemonic, account_index, self.network)
+        if not session.open():
+            print("✗ Failed to derive account key")
+            return None
+        
         addresses = []
-        for i in range(address_count):
-            addr_info = AddressGenerator.generate_payment_address(
-                mnemonic, account_index, i, is_external, self.network
+        if workers > 1 and address_count > 1:
+            pool = DerivationPool.shared(workers)
+            addresses = pool.derive_addresses(
+                session.account_key, list(range(address_count)), is_external,
+                self.network, session.cardano_address_exe
             )
-            if addr_info:
-                addresses.append(addr_info)
-            else:
-                print(f"⚠️  Skipping address {i}")
+            if len(addresses) < address_count:
+                print(f"⚠️  Skipped {address_count - len(addresses)} addresses")
+        else:
+            for i in range(address_count):
+                print(f"[*] Generating {'external' if is_external else 'internal'} address {i}...")
+                addr_info = session.derive_payment_address(i, is_external)
+                if addr_info:
+                    addresses.append(addr_info)
+                else:
+                    print(f"⚠️  Skipping address {i}")
         
         if not addresses:
             print("✗ Failed to generate any addresses")
             return None
         
         # Generate stake address
-        stake_addr = AddressGenerator.generate_stake_address(mnemonic, account_index)
+        stake_addr = session.derive_stake_address()
         if not stake_addr:
             print("✗ Failed to generate stake address")
             return None
         
         self.addresses = addresses
         self.stake_address = stake_addr
+        self.account_index = account_index
+        self.index.update(addresses, stake_addr, account_index)
         
         result = {
             "mnemonic": mnemonic,
@@ -76,6 +98,107 @@ class MultiAddressGenerator:
         print(f"✓ Generated {len(addresses)} addresses")
         return result
     
+    def generate_accounts(self, mnemonic: str, account_indices: List[int],
+                          address_count: int = 5, chains: List[str] = None,
+                          output_file: str = None, workers: int = 1) -> Optional[Dict]:
+        """
+        Derive several accounts in one pass, streaming each to a JSONL file
+        
+        The root key is derived once. Each finished account is appended to
+        output_file as one JSON line and is not kept in memory.
+        
+        Args:
+            mnemonic: BIP39 mnemonic phrase
+            account_indices: BIP44 account indices
+            address_count: Addresses per chain
+            chains: Chains to derive (default: external and internal)
+            output_file: JSONL output path (default: <wallet_path>/accounts.jsonl)
+            workers: Worker processes, one account per task (1 = in this process)
+            
+        Returns:
+            Summary dict or None
+        """
+        try:
+            chains = normalize_chains(chains or CHAINS)
+        except ValueError as e:
+            print(f"✗ {e}")
+            return None
+        if not output_file:
+            output_file = os.path.join(self.wallet_path, "accounts.jsonl")
+        
+        print(f"[*] Generating {len(account_indices)} accounts ({', '.join(chains)})...")
+        
+        # Root key is derived once for all accounts
+        cardano_address_exe = None
+        if CardanoAddressGenerator.requires_executable():
+            cardano_address_exe = CardanoAddressGenerator.find_cardano_address_exe()
+        root_key = CardanoAddressGenerator.get_root_key(mnemonic, cardano_address_exe)
+        if not root_key:
+            print("✗ Failed to generate root key")
+            return None
+        
+        if workers > 1 and len(account_indices) > 1:
+            accounts = DerivationPool.shared(workers).iter_accounts(
+                root_key, account_indices, address_count, chains,
+                self.network, cardano_address_exe
+            )
+        else:
+            accounts = (
+                derive_account(root_key, account_index, address_count, chains,
+                               self.network, cardano_address_exe)
+                for account_index in account_indices
+            )
+        
+        written = 0
+        failed = 0
+        try:
+            os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+            with open(output_file, 'w') as f:
+                for account in accounts:
+                    if not account:
+                        failed += 1
+                        continue
+                    f.write(json.dumps(account) + "\n")
+                    f.flush()
+                    written += 1
+                    print(f"✓ Account {account['account_index']}: {len(account['addresses'])} addresses")
+        except Exception as e:
+            print(f"✗ Error writing accounts: {e}")
+            return None
+        
+        print(f"✓ Generated {written} accounts -> {output_file}")
+        return {
+            "accounts": written,
+            "failed": failed,
+            "network": self.network,
+            "output_file": output_file
+        }
+    
+    def generate_from_file(self, mnemonic_file: str, account_index: int = 0,
+                           address_count: int = 1, output_file: str = None,
+                           workers: int = None, resume: bool = True) -> Optional[Dict]:
+        """
+        Derive a wallet for every mnemonic in a file, streaming to JSONL
+        
+        Args:
+            mnemonic_file: Text file with one mnemonic per line
+            account_index: BIP44 account index
+            address_count: External addresses per wallet
+            output_file: JSONL output path (default: <wallet_path>/wallets.jsonl)
+            workers: Worker processes (default: CPU count)
+            resume: Skip mnemonics already present in output_file
+            
+        Returns:
+            Summary dict or None
+        """
+        from utils.bulk_wallets import BulkWalletPipeline
+        
+        if not output_file:
+            output_file = os.path.join(self.wallet_path, "wallets.jsonl")
+        
+        pipeline = BulkWalletPipeline(self.network, account_index, address_count, workers)
+        return pipeline.run(mnemonic_file, output_file, resume)
+    
     def generate_single_address(self, mnemonic: str, account_index: int = 0,
                                address_index: int = 0, is_external: bool = True) -> Optional[Dict]:
         """
@@ -90,19 +213,23 @@ class MultiAddressGenerator:
         Returns:
             Dict with address info or None
         """
-        addr_info = AddressGenerator.generate_payment_address(
-            mnemonic, account_index, address_index, is_external, self.network
-        )
+        session = DerivationSession(mnemonic, account_index, self.network)
+        if not session.open():
+            return None
+        
+        addr_info = session.derive_payment_address(address_index, is_external)
         if not addr_info:
             return None
         
         # Also get stake address
-        stake_addr = AddressGenerator.generate_stake_address(mnemonic, account_index)
+        stake_addr = session.derive_stake_address()
         if not stake_addr:
             print("⚠️  Could not generate stake address")
         
         self.addresses = [addr_info]
         self.stake_address = stake_addr
+        self.account_index = account_index
+        self.index.update(self.addresses, stake_addr, account_index)
         
         result = {
             "address_info": addr_info,
@@ -111,10 +238,51 @@ class MultiAddressGenerator:
         
         return result
     
+    def _wallet_file(self, wallet_name: str) -> str:
+        return os.path.join(self.wallet_path, f"{wallet_name}.json")
+    
+    def load_index(self, wallet_name: str) -> WalletIndex:
+        """
+        Load the reverse index saved with a wallet
+        
+        Args:
+            wallet_name: Wallet name
+            
+        Returns:
+            WalletIndex (empty if the wallet has none)
+        """
+        wallet_file = self._wallet_file(wallet_name)
+        if not os.path.exists(wallet_file):
+            return WalletIndex()
+        try:
+            with open(wallet_file, 'r') as f:
+                return WalletIndex.from_dict(json.load(f).get("index", {}))
+        except Exception as e:
+            print(f"⚠️  Could not read wallet index: {e}")
+            return WalletIndex()
+    
+    def lookup(self, key: str, wallet_name: str = None) -> Optional[Dict]:
+        """
+        Find the derivation path of an address, stake address, public key or key hash
+        
+        Args:
+            key: Address, stake address, addr_vk/stake_vk or hex key hash
+            wallet_name: Saved wallet to search (default: addresses derived in this session)
+            
+        Returns:
+            Dict with account, chain and index, or None
+        """
+        index = self.load_index(wallet_name) if wallet_name else self.index
+        return index.lookup(key)
+    
     def save_wallet(self, wallet_name: str) -> bool:
         """
         Save wallet to JSON file
         
+        The reverse index (address/key hash -> account, chain, index) is
+        saved with the wallet. Entries already in the saved index are kept,
+        so deriving more addresses only adds the new ones.
+        
         Args:
             wallet_name: Wallet name
             
@@ -128,17 +296,26 @@ class MultiAddressGenerator:
         try:
             os.makedirs(self.wallet_path, exist_ok=True)
             
-            wallet_file = os.path.join(self.wallet_path, f"{wallet_name}.json")
+            wallet_file = self._wallet_file(wallet_name)
+            
+            index = self.load_index(wallet_name)
+            saved_entries = len(index)
+            for key, path in self.index.entries.items():
+                index.entries.setdefault(key, path)
+            index.update(self.addresses, self.stake_address, self.account_index)
+            added = len(index) - saved_entries
             
             wallet_data = {
                 "addresses": self.addresses,
-                "stake_address": self.stake_address
+                "stake_address": self.stake_address,
+                "index": index.to_dict()
             }
             
             with open(wallet_file, 'w') as f:
                 json.dump(wallet_data, f, indent=2)
             
-            print(f"✓ Wallet saved: {wallet_file}")
+            self.index = index
+            print(f"✓ Wallet saved: {wallet_file} ({len(index)} index entries, {added} new)")
             return True
         except Exception as e:
             print(f"✗ Error saving wallet: {e}")
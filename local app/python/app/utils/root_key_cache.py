@@ -0,0 +1,132 @@
+"""
+Root Key Cache: Short-lived in-memory cache of mnemonic -> root key
+Skips repeated PBKDF2 runs for the same wallet within a session
+"""
+import atexit
+import hashlib
+import hmac
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+
+class RootKeyCache:
+    """Size-bounded TTL cache of root keys
+    
+    Entries are keyed by an HMAC of the normalized mnemonic and passphrase
+    under a random per-process key, so neither the phrase nor a stable hash
+    of it is kept. Root keys are held in bytearrays that are overwritten
+    with zeros when they expire, are evicted, or the cache is cleared.
+    """
+    
+    DEFAULT_TTL = 120.0
+    DEFAULT_MAX_ENTRIES = 8
+    TTL_ENV = "CARDANO_ROOT_KEY_CACHE_TTL"
+    
+    _shared: Optional["RootKeyCache"] = None
+    
+    def __init__(self, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize root key cache
+        
+        Args:
+            ttl: Seconds an entry lives after it is stored (0 disables caching)
+            max_entries: Maximum number of cached root keys
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._hmac_key = secrets.token_bytes(32)
+        self._entries: "OrderedDict[str, Tuple[bytearray, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def shared() -> "RootKeyCache":
+        """
+        Get the process-wide cache (TTL from CARDANO_ROOT_KEY_CACHE_TTL)
+        
+        Returns:
+            RootKeyCache
+        """
+        if RootKeyCache._shared is None:
+            try:
+                ttl = float(os.environ.get(RootKeyCache.TTL_ENV, RootKeyCache.DEFAULT_TTL))
+            except ValueError:
+                ttl = RootKeyCache.DEFAULT_TTL
+            RootKeyCache._shared = RootKeyCache(ttl)
+            atexit.register(RootKeyCache._shared.clear)
+        return RootKeyCache._shared
+    
+    def _key(self, mnemonic: str, passphrase: str) -> str:
+        normalized = " ".join(mnemonic.lower().split())
+        message = normalized.encode("utf-8") + b"\x00" + passphrase.encode("utf-8")
+        return hmac.new(self._hmac_key, message, hashlib.sha256).hexdigest()
+    
+    @staticmethod
+    def _zeroize(buffer: bytearray):
+        buffer[:] = bytes(len(buffer))
+    
+    def _expire(self, now: float):
+        """Drop expired entries (oldest first); caller holds the lock"""
+        while self._entries:
+            key, (buffer, expires) = next(iter(self._entries.items()))
+            if expires > now:
+                break
+            self._zeroize(buffer)
+            del self._entries[key]
+    
+    def get(self, mnemonic: str, passphrase: str = "") -> Optional[bytes]:
+        """
+        Get a cached root key
+        
+        Args:
+            mnemonic: BIP39 mnemonic phrase
+            passphrase: Optional second-factor passphrase
+            
+        Returns:
+            Root key bytes or None if not cached
+        """
+        if self.ttl <= 0:
+            return None
+        key = self._key(mnemonic, passphrase)
+        with self._lock:
+            self._expire(time.monotonic())
+            entry = self._entries.get(key)
+            return bytes(entry[0]) if entry else None
+    
+    def put(self, mnemonic: str, passphrase: str, root_key: bytes):
+        """
+        Store a root key
+        
+        Args:
+            mnemonic: BIP39 mnemonic phrase
+            passphrase: Optional second-factor passphrase
+            root_key: Root key bytes
+        """
+        if self.ttl <= 0 or self.max_entries <= 0:
+            return
+        key = self._key(mnemonic, passphrase)
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            old = self._entries.pop(key, None)
+            if old:
+                self._zeroize(old[0])
+            while len(self._entries) >= self.max_entries:
+                _, (buffer, _) = self._entries.popitem(last=False)
+                self._zeroize(buffer)
+            self._entries[key] = (bytearray(root_key), now + self.ttl)
+    
+    def clear(self):
+        """Zeroize and drop all entries"""
+        with self._lock:
+            for buffer, _ in self._entries.values():
+                self._zeroize(buffer)
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire(time.monotonic())
+            return len(self._entries)
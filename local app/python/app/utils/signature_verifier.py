@@ -0,0 +1,259 @@
+"""
+Signature Verifier: In-process Ed25519 verification for many submissions
+Batch verification per chunk, chunks spread over worker processes
+"""
+import base64
+import binascii
+import hashlib
+from typing import List, Optional, Sequence, Tuple, Union
+
+from utils import bech32, ed25519
+
+
+Item = Tuple[Union[str, bytes, None], Union[str, bytes], Union[str, bytes]]
+# (address, stake address or None) a submission claims to sign for
+Claims = Tuple[Union[str, bytes], Optional[Union[str, bytes]]]
+# Stake credential: (is script, 28-byte hash)
+StakeCredential = Tuple[bool, bytes]
+
+
+def verify_chunk(items: List[Tuple[bytes, bytes, bytes]]) -> List[bool]:
+    """
+    Worker task: batch-verify one chunk of decoded signatures
+    
+    Args:
+        items: (public key, message, signature) byte tuples
+        
+    Returns:
+        True/False per item
+    """
+    return ed25519.verify_batch(items)
+
+
+class SignatureVerifier:
+    """Verify lists of (public key, message, signature) without cardano-signer
+    
+    Keys and signatures are decoded once in the calling process; chunks of
+    CHUNK_SIZE are batch-verified, in worker processes when there are more
+    than POOL_THRESHOLD items.
+    """
+    
+    CHUNK_SIZE = 64
+    POOL_THRESHOLD = 256
+    
+    # CIP-19 header types: key-hash payment credential (base, pointer,
+    # enterprise), base addresses (stake credential second), reward addresses
+    PAYMENT_KEY_TYPES = (0x0, 0x2, 0x4, 0x6)
+    BASE_TYPES = (0x0, 0x1, 0x2, 0x3)
+    REWARD_TYPES = (0xE, 0xF)
+    CREDENTIAL_SIZE = 28
+    
+    @staticmethod
+    def credentials(address: Union[str, bytes]) -> Tuple[Optional[bytes], Optional[StakeCredential]]:
+        """
+        Payment key hash and stake credential of an address
+        
+        Args:
+            address: Bech32 address (addr1.../stake1...) or raw address bytes
+            
+        Returns:
+            (payment key hash or None, (is script, stake hash) or None);
+            (None, None) for invalid addresses
+        """
+        if isinstance(address, (bytes, bytearray, memoryview)):
+            payload = bytes(address)
+        elif isinstance(address, str):
+            decoded = bech32.decode(address.strip())
+            payload = decoded[1] if decoded else b""
+        else:
+            return []
+        if not payload:
+            return None, None
+        
+        size = SignatureVerifier.CREDENTIAL_SIZE
+        address_type = payload[0] >> 4
+        payment = None
+        stake = None
+        if address_type in SignatureVerifier.PAYMENT_KEY_TYPES and len(payload) > size:
+            payment = payload[1:1 + size]
+        if address_type in SignatureVerifier.BASE_TYPES and len(payload) == 1 + 2 * size:
+            # Header bit 1: script stake credential
+            stake = (bool(address_type & 0x2), payload[1 + size:])
+        if address_type in SignatureVerifier.REWARD_TYPES and len(payload) == 1 + size:
+            stake = (address_type == 0xF, payload[1:])
+        return payment, stake
+    
+    @staticmethod
+    def key_controls(public_key: bytes, claims: Optional[Claims]) -> bool:
+        """
+        Check that a public key is the payment or stake key of the claimed address
+        
+        A claimed stake address must be the stake credential of the address,
+        so either key binds both: the payment key signs for the address, the
+        stake key for the stake credential it delegates with.
+        
+        Args:
+            public_key: 32-byte public key
+            claims: (address, stake address or None)
+            
+        Returns:
+            True if the key controls the claimed address
+        """
+        if not claims or not claims[0]:
+            return False
+        address, stake_address = claims
+        payment, stake = SignatureVerifier.credentials(address)
+        if stake_address:
+            if stake is None or SignatureVerifier.credentials(stake_address)[1] != stake:
+                return False
+        key_hash = hashlib.blake2b(public_key, digest_size=SignatureVerifier.CREDENTIAL_SIZE).digest()
+        return key_hash == payment or stake == (False, key_hash)
+    
+    @staticmethod
+    def decode_public_key(public_key: Union[str, bytes]) -> Optional[bytes]:
+        """
+        Decode a public key
+        
+        Args:
+            public_key: 32 raw bytes, hex, cborHex (5820...) or bech32 (addr_vk1...)
+            
+        Returns:
+            32-byte public key or None
+        """
+        if isinstance(public_key, bytes):
+            return public_key if len(public_key) == 32 else None
+        
+        public_key = public_key.strip()
+        if not all(c in "0123456789abcdefABCDEF" for c in public_key):
+            decoded = bech32.decode(public_key)
+            # Extended keys (xvk) carry the chain code after the key
+            return decoded[1][:32] if decoded and len(decoded[1]) in (32, 64) else None
+        
+        try:
+            raw = bytes.fromhex(public_key)
+        except ValueError:
+            return None
+        if len(raw) == 34 and raw[:2] == b"\x58\x20":
+            raw = raw[2:]
+        return raw if len(raw) == 32 else None
+    
+    @staticmethod
+    def decode_signature(signature: Union[str, bytes]) -> Optional[bytes]:
+        """
+        Decode a signature
+        
+        Args:
+            signature: 64 raw bytes, hex or base64
+            
+        Returns:
+            64-byte signature or None
+        """
+        if isinstance(signature, bytes):
+            return signature if len(signature) == 64 else None
+        
+        signature = signature.strip()
+        try:
+            raw = bytes.fromhex(signature)
+        except ValueError:
+            try:
+                raw = base64.b64decode(signature, validate=True)
+            except (ValueError, binascii.Error):
+                return None
+        return raw if len(raw) == 64 else None
+    
+    @staticmethod
+    def decode_item(public_key: Union[str, bytes, None], message: Union[str, bytes],
+                    signature: Union[str, bytes]) -> Optional[Tuple[bytes, bytes, bytes]]:
+        """
+        Decode one submission
+        
+        Args:
+            public_key: Public key (None if signature is "<signature> <public key>")
+            message: Signed message (str is UTF-8 encoded)
+            signature: Signature, or cardano-signer output "<signature> <public key>"
+            
+        Returns:
+            (public key, message, signature) bytes or None if malformed
+        """
+        if isinstance(signature, str) and " " in signature.strip():
+            signature, signer_key = signature.split(None, 1)
+            public_key = public_key or signer_key
+        if not public_key or not signature:
+            return None
+        
+        key_bytes = SignatureVerifier.decode_public_key(public_key)
+        sig_bytes = SignatureVerifier.decode_signature(signature)
+        if key_bytes is None or sig_bytes is None:
+            return None
+        if isinstance(message, str):
+            message = message.encode("utf-8")
+        return key_bytes, message, sig_bytes
+    
+    @staticmethod
+    def verify(public_key: Union[str, bytes, None], message: Union[str, bytes],
+               signature: Union[str, bytes], claims: Optional[Claims] = None) -> bool:
+        """
+        Verify one signature
+        
+        Args:
+            public_key: Public key (see decode_item)
+            message: Signed message
+            signature: Signature (see decode_item)
+            claims: (address, stake address) the key must control (None: key not bound)
+            
+        Returns:
+            True if valid
+        """
+        decoded = SignatureVerifier.decode_item(public_key, message, signature)
+        if decoded is None:
+            return False
+        if claims is not None and not SignatureVerifier.key_controls(decoded[0], claims):
+            return False
+        return ed25519.verify(*decoded)
+    
+    @staticmethod
+    def verify_many(items: Sequence[Item], workers: int = None,
+                    claims: Sequence[Optional[Claims]] = None) -> List[bool]:
+        """
+        Verify many signatures
+        
+        Args:
+            items: (public key, message, signature) tuples (see decode_item)
+            workers: Worker processes (default: CPU count)
+            claims: (address, stake address) each item's key must control,
+                in input order (None: keys not bound)
+            
+        Returns:
+            True/False per item, in input order
+        """
+        results = [False] * len(items)
+        indices = []
+        decoded = []
+        for i, item in enumerate(items):
+            parsed = SignatureVerifier.decode_item(*item)
+            if parsed is not None and claims is not None and \
+                    not SignatureVerifier.key_controls(parsed[0], claims[i]):
+                parsed = None
+            if parsed is not None:
+                indices.append(i)
+                decoded.append(parsed)
+        
+        size = SignatureVerifier.CHUNK_SIZE
+        chunks = [decoded[i:i + size] for i in range(0, len(decoded), size)]
+        
+        verified = None
+        if len(decoded) > SignatureVerifier.POOL_THRESHOLD:
+            from utils.derivation_pool import DerivationPool
+            try:
+                executor = DerivationPool.shared(workers).executor
+                verified = [ok for chunk in executor.map(verify_chunk, chunks) for ok in chunk]
+            except Exception as e:
+                print(f"⚠️  Process pool unavailable, verifying in-process: {e}")
+        if verified is None:
+            verified = [ok for chunk in chunks for ok in verify_chunk(chunk)]
+        
+        for i, ok in zip(indices, verified):
+            results[i] = ok
+        
+        print(f"✓ Verified {len(items)} signatures: {sum(results)} valid")
+        return results
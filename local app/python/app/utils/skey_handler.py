@@ -5,6 +5,8 @@ import os
 import json
 from typing import Optional, Dict
 
+from utils import bech32
+
 
 class SkeyHandler:
     """Handle .skey (signing key) files"""
@@ -110,3 +112,42 @@ class SkeyHandler:
         
         # Return as-is if not JSON
         return skey_content
+    
+    # Raw key sizes: seed, kL||kR, kL||kR||cc, kL||kR||pub||cc (cardano-cli bip32 .skey)
+    KEY_SIZES = (32, 64, 96, 128)
+    
+    @staticmethod
+    def decode_signing_key(signing_key: str) -> Optional[bytes]:
+        """
+        Decode a signing key string to raw key bytes
+        
+        Accepts cborHex from a .skey file ("5820..."/"5880..."), plain hex,
+        and bech32 keys (ed25519_sk, ed25519e_sk, addr_xsk, ...).
+        
+        Args:
+            signing_key: Signing key string (e.g. from extract_signing_key)
+            
+        Returns:
+            32, 64, 96 or 128 key bytes, or None if not a recognized key
+        """
+        if not signing_key:
+            return None
+        signing_key = signing_key.strip()
+        
+        decoded = bech32.decode(signing_key)
+        if decoded:
+            raw = decoded[1]
+        else:
+            try:
+                raw = bytes.fromhex(signing_key)
+            except ValueError:
+                print("✗ Signing key is neither hex nor bech32")
+                return None
+            # CBOR byte string header: 0x58 <length>
+            if len(raw) >= 2 and raw[0] == 0x58 and raw[1] == len(raw) - 2:
+                raw = raw[2:]
+        
+        if len(raw) not in SkeyHandler.KEY_SIZES:
+            print(f"✗ Unsupported signing key length: {len(raw)} bytes")
+            return None
+        return raw
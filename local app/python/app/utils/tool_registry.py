@@ -0,0 +1,244 @@
+"""
+Tool Registry: Locate external Cardano tools once per process
+cardano-address, cardano-signer
+
+Resolution order for each tool:
+    1. Path registered with ToolRegistry.register()
+    2. Environment variable (file or directory, e.g. CARDANO_SIGNER_PATH)
+    3. JSON config file named by CARDANO_TOOLS_CONFIG ({"cardano-signer": "/path"})
+    4. Common relative locations
+    5. PATH
+"""
+import json
+import os
+import shutil
+import subprocess
+import threading
+import time
+from typing import Dict, Optional
+
+
+class ToolRegistry:
+    """Process-wide cache of external tool locations
+    
+    Found tools are cached until refresh(); a failed lookup is only
+    remembered for MISS_TTL seconds, so a tool installed later is found.
+    """
+    
+    TOOLS = {
+        "cardano-address": {
+            "env_path": "CARDANO_ADDRESSES_PATH",
+            "env_version": "CARDANO_ADDRESSES_VERSION",
+            "search_paths": [
+                "./tools/cardano-addresses/cardano-address.exe",
+                "./tools/cardano-addresses/cardano-address",
+                "./cardano-address.exe",
+                "./cardano-address",
+                "cardano-address.exe",
+                "cardano-address",
+            ],
+        },
+        "cardano-signer": {
+            "env_path": "CARDANO_SIGNER_PATH",
+            "env_version": "CARDANO_SIGNER_VERSION",
+            "search_paths": [
+                "./tools/cardano-signer/cardano-signer.exe",
+                "./tools/cardano-signer/cardano-signer",
+                "./cardano-signer.exe",
+                "./cardano-signer",
+                "cardano-signer.exe",
+                "cardano-signer",
+            ],
+        },
+    }
+    
+    CONFIG_ENV = "CARDANO_TOOLS_CONFIG"
+    MISS_TTL = 30.0
+    
+    _paths: Dict[str, str] = {}
+    _misses: Dict[str, float] = {}
+    _versions: Dict[str, str] = {}
+    _overrides: Dict[str, str] = {}
+    _lock = threading.Lock()
+    
+    @staticmethod
+    def _load_config() -> Dict[str, str]:
+        """Read tool paths from the JSON config file, if configured"""
+        config_file = os.environ.get(ToolRegistry.CONFIG_ENV)
+        if not config_file or not os.path.exists(config_file):
+            return {}
+        try:
+            with open(config_file, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+            return config if isinstance(config, dict) else {}
+        except Exception as e:
+            print(f"✗ Error reading tool config: {e}")
+            return {}
+    
+    @staticmethod
+    def _executable_in(path: str, name: str) -> Optional[str]:
+        """Return the tool executable for a configured file or directory path"""
+        if os.path.isdir(path):
+            for candidate in (name + ".exe", name):
+                full_path = os.path.join(path, candidate)
+                if os.path.isfile(full_path):
+                    return os.path.abspath(full_path)
+            return None
+        if os.path.isfile(path):
+            return os.path.abspath(path)
+        return None
+    
+    @staticmethod
+    def _discover(name: str) -> Optional[str]:
+        """Search for a tool without consulting the cache"""
+        spec = ToolRegistry.TOOLS.get(name, {"search_paths": [name]})
+        
+        configured = [
+            ToolRegistry._overrides.get(name),
+            os.environ.get(spec.get("env_path", "")),
+            ToolRegistry._load_config().get(name),
+        ]
+        for path in configured:
+            if path:
+                exe = ToolRegistry._executable_in(path, name)
+                if exe:
+                    return exe
+                print(f"⚠️  Configured {name} not found at {path}")
+        
+        for path in spec["search_paths"]:
+            if os.path.exists(path):
+                return os.path.abspath(path)
+        
+        return shutil.which(name)
+    
+    @staticmethod
+    def resolve(name: str) -> Optional[str]:
+        """
+        Get tool path, discovering it on first use
+        
+        Args:
+            name: Tool name ("cardano-address" or "cardano-signer")
+            
+        Returns:
+            Path to executable or None
+        """
+        path = ToolRegistry._paths.get(name)
+        if path:
+            return path
+        
+        with ToolRegistry._lock:
+            if name in ToolRegistry._paths:
+                return ToolRegistry._paths[name]
+            missed_at = ToolRegistry._misses.get(name)
+            if missed_at is not None and time.monotonic() - missed_at < ToolRegistry.MISS_TTL:
+                return None
+            path = ToolRegistry._discover(name)
+            if path:
+                ToolRegistry._paths[name] = path
+                ToolRegistry._misses.pop(name, None)
+            else:
+                ToolRegistry._misses[name] = time.monotonic()
+            return path
+    
+    @staticmethod
+    def resolve_all() -> Dict[str, Optional[str]]:
+        """
+        Resolve every known tool (call once at startup)
+        
+        Returns:
+            Dict of tool name to path or None
+        """
+        return {name: ToolRegistry.resolve(name) for name in ToolRegistry.TOOLS}
+    
+    @staticmethod
+    def get_version(name: str) -> Optional[str]:
+        """
+        Get tool version (runs `<tool> --version` once per resolved path)
+        
+        Args:
+            name: Tool name
+            
+        Returns:
+            Version output or None
+        """
+        if name in ToolRegistry._versions:
+            return ToolRegistry._versions[name]
+        
+        exe = ToolRegistry.resolve(name)
+        version = None
+        if exe:
+            try:
+                result = subprocess.run(
+                    [exe, "--version"],
+                    capture_output=True,
+                    text=True,
+                    timeout=10
+                )
+                if result.returncode == 0:
+                    version = result.stdout.strip()
+            except Exception as e:
+                print(f"✗ Error checking {name} version: {e}")
+        
+        if version:
+            ToolRegistry._versions[name] = version
+        return version
+    
+    @staticmethod
+    def validate(name: str) -> bool:
+        """
+        Check the tool runs and matches the expected version, if one is configured
+        
+        A mismatching tool is dropped from the cache, so the next resolve()
+        searches again.
+        
+        Args:
+            name: Tool name
+            
+        Returns:
+            True if the tool is usable
+        """
+        version = ToolRegistry.get_version(name)
+        if not version:
+            print(f"✗ {name} not available")
+            return False
+        
+        expected = os.environ.get(ToolRegistry.TOOLS.get(name, {}).get("env_version", ""))
+        if expected and expected not in version:
+            print(f"✗ {name} version {version} does not match expected {expected}")
+            ToolRegistry.refresh(name)
+            return False
+        print(f"✓ {name}: {version}")
+        return True
+    
+    @staticmethod
+    def register(name: str, path: str):
+        """
+        Set a tool path explicitly (takes precedence over discovery)
+        
+        Args:
+            name: Tool name
+            path: Executable or directory containing it
+        """
+        with ToolRegistry._lock:
+            ToolRegistry._overrides[name] = path
+            ToolRegistry._paths.pop(name, None)
+            ToolRegistry._misses.pop(name, None)
+            ToolRegistry._versions.pop(name, None)
+    
+    @staticmethod
+    def refresh(name: str = None):
+        """
+        Forget cached locations so the next resolve() searches again
+        
+        Args:
+            name: Tool name (None refreshes all tools)
+        """
+        with ToolRegistry._lock:
+            if name is None:
+                ToolRegistry._paths.clear()
+                ToolRegistry._misses.clear()
+                ToolRegistry._versions.clear()
+            else:
+                ToolRegistry._paths.pop(name, None)
+                ToolRegistry._misses.pop(name, None)
+                ToolRegistry._versions.pop(name, None)
@@ -0,0 +1,130 @@
+"""
+Wallet Index: Reverse lookup from address to derivation path
+Address, payment key hash and stake key hash -> (account, chain, index)
+"""
+import hashlib
+from typing import Dict, List, Optional
+
+from utils import bech32
+
+
+class WalletIndex:
+    """Hash index over a wallet's derived addresses
+    
+    Every address is indexed under its bech32 string and the hex hash of
+    its payment credential; every stake address under its bech32 string
+    and stake key hash. Addresses already indexed are skipped on update,
+    so the index grows incrementally as more addresses are derived.
+    """
+    
+    STAKE_CHAIN = "stake"
+    
+    def __init__(self, entries: Dict[str, List] = None):
+        """
+        Initialize wallet index
+        
+        Args:
+            entries: Saved index (key -> [account, chain, index])
+        """
+        self.entries: Dict[str, List] = dict(entries or {})
+    
+    @staticmethod
+    def _credential_hash(address: str) -> Optional[str]:
+        """Hex hash of the first credential of a Shelley address (payment or stake)"""
+        decoded = bech32.decode(address)
+        if not decoded or len(decoded[1]) < 29:
+            return None
+        return decoded[1][1:29].hex()
+    
+    def _put(self, key: Optional[str], path: List):
+        if key and key not in self.entries:
+            self.entries[key] = path
+    
+    def add_address(self, address_info: Dict, account_index: int = 0) -> bool:
+        """
+        Index one payment address
+        
+        Args:
+            address_info: Address info dict (address, chain, index)
+            account_index: BIP44 account index
+            
+        Returns:
+            True if the address was new
+        """
+        address = address_info.get("address")
+        if not address or address in self.entries:
+            return False
+        path = [account_index, address_info.get("chain", "external"), address_info.get("index", 0)]
+        self._put(address, path)
+        self._put(WalletIndex._credential_hash(address), path)
+        return True
+    
+    def add_stake_address(self, stake_address: str, account_index: int = 0) -> bool:
+        """
+        Index the stake address of an account
+        
+        Args:
+            stake_address: Stake address (stake1...)
+            account_index: BIP44 account index
+            
+        Returns:
+            True if the stake address was new
+        """
+        if not stake_address or stake_address in self.entries:
+            return False
+        path = [account_index, WalletIndex.STAKE_CHAIN, 0]
+        self._put(stake_address, path)
+        self._put(WalletIndex._credential_hash(stake_address), path)
+        return True
+    
+    def update(self, addresses: List[Dict], stake_address: str = None,
+               account_index: int = 0) -> int:
+        """
+        Index newly derived addresses of one account
+        
+        Args:
+            addresses: Address info dicts
+            stake_address: Account stake address
+            account_index: BIP44 account index
+            
+        Returns:
+            Number of addresses added
+        """
+        added = sum(1 for info in addresses if self.add_address(info, account_index))
+        self.add_stake_address(stake_address, account_index)
+        return added
+    
+    def lookup(self, key: str) -> Optional[Dict]:
+        """
+        Find the derivation path of an address, stake address, public key or key hash
+        
+        Args:
+            key: Bech32 address, bech32 public key (addr_vk/stake_vk) or hex key hash
+            
+        Returns:
+            Dict with account, chain and index, or None
+        """
+        if key.startswith(("addr_vk1", "stake_vk1")):
+            decoded = bech32.decode(key)
+            if not decoded:
+                return None
+            key = hashlib.blake2b(decoded[1][:32], digest_size=28).hexdigest()
+        path = self.entries.get(key) or self.entries.get(key.lower())
+        if not path:
+            return None
+        return {"account": path[0], "chain": path[1], "index": path[2]}
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    def to_dict(self) -> Dict[str, List]:
+        """Index entries for JSON serialization"""
+        return self.entries
+    
+    @staticmethod
+    def from_dict(entries: Dict[str, List]) -> "WalletIndex":
+        """Rebuild index from saved entries"""
+        return WalletIndex(entries)
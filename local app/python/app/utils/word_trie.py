@@ -0,0 +1,163 @@
+"""
+Word Trie: Prefix tree over the BIP39 wordlist
+Autocomplete, unique-prefix expansion and typo suggestions for word entry
+"""
+import threading
+from typing import Dict, List, Optional
+
+from utils import wordlists
+
+
+class _Node:
+    __slots__ = ("children", "word", "count")
+    
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.word: Optional[str] = None
+        self.count = 0
+
+
+class WordTrie:
+    """Prefix tree of a wordlist
+    
+    Every node keeps the number of words below it, so a prefix that
+    identifies exactly one word (any 4 letters for BIP39 lists) expands
+    in O(prefix length).
+    """
+    
+    _shared: Dict[str, "WordTrie"] = {}
+    _lock = threading.Lock()
+    
+    def __init__(self, words):
+        """
+        Build trie
+        
+        Args:
+            words: Words to insert
+        """
+        self.root = _Node()
+        for word in words:
+            self._insert(word)
+    
+    @staticmethod
+    def shared(language: str = wordlists.DEFAULT_LANGUAGE) -> Optional["WordTrie"]:
+        """
+        Get the process-wide trie for a BIP39 language, building it on first use
+        
+        Args:
+            language: Wordlist language
+            
+        Returns:
+            WordTrie or None if the language is not bundled
+        """
+        trie = WordTrie._shared.get(language)
+        if trie is None:
+            with WordTrie._lock:
+                trie = WordTrie._shared.get(language)
+                if trie is None:
+                    wordlist = wordlists.get(language)
+                    if wordlist is None:
+                        return None
+                    trie = WordTrie(wordlist.words)
+                    WordTrie._shared[language] = trie
+        return trie
+    
+    def _insert(self, word: str):
+        node = self.root
+        node.count += 1
+        for ch in word:
+            node = node.children.setdefault(ch, _Node())
+            node.count += 1
+        node.word = word
+    
+    def _find(self, prefix: str) -> Optional[_Node]:
+        node = self.root
+        for ch in prefix:
+            node = node.children.get(ch)
+            if node is None:
+                return None
+        return node
+    
+    def __contains__(self, word: str) -> bool:
+        node = self._find(word.strip().lower())
+        return node is not None and node.word is not None
+    
+    def complete(self, prefix: str, limit: int = None) -> List[str]:
+        """
+        Words starting with prefix
+        
+        Args:
+            prefix: Typed prefix
+            limit: Maximum number of words (None for all)
+            
+        Returns:
+            Matching words in alphabetical order
+        """
+        node = self._find(prefix.strip().lower())
+        if node is None:
+            return []
+        
+        results = []
+        stack = [node]
+        while stack and (limit is None or len(results) < limit):
+            node = stack.pop()
+            if node.word is not None:
+                results.append(node.word)
+            stack.extend(node.children[ch] for ch in sorted(node.children, reverse=True))
+        return results
+    
+    def expand(self, prefix: str) -> Optional[str]:
+        """
+        Expand a prefix that identifies exactly one word
+        
+        Args:
+            prefix: Typed prefix (e.g. the first 4 letters)
+            
+        Returns:
+            The full word, or None if the prefix is ambiguous or unknown
+        """
+        node = self._find(prefix.strip().lower())
+        if node is None:
+            return None
+        if node.word is not None:
+            return node.word
+        while node.count == 1 and node.word is None:
+            node = next(iter(node.children.values()))
+        return node.word if node.count == 1 else None
+    
+    def suggest(self, word: str, limit: int = 5) -> List[str]:
+        """
+        Words within edit distance 1 (one substitution, insertion or deletion)
+        
+        Args:
+            word: Mistyped word
+            limit: Maximum number of suggestions
+            
+        Returns:
+            Suggested words in alphabetical order
+        """
+        word = word.strip().lower()
+        found = set()
+        
+        def walk(node: _Node, i: int, edits: int):
+            if i == len(word) and node.word is not None:
+                found.add(node.word)
+            if i < len(word):
+                child = node.children.get(word[i])
+                if child is not None:
+                    walk(child, i + 1, edits)
+            if edits == 0:
+                return
+            if i < len(word):
+                # Deletion: skip a typed character
+                walk(node, i + 1, 0)
+            for ch, child in node.children.items():
+                # Insertion: a character was left out
+                walk(child, i, 0)
+                # Substitution
+                if i < len(word) and ch != word[i]:
+                    walk(child, i + 1, 0)
+        
+        walk(self.root, 0, 1)
+        found.discard(word)
+        return sorted(found)[:limit]
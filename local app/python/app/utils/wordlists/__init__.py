@@ -0,0 +1,140 @@
+"""
+BIP39 Wordlists: Bundled as Python data modules
+One module per language (english.py, ...) defining a WORDS tuple
+"""
+import bisect
+import importlib
+import importlib.util
+import threading
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+
+
+DEFAULT_LANGUAGE = "english"
+
+# BIP39 wordlists are chosen so the first 4 letters identify a word
+PREFIX_LENGTH = 4
+
+
+class Wordlist:
+    """Immutable BIP39 wordlist with its lookup tables
+    
+    Built once per language: word -> index, unique 4-letter prefix -> index,
+    and the range of words under each first letter.
+    """
+    
+    def __init__(self, language: str, words: Tuple[str, ...]):
+        """
+        Initialize wordlist tables
+        
+        Args:
+            language: Language name (module name under utils/wordlists)
+            words: 2048 words in BIP39 order
+        """
+        self.language = language
+        self.words = words
+        self.index: Mapping[str, int] = MappingProxyType({w: i for i, w in enumerate(words)})
+        self.prefix_index: Mapping[str, int] = MappingProxyType(
+            {w[:PREFIX_LENGTH]: i for i, w in enumerate(words)}
+        )
+        self.sorted = list(words) == sorted(words)
+        
+        letter_ranges: Dict[str, Tuple[int, int]] = {}
+        if self.sorted:
+            for i, w in enumerate(words):
+                start, _ = letter_ranges.get(w[0], (i, i))
+                letter_ranges[w[0]] = (start, i + 1)
+        self.letter_ranges: Mapping[str, Tuple[int, int]] = MappingProxyType(letter_ranges)
+    
+    def __len__(self) -> int:
+        return len(self.words)
+    
+    def __contains__(self, word: str) -> bool:
+        return word in self.index
+    
+    def expand(self, prefix: str) -> Optional[str]:
+        """
+        Expand a unique 4-letter prefix (or full word) to its word
+        
+        Args:
+            prefix: Word or its first 4 letters
+            
+        Returns:
+            Full word or None
+        """
+        prefix = prefix.strip().lower()
+        if prefix in self.index:
+            return prefix
+        if len(prefix) < PREFIX_LENGTH:
+            return None
+        index = self.prefix_index.get(prefix[:PREFIX_LENGTH])
+        if index is None or not self.words[index].startswith(prefix):
+            return None
+        return self.words[index]
+    
+    def words_with_prefix(self, prefix: str) -> Tuple[str, ...]:
+        """
+        All words starting with prefix
+        
+        Args:
+            prefix: Word prefix
+            
+        Returns:
+            Matching words in wordlist order
+        """
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return self.words
+        if not self.sorted:
+            return tuple(w for w in self.words if w.startswith(prefix))
+        
+        start, end = self.letter_ranges.get(prefix[0], (0, 0))
+        lo = bisect.bisect_left(self.words, prefix, start, end)
+        hi = lo
+        while hi < end and self.words[hi].startswith(prefix):
+            hi += 1
+        return self.words[lo:hi]
+
+
+_loaded: Dict[str, Wordlist] = {}
+_lock = threading.Lock()
+
+
+def available_languages() -> Tuple[str, ...]:
+    """
+    Languages with a bundled wordlist module
+    
+    Returns:
+        Tuple of language names
+    """
+    candidates = ("english", "japanese", "korean", "spanish", "chinese_simplified",
+                  "chinese_traditional", "french", "italian", "czech", "portuguese")
+    return tuple(
+        lang for lang in candidates
+        if importlib.util.find_spec(f"{__name__}.{lang}") is not None
+    )
+
+
+def get(language: str = DEFAULT_LANGUAGE) -> Optional[Wordlist]:
+    """
+    Get the shared wordlist for a language (tables built on first use)
+    
+    Args:
+        language: Language name
+        
+    Returns:
+        Wordlist or None if no wordlist is bundled for the language
+    """
+    wordlist = _loaded.get(language)
+    if wordlist is not None:
+        return wordlist
+    
+    with _lock:
+        if language not in _loaded:
+            try:
+                module = importlib.import_module(f"{__name__}.{language}")
+            except ImportError:
+                print(f"✗ No BIP39 wordlist bundled for language: {language}")
+                return None
+            _loaded[language] = Wordlist(language, tuple(module.WORDS))
+        return _loaded[language]